@@ -1,4 +1,5 @@
 import logging
+import os
 from dataclasses import dataclass
 
 from environs import Env
@@ -10,13 +11,25 @@ logger = logging.getLogger(__name__)
 class WebConfig:
     server_host: str
     server_port: int
+    workers: int
+    reload: bool
+    graceful_shutdown_timeout: int
 
     @staticmethod
     def from_env(env: Env) -> "WebConfig":
         server_host = env.str("SERVER_HOST")
         server_port = env.int("SERVER_PORT")
-
-        return WebConfig(server_host=server_host, server_port=server_port)
+        workers = env.int("SERVER_WORKERS", os.cpu_count() or 1)
+        reload = env.bool("SERVER_RELOAD", False)
+        graceful_shutdown_timeout = env.int("SERVER_GRACEFUL_TIMEOUT", 30)
+
+        return WebConfig(
+            server_host=server_host,
+            server_port=server_port,
+            workers=workers,
+            reload=reload,
+            graceful_shutdown_timeout=graceful_shutdown_timeout,
+        )
 
 
 @dataclass
@@ -5,13 +5,23 @@ from app.core.commands.company.errors import (
     CompanyNotFoundError,
     CompanyUserNotFoundError,
 )
+from app.core.commands.quiz.service import (
+    LeaderboardService,
+    QuizAnalyticsService,
+)
 from app.core.common.commiter import Commiter
 from app.core.entities.company import CompanyId
+from app.core.interfaces.cache import CacheGateway
 from app.core.interfaces.company_gateways import (
     CompanyGateway,
     CompanyUserGateway,
 )
 from app.core.interfaces.id_provider import IdProvider
+from app.core.interfaces.quiz_gateways import (
+    ScoreRollupGateway,
+    UserQuizStatsGateway,
+)
+from app.utils.get_cache_key import get_member_key
 
 
 @dataclass(frozen=True)
@@ -24,6 +34,11 @@ class LeaveFromCompany:
     id_provider: IdProvider
     company_gateway: CompanyGateway
     company_user_gateway: CompanyUserGateway
+    score_rollup_gateway: ScoreRollupGateway
+    user_quiz_stats_gateway: UserQuizStatsGateway
+    leaderboard_service: LeaderboardService
+    analytics_service: QuizAnalyticsService
+    cache: CacheGateway
     commiter: Commiter
 
     async def __call__(self, data: LeaveFromCompanyInputData) -> None:
@@ -40,9 +55,18 @@ class LeaveFromCompany:
         if not company_user:
             raise CompanyUserNotFoundError()
 
+        await self.score_rollup_gateway.remove_company_user(
+            company_user.company_user_id
+        )
+        await self.user_quiz_stats_gateway.remove_company_user(
+            company_user.company_user_id
+        )
         await self.company_user_gateway.delete(company_user.company_user_id)
 
         await self.commiter.commit()
+        await self.leaderboard_service.remove_user(company_id, user.user_id)
+        await self.analytics_service.invalidate(company_id)
+        await self.cache.clear_member_keys(get_member_key(company_id))
 
         logging.info(
             "User with id %s leave from company %s", user.user_id, company_id
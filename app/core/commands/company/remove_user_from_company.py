@@ -5,14 +5,24 @@ from app.core.commands.company.errors import (
     CompanyNotFoundError,
     CompanyUserNotFoundError,
 )
+from app.core.commands.quiz.service import (
+    LeaderboardService,
+    QuizAnalyticsService,
+)
 from app.core.common.access_service import AccessService
 from app.core.common.commiter import Commiter
 from app.core.entities.company import CompanyId
 from app.core.entities.user import UserId
+from app.core.interfaces.cache import CacheGateway
 from app.core.interfaces.company_gateways import (
     CompanyGateway,
     CompanyUserGateway,
 )
+from app.core.interfaces.quiz_gateways import (
+    ScoreRollupGateway,
+    UserQuizStatsGateway,
+)
+from app.utils.get_cache_key import get_member_key
 
 
 @dataclass(frozen=True)
@@ -25,7 +35,12 @@ class RemoveUserFromCompanyInputData:
 class RemoveUserFromCompany:
     company_gateway: CompanyGateway
     company_user_gateway: CompanyUserGateway
+    score_rollup_gateway: ScoreRollupGateway
+    user_quiz_stats_gateway: UserQuizStatsGateway
+    leaderboard_service: LeaderboardService
+    analytics_service: QuizAnalyticsService
     access_service: AccessService
+    cache: CacheGateway
     commiter: Commiter
 
     async def __call__(self, data: RemoveUserFromCompanyInputData) -> None:
@@ -43,9 +58,18 @@ class RemoveUserFromCompany:
 
         await self.access_service.ensure_can_delete_from_company(company)
 
+        await self.score_rollup_gateway.remove_company_user(
+            company_user.company_user_id
+        )
+        await self.user_quiz_stats_gateway.remove_company_user(
+            company_user.company_user_id
+        )
         await self.company_user_gateway.delete(company_user.company_user_id)
 
         await self.commiter.commit()
+        await self.leaderboard_service.remove_user(company_id, user_id)
+        await self.analytics_service.invalidate(company_id)
+        await self.cache.clear_member_keys(get_member_key(company_id))
 
         logging.info(
             "Successfully remove user with id %s from company %s",
@@ -0,0 +1,41 @@
+import logging
+import time
+from dataclasses import dataclass
+
+from app.core.common.commiter import Commiter
+from app.core.entities.user import UserId
+from app.core.interfaces.quiz_gateways import UserQuizStatsGateway
+
+# Amount of users whose stats are rebuilt per transaction
+BATCH_SIZE = 1000
+
+
+@dataclass
+class BackfillUserQuizStats:
+    user_quiz_stats_gateway: UserQuizStatsGateway
+    commiter: Commiter
+
+    async def __call__(self) -> None:
+        last_user_id = await self.user_quiz_stats_gateway.last_user_id()
+        if last_user_id is None:
+            return
+
+        started_at = time.perf_counter()
+
+        rebuilt = 0
+        from_id = 0
+        while from_id < last_user_id:
+            to_id = from_id + BATCH_SIZE
+
+            rebuilt += await self.user_quiz_stats_gateway.rebuild(
+                UserId(from_id), UserId(to_id)
+            )
+            await self.commiter.commit()
+
+            from_id = to_id
+
+        logging.info(
+            "Rebuilt %s user quiz stats in %.2fs",
+            rebuilt,
+            time.perf_counter() - started_at,
+        )
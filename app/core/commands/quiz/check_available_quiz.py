@@ -1,37 +1,52 @@
+import logging
+import time
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 
 from app.core.common.commiter import Commiter
-from app.core.entities.notification import Notification
-from app.core.interfaces.company_gateways import CompanyGateway
+from app.core.entities.company import CompanyUserId
 from app.core.interfaces.notification_gateways import NotificationGateway
 from app.core.interfaces.quiz_gateways import (
     QuizParticipationGateway,
 )
 
+# Amount of company users whose participations are handled per transaction
+BATCH_SIZE = 5000
+
 
 @dataclass
 class CheckAvailableQuiz:
     participation_gateway: QuizParticipationGateway
     notification_gateway: NotificationGateway
-    company_gateway: CompanyGateway
     commiter: Commiter
 
     async def __call__(self) -> None:
-        participations = await self.participation_gateway.many()
-        now = datetime.now(tz=UTC)
-
-        notifications = [
-            Notification(
-                notification_id=None,
-                text=f"It's time to re-run the quiz {participation.quiz_id}",
-                send_to=participation.company_user_id,
-            )
-            for participation in participations
-            if (now - participation.created_at.replace(tzinfo=UTC))
-            >= timedelta(hours=24)
-        ]
+        last_company_user_id = (
+            await self.participation_gateway.last_company_user_id()
+        )
+        if last_company_user_id is None:
+            return
+
+        created_before = datetime.now(tz=UTC) - timedelta(hours=24)
+        started_at = time.perf_counter()
+
+        processed = 0
+        from_id = 0
+        while from_id < last_company_user_id:
+            to_id = from_id + BATCH_SIZE
 
-        if len(notifications) > 0:
-            await self.notification_gateway.add_many(notifications)
+            processed += await self.notification_gateway.add_quiz_reminders(
+                created_before, CompanyUserId(from_id), CompanyUserId(to_id)
+            )
             await self.commiter.commit()
+
+            from_id = to_id
+
+        elapsed = time.perf_counter() - started_at
+
+        logging.info(
+            "Sent %s quiz reminders in %.2fs (%.0f rows/s)",
+            processed,
+            elapsed,
+            processed / elapsed if elapsed else processed,
+        )
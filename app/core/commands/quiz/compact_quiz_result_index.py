@@ -0,0 +1,20 @@
+import logging
+from dataclasses import dataclass
+
+from app.core.interfaces.cache import CacheGateway
+from app.utils.get_cache_key import (
+    get_member_key_pattern,
+    get_quiz_results_loaded_key_pattern,
+)
+
+
+@dataclass
+class CompactQuizResultIndex:
+    cache: CacheGateway
+
+    async def __call__(self) -> None:
+        removed = await self.cache.compact_member_keys(
+            get_member_key_pattern(), get_quiz_results_loaded_key_pattern()
+        )
+
+        logging.info("Removed %s expired quiz result index keys", removed)
@@ -104,22 +104,23 @@ class CreateQuiz:
     async def _add_questions_to_quiz(
         self, quiz_id: QuizId, questions: list[QuestionData]
     ) -> None:
-        for question in questions:
-            new_question = Question(
-                question_id=None,
-                quiz_id=quiz_id,
-                title=question.title,
+        new_questions = [
+            Question(question_id=None, quiz_id=quiz_id, title=question.title)
+            for question in questions
+        ]
+
+        await self.question_gateway.add_many(new_questions)
+
+        answers = [
+            Answer(
+                answer_id=None,
+                question_id=new_question.question_id,
+                text=answer.text,
+                is_correct=answer.is_correct,
             )
-
-            await self.question_gateway.add(new_question)
-
-            answers = [
-                Answer(
-                    answer_id=None,
-                    question_id=new_question.question_id,
-                    text=answer.text,
-                    is_correct=answer.is_correct,
-                )
-                for answer in question.answers
-            ]
-            await self.answer_gateway.add_many(answers)
+            for new_question, question in zip(
+                new_questions, questions, strict=True
+            )
+            for answer in question.answers
+        ]
+        await self.answer_gateway.add_many(answers)
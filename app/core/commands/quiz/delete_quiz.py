@@ -2,11 +2,20 @@ from dataclasses import dataclass
 
 from app.core.commands.company.errors import CompanyNotFoundError
 from app.core.commands.quiz.errors import QuizNotFoundError
+from app.core.commands.quiz.service import (
+    LeaderboardService,
+    QuizAnalyticsService,
+)
 from app.core.common.access_service import AccessService
 from app.core.common.commiter import Commiter
 from app.core.entities.quiz import QuizId
+from app.core.interfaces.cache import CacheGateway
 from app.core.interfaces.company_gateways import CompanyGateway
-from app.core.interfaces.quiz_gateways import QuizGateway
+from app.core.interfaces.quiz_gateways import (
+    QuizGateway,
+    ScoreRollupGateway,
+)
+from app.utils.get_cache_key import get_member_key
 
 
 @dataclass(frozen=True)
@@ -17,8 +26,12 @@ class DeleteQuizInputData:
 @dataclass
 class DeleteQuiz:
     quiz_gateway: QuizGateway
+    score_rollup_gateway: ScoreRollupGateway
     company_gateway: CompanyGateway
     access_service: AccessService
+    leaderboard_service: LeaderboardService
+    analytics_service: QuizAnalyticsService
+    cache: CacheGateway
     commiter: Commiter
 
     async def __call__(self, data: DeleteQuizInputData) -> None:
@@ -34,6 +47,10 @@ class DeleteQuiz:
 
         await self.access_service.ensure_can_delete_quiz(company)
 
+        await self.score_rollup_gateway.remove_quiz(quiz_id)
         await self.quiz_gateway.delete(quiz_id)
 
         await self.commiter.commit()
+        await self.leaderboard_service.reset(quiz.company_id)
+        await self.analytics_service.invalidate(quiz.company_id)
+        await self.cache.clear_member_keys(get_member_key(quiz.company_id))
@@ -43,3 +43,13 @@ class QuizParticipationNotFoundError(ApplicationError):
     @property
     def message(self) -> str:
         return f"Quiz participation with id {self.participation_id} not found"
+
+
+@dataclass(eq=False)
+class InvalidQuizFileError(ApplicationError):
+    @property
+    def message(self) -> str:
+        return (
+            "Quiz file must be an Excel workbook, a Parquet file or "
+            "a UTF-8 encoded CSV file with the expected columns"
+        )
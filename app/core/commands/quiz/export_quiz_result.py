@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from enum import Enum
 
 from app.core.commands.company.errors import (
@@ -14,13 +14,14 @@ from app.core.common.export_data import (
     JSONExportStrategy,
 )
 from app.core.entities.quiz import QuizParticipationId
-from app.core.interfaces.cache import CacheGateway
 from app.core.interfaces.company_gateways import (
     CompanyGateway,
     CompanyUserGateway,
 )
-from app.core.interfaces.quiz_gateways import QuizParticipationGateway
-from app.utils.get_cache_key import get_quiz_result_cache_key
+from app.core.interfaces.quiz_gateways import (
+    QuizParticipationGateway,
+    QuizResultReader,
+)
 
 
 class ExportFormat(str, Enum):
@@ -46,7 +47,7 @@ class ExportQuizResult:
     quiz_participation_gateway: QuizParticipationGateway
     company_user_gateway: CompanyUserGateway
     company_gateway: CompanyGateway
-    cache: CacheGateway
+    quiz_result_reader: QuizResultReader
 
     async def __call__(
         self, data: ExportQuizResultInputData
@@ -71,13 +72,14 @@ class ExportQuizResult:
 
         await self.access_service.ensure_can_get_quiz_result(company)
 
-        cache_key = get_quiz_result_cache_key(participation_id)
-
-        cache_data = await self.cache.get_cache(cache_key)
+        quiz_result = await self.quiz_result_reader.by_participation(
+            participation_id
+        )
+        export_data = [asdict(quiz_result)] if quiz_result else []
 
         export_context = ExportContext(self._set_strategy(data.format))
 
-        file_path = export_context.export(participation_id, [cache_data])
+        file_path = export_context.export(participation_id, export_data)
         media_type = self._set_media_type(data.format)
 
         return ExportQuizResultOutputData(file_path, media_type)
@@ -5,6 +5,11 @@ from app.core.commands.quiz.errors import (
     QuizNotFoundError,
     QuizParticipationNotFoundError,
 )
+from app.core.commands.quiz.service import (
+    LeaderboardService,
+    QuizAnalyticsService,
+)
+from app.core.commands.user.errors import AccessDeniedError
 from app.core.common.commiter import Commiter
 from app.core.entities.company import CompanyId, CompanyUserId
 from app.core.entities.quiz import (
@@ -19,9 +24,16 @@ from app.core.interfaces.id_provider import IdProvider
 from app.core.interfaces.quiz_gateways import (
     QuizGateway,
     QuizParticipationGateway,
+    QuizResultDetail,
     QuizResultGateway,
+    ScoreRollupGateway,
+    UserQuizStatsGateway,
+)
+from app.utils.get_cache_key import (
+    QUIZ_RESULT_TTL,
+    get_member_key,
+    get_quiz_result_cache_key,
 )
-from app.utils.get_cache_key import get_member_key, get_quiz_result_cache_key
 
 
 @dataclass(frozen=True)
@@ -37,6 +49,10 @@ class SaveQuizResult:
     quiz_gateway: QuizGateway
     company_user_gateway: CompanyUserGateway
     quiz_result_gateway: QuizResultGateway
+    score_rollup_gateway: ScoreRollupGateway
+    user_quiz_stats_gateway: UserQuizStatsGateway
+    leaderboard_service: LeaderboardService
+    analytics_service: QuizAnalyticsService
     cache: CacheGateway
     commiter: Commiter
 
@@ -61,6 +77,9 @@ class SaveQuizResult:
         if not company_user:
             raise CompanyUserNotFoundError()
 
+        if quiz_participation.company_user_id != company_user.company_user_id:
+            raise AccessDeniedError()
+
         new_quiz_result = QuizResult(
             quiz_result_id=None,
             quiz_participation_id=participation_id,
@@ -68,6 +87,17 @@ class SaveQuizResult:
         )
 
         await self.quiz_result_gateway.add(new_quiz_result)
+        await self.score_rollup_gateway.add_score(
+            quiz.company_id,
+            quiz_participation.created_at,
+            new_quiz_result.correct_answers,
+        )
+        await self.user_quiz_stats_gateway.add_result(
+            company_user.user_id,
+            quiz.quiz_id,
+            quiz_participation.created_at,
+            new_quiz_result.correct_answers,
+        )
 
         await self.commiter.commit()
 
@@ -78,6 +108,12 @@ class SaveQuizResult:
             company_user.company_id,
             new_quiz_result,
         )
+        await self.leaderboard_service.add_points(
+            quiz.company_id,
+            company_user.user_id,
+            new_quiz_result.correct_answers,
+        )
+        await self.analytics_service.invalidate(quiz.company_id)
 
         return new_quiz_result.quiz_result_id
 
@@ -89,18 +125,19 @@ class SaveQuizResult:
         company_id: CompanyId,
         quiz_result: QuizResult,
     ) -> None:
-        cache_data = {
-            "participation_id": participation_id,
-            "company_user_id": company_user_id,
-            "company_id": company_id,
-            "quiz_id": quiz_id,
-        }
-
-        cache_data.update(asdict(quiz_result))
+        cache_data = QuizResultDetail(
+            quiz_result_id=quiz_result.quiz_result_id,
+            participation_id=participation_id,
+            company_user_id=company_user_id,
+            company_id=company_id,
+            quiz_id=quiz_id,
+            correct_answers=quiz_result.correct_answers,
+        )
+
         cache_key = get_quiz_result_cache_key(participation_id)
         member_key = get_member_key(company_id)
 
-        ttl = 172800  # TTL in second(48 hours)
-
-        await self.cache.set_cache(cache_key, cache_data, ttl)
+        await self.cache.set_cache(
+            cache_key, asdict(cache_data), QUIZ_RESULT_TTL
+        )
         await self.cache.set_member_key(member_key, cache_key)
@@ -0,0 +1,112 @@
+from app.core.entities.company import CompanyId
+from app.core.entities.user import UserId
+from app.core.interfaces.cache import CacheGateway
+from app.core.interfaces.quiz_gateways import (
+    LeaderboardEntry,
+    UserQuizStatsGateway,
+)
+from app.utils.get_cache_key import (
+    LEADERBOARD_TTL,
+    get_analytics_member_key,
+    get_leaderboard_key,
+    get_total_average_cache_key,
+)
+
+# Lowest-ranked member kept in every built leaderboard. Redis drops empty
+# sorted sets, so without it a company with no results would be rebuilt on
+# every read. It shares the set's TTL and never appears in the ranking.
+LEADERBOARD_SENTINEL = "built"
+
+
+class LeaderboardService:
+    def __init__(
+        self,
+        cache: CacheGateway,
+        user_quiz_stats_gateway: UserQuizStatsGateway,
+    ) -> None:
+        self.cache = cache
+        self.user_quiz_stats_gateway = user_quiz_stats_gateway
+
+    async def add_points(
+        self, company_id: CompanyId, user_id: UserId, points: int
+    ) -> None:
+        await self.cache.increment_score(
+            get_leaderboard_key(company_id), str(user_id), points
+        )
+
+    async def remove_user(
+        self, company_id: CompanyId, user_id: UserId
+    ) -> None:
+        await self.cache.remove_scores(
+            get_leaderboard_key(company_id), str(user_id)
+        )
+
+    async def reset(self, company_id: CompanyId) -> None:
+        await self.cache.delete_cache(get_leaderboard_key(company_id))
+
+    async def rebuild(self, company_id: CompanyId) -> None:
+        points = await self.user_quiz_stats_gateway.company_points(company_id)
+
+        await self.cache.set_scores(
+            get_leaderboard_key(company_id),
+            {
+                LEADERBOARD_SENTINEL: float("-inf"),
+                **{str(user_id): score for user_id, score in points.items()},
+            },
+            LEADERBOARD_TTL,
+        )
+
+    async def _ensure_built(self, company_id: CompanyId) -> str:
+        leaderboard_key = get_leaderboard_key(company_id)
+
+        if not await self.cache.is_exist(leaderboard_key):
+            await self.rebuild(company_id)
+
+        return leaderboard_key
+
+    async def top(
+        self, company_id: CompanyId, limit: int
+    ) -> list[LeaderboardEntry]:
+        leaderboard_key = await self._ensure_built(company_id)
+
+        scores = await self.cache.get_top_scores(leaderboard_key, limit + 1)
+        scores = [
+            (member, score)
+            for member, score in scores
+            if member != LEADERBOARD_SENTINEL
+        ]
+
+        return [
+            LeaderboardEntry(
+                user_id=int(member), rank=rank + 1, points=int(score)
+            )
+            for rank, (member, score) in enumerate(scores[:limit])
+        ]
+
+    async def rank(
+        self, company_id: CompanyId, user_id: UserId
+    ) -> LeaderboardEntry | None:
+        leaderboard_key = await self._ensure_built(company_id)
+
+        score_rank = await self.cache.get_score_rank(
+            leaderboard_key, str(user_id)
+        )
+        if score_rank is None:
+            return None
+
+        rank, score = score_rank
+
+        return LeaderboardEntry(
+            user_id=user_id, rank=rank + 1, points=int(score)
+        )
+
+
+class QuizAnalyticsService:
+    def __init__(self, cache: CacheGateway) -> None:
+        self.cache = cache
+
+    async def invalidate(self, company_id: CompanyId) -> None:
+        await self.cache.clear_member_keys(
+            get_analytics_member_key(company_id)
+        )
+        await self.cache.delete_cache(get_total_average_cache_key())
@@ -1,7 +1,9 @@
 from dataclasses import dataclass
+from datetime import UTC, datetime
 
 from app.core.commands.company.errors import CompanyUserNotFoundError
 from app.core.commands.quiz.errors import QuizNotFoundError
+from app.core.commands.quiz.service import QuizAnalyticsService
 from app.core.common.commiter import Commiter
 from app.core.entities.quiz import (
     QuizId,
@@ -13,6 +15,7 @@ from app.core.interfaces.id_provider import IdProvider
 from app.core.interfaces.quiz_gateways import (
     QuizGateway,
     QuizParticipationGateway,
+    UserQuizStatsGateway,
 )
 
 
@@ -27,6 +30,8 @@ class TakeQuiz:
     company_user_gateway: CompanyUserGateway
     quiz_gateway: QuizGateway
     participation_gateway: QuizParticipationGateway
+    user_quiz_stats_gateway: UserQuizStatsGateway
+    analytics_service: QuizAnalyticsService
     commiter: Commiter
 
     async def __call__(self, data: TakeQuizInputData) -> QuizParticipationId:
@@ -48,10 +53,15 @@ class TakeQuiz:
             quiz_participation_id=None,
             quiz_id=quiz_id,
             company_user_id=company_user.company_user_id,
+            created_at=datetime.now(UTC),
         )
 
         await self.participation_gateway.add(new_quiz_participation)
+        await self.user_quiz_stats_gateway.add_participation(
+            user.user_id, quiz_id, new_quiz_participation.created_at
+        )
 
         await self.commiter.commit()
+        await self.analytics_service.invalidate(quiz.company_id)
 
         return new_quiz_participation.quiz_participation_id
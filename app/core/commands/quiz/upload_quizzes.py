@@ -1,6 +1,9 @@
 from dataclasses import dataclass
+from math import isnan
 
 from app.core.commands.company.errors import CompanyNotFoundError
+from app.core.commands.quiz.errors import InvalidQuizFileError
+from app.core.commands.user.errors import AccessDeniedError
 from app.core.common.access_service import AccessService
 from app.core.common.commiter import Commiter
 from app.core.entities.company import CompanyId
@@ -39,26 +42,60 @@ class UploadQuizzes:
 
         await self.access_service.ensure_can_create_quiz(company)
 
-        extract_quiz_data = self.uploader.upload_quiz(data.quiz_data)
+        extract_quiz_data = await self.uploader.upload_quiz(data.quiz_data)
 
         if len(extract_quiz_data) == 0:
             return
 
-        for quiz_data in extract_quiz_data:
-            quiz = await self.quiz_gateway.by_id(quiz_data["quiz_id"])
+        quiz_ids = [
+            self._parse_quiz_id(quiz_data["quiz_id"])
+            for quiz_data in extract_quiz_data
+        ]
+        existing_quizzes = {
+            quiz.quiz_id: quiz
+            for quiz in await self.quiz_gateway.by_ids(
+                [quiz_id for quiz_id in quiz_ids if quiz_id is not None]
+            )
+        }
+
+        if any(
+            quiz.company_id != company_id for quiz in existing_quizzes.values()
+        ):
+            raise AccessDeniedError()
+
+        updated_quizzes = []
+        for quiz_id, quiz_data in zip(
+            quiz_ids, extract_quiz_data, strict=True
+        ):
+            quiz = existing_quizzes.get(quiz_id)
 
             if quiz:
-                await self._update_quiz(quiz, quiz_data)
+                quiz.title = quiz_data["title"]
+                quiz.description = quiz_data["description"]
+                updated_quizzes.append(quiz)
+
+                await self._add_question_to_quiz(
+                    quiz.quiz_id, quiz_data["questions"]
+                )
             else:
                 await self._add_quiz(quiz_data, company_id)
 
+        await self.quiz_gateway.update_many(updated_quizzes)
         await self.commiter.commit()
 
-    async def _update_quiz(self, quiz: Quiz, data: dict):
-        quiz.title = data["title"]
-        quiz.description = data["description"]
+    def _parse_quiz_id(self, value: object) -> QuizId | None:
+        # Quizzes uploaded without an id are created as new quizzes
+        if (
+            value is None
+            or (isinstance(value, float) and isnan(value))
+            or (isinstance(value, str) and not value.strip())
+        ):
+            return None
 
-        await self._add_question_to_quiz(quiz.quiz_id, data["questions"])
+        try:
+            return QuizId(int(value))
+        except (TypeError, ValueError) as err:
+            raise InvalidQuizFileError() from err
 
     async def _add_quiz(self, data: dict, company_id: CompanyId):
         quiz = Quiz(
@@ -74,22 +111,25 @@ class UploadQuizzes:
     async def _add_question_to_quiz(
         self, quiz_id: QuizId, questions: list[dict]
     ):
-        for question in questions:
-            new_question = Question(
-                question_id=None,
-                quiz_id=quiz_id,
-                title=question["title"],
+        new_questions = [
+            Question(
+                question_id=None, quiz_id=quiz_id, title=question["title"]
             )
+            for question in questions
+        ]
 
-            await self.question_gateway.add(new_question)
+        await self.question_gateway.add_many(new_questions)
 
-            answers = [
-                Answer(
-                    answer_id=None,
-                    question_id=new_question.question_id,
-                    text=answer["text"],
-                    is_correct=answer["is_correct"],
-                )
-                for answer in question["answers"]
-            ]
-            await self.answer_gateway.add_many(answers)
+        answers = [
+            Answer(
+                answer_id=None,
+                question_id=new_question.question_id,
+                text=answer["text"],
+                is_correct=answer["is_correct"],
+            )
+            for new_question, question in zip(
+                new_questions, questions, strict=True
+            )
+            for answer in question["answers"]
+        ]
+        await self.answer_gateway.add_many(answers)
@@ -1,11 +1,19 @@
 import logging
 from dataclasses import dataclass
 
+from app.core.commands.quiz.service import QuizAnalyticsService
 from app.core.commands.user.errors import UserNotFoundError
 from app.core.common.access_service import AccessService
 from app.core.common.commiter import Commiter
 from app.core.entities.user import UserId
+from app.core.interfaces.cache import CacheGateway
+from app.core.interfaces.company_gateways import CompanyUserGateway
+from app.core.interfaces.quiz_gateways import ScoreRollupGateway
 from app.core.interfaces.user_gateways import UserGateway
+from app.utils.get_cache_key import (
+    get_member_key,
+    get_user_identity_cache_key,
+)
 
 
 @dataclass(frozen=True)
@@ -16,8 +24,12 @@ class DeleteUserInputData:
 @dataclass
 class DeleteUser:
     user_gateway: UserGateway
+    company_user_gateway: CompanyUserGateway
+    score_rollup_gateway: ScoreRollupGateway
+    analytics_service: QuizAnalyticsService
     commiter: Commiter
     access_service: AccessService
+    cache: CacheGateway
 
     async def __call__(self, data: DeleteUserInputData) -> None:
         user_id = UserId(data.user_id)
@@ -28,8 +40,18 @@ class DeleteUser:
 
         await self.access_service.ensure_can_delete_user(user)
 
+        company_users = await self.company_user_gateway.by_user(user_id)
+
+        await self.score_rollup_gateway.remove_user(user_id)
         await self.user_gateway.delete(user_id)
 
         await self.commiter.commit()
+        await self.cache.delete_cache(get_user_identity_cache_key(user.email))
+
+        for company_user in company_users:
+            await self.analytics_service.invalidate(company_user.company_id)
+            await self.cache.clear_member_keys(
+                get_member_key(company_user.company_id)
+            )
 
         logging.info("User with id=%s was delete", user_id)
@@ -5,7 +5,9 @@ from app.core.commands.user.errors import UserNotFoundError
 from app.core.common.access_service import AccessService
 from app.core.common.commiter import Commiter
 from app.core.entities.user import UserId
+from app.core.interfaces.cache import CacheGateway
 from app.core.interfaces.user_gateways import UserGateway
+from app.utils.get_cache_key import get_user_identity_cache_key
 
 
 @dataclass(frozen=True)
@@ -25,6 +27,7 @@ class EditFullName:
     user_gateway: UserGateway
     access_service: AccessService
     commiter: Commiter
+    cache: CacheGateway
 
     async def __call__(
         self, data: EditFullNameInputData
@@ -38,6 +41,7 @@ class EditFullName:
         user.full_name = user.full_name.edit(data.first_name, data.last_name)
 
         await self.commiter.commit()
+        await self.cache.delete_cache(get_user_identity_cache_key(user.email))
 
         logging.info("User with id=%s update full name", data.user_id)
 
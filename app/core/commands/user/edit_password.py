@@ -6,8 +6,10 @@ from app.core.common.access_service import AccessService
 from app.core.common.commiter import Commiter
 from app.core.entities.user import UserId
 from app.core.entities.value_objects import UserRawPassword
+from app.core.interfaces.cache import CacheGateway
 from app.core.interfaces.password_hasher import PasswordHasher
 from app.core.interfaces.user_gateways import UserGateway
+from app.utils.get_cache_key import get_user_identity_cache_key
 
 
 @dataclass(frozen=True)
@@ -23,24 +25,26 @@ class EditPassword:
     password_hasher: PasswordHasher
     access_service: AccessService
     commiter: Commiter
+    cache: CacheGateway
 
     async def __call__(self, data: EditPasswordInputData) -> None:
         user = await self.user_gateway.by_id(UserId(data.user_id))
         if not user:
             raise UserNotFoundError(data.user_id)
 
-        self.password_hasher.verify_password(
+        await self.password_hasher.verify_password(
             UserRawPassword(data.old_password), user.hashed_password
         )
 
         await self.access_service.ensure_can_edit_password(user)
 
-        hashed_password = self.password_hasher.hash_password(
+        hashed_password = await self.password_hasher.hash_password(
             UserRawPassword(data.new_password)
         )
 
         user.hashed_password = hashed_password
 
         await self.commiter.commit()
+        await self.cache.delete_cache(get_user_identity_cache_key(user.email))
 
         logging.info("User with id=%s edit him password", data.user_id)
@@ -38,7 +38,9 @@ class SignIn:
         if not user:
             raise UserNotFoundByEmailError(data.email)
 
-        self.password_hasher.verify_password(user_pwd, user.hashed_password)
+        await self.password_hasher.verify_password(
+            user_pwd, user.hashed_password
+        )
 
         now = datetime.now(tz=UTC)
         expires_in = ExpiresIn(now + timedelta(minutes=30))
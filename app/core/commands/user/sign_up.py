@@ -42,7 +42,9 @@ class SignUp:
         if await self.user_gateway.is_exist(data.email):
             raise UserEmailAlreadyExistError(data.email)
 
-        hashed_password = self.password_hasher.hash_password(raw_password)
+        hashed_password = await self.password_hasher.hash_password(
+            raw_password
+        )
 
         user = User(
             user_id=None,
@@ -15,27 +15,43 @@ class AccessService:
         self.id_provider = id_provider
         self.company_user_gateway = company_user_gateway
 
-    async def _is_identity(self, user_id: UserId):
+        self._roles: dict[CompanyId, CompanyRole | None] = {}
+
+    async def resolve_role(self, company: Company) -> CompanyRole | None:
+        if company.company_id in self._roles:
+            return self._roles[company.company_id]
+
         actor = await self.id_provider.get_user()
 
-        if user_id != actor.user_id:
-            raise AccessDeniedError()
+        if company.owner_id == actor.user_id:
+            role = CompanyRole.OWNER
+        else:
+            company_user = await self.company_user_gateway.by_company(
+                company.company_id, actor.user_id
+            )
+            role = company_user.role if company_user else None
+            # Ownership is defined by the company record only
+            if role == CompanyRole.OWNER:
+                role = CompanyRole.MEMBER
 
-    async def _is_owner(self, company: Company):
+        self._roles[company.company_id] = role
+
+        return role
+
+    async def _is_identity(self, user_id: UserId):
         actor = await self.id_provider.get_user()
 
-        if company.owner_id != actor.user_id:
+        if user_id != actor.user_id:
             raise AccessDeniedError()
 
-    async def _is_admin(self, company: Company):
+    async def _is_company_owner(self, company: Company) -> bool:
+        # Ownership comes from the company record, no membership lookup
         actor = await self.id_provider.get_user()
-        company_user = await self.company_user_gateway.by_company(
-            company.company_id, actor.user_id
-        )
-        if not company_user:
-            raise CompanyUserNotFoundError()
 
-        if company_user.role != CompanyRole.ADMIN:
+        return company.owner_id == actor.user_id
+
+    async def _is_owner(self, company: Company):
+        if not await self._is_company_owner(company):
             raise AccessDeniedError()
 
     async def _is_not_company_member(
@@ -44,11 +60,17 @@ class AccessService:
         if await self.company_user_gateway.is_exist(company_id, user_id):
             raise CompanyUserAlreadyExistError(company_id, user_id)
 
+    async def _is_owner_or_member(self, company: Company):
+        if await self.resolve_role(company) is None:
+            raise AccessDeniedError()
+
     async def _is_owner_or_admin(self, company: Company):
-        try:
-            await self._is_owner(company)
-        except AccessDeniedError:
-            await self._is_admin(company)
+        role = await self.resolve_role(company)
+
+        if role is None:
+            raise CompanyUserNotFoundError()
+        if role not in {CompanyRole.OWNER, CompanyRole.ADMIN}:
+            raise AccessDeniedError()
 
     async def ensure_can_edit_full_name(self, record_to_edit: User):
         await self._is_identity(record_to_edit.user_id)
@@ -69,9 +91,7 @@ class AccessService:
     async def ensure_can_reject_invitation(
         self, company: Company, invitation: Invitation
     ):
-        try:
-            await self._is_owner(company)
-        except AccessDeniedError:
+        if not await self._is_company_owner(company):
             await self._is_identity(invitation.user_id)
 
     async def ensure_can_accept_invitation(self, invitation: Invitation):
@@ -86,9 +106,7 @@ class AccessService:
     async def ensure_can_reject_user_request(
         self, company: Company, user_id: UserId
     ):
-        try:
-            await self._is_owner(company)
-        except AccessDeniedError:
+        if not await self._is_company_owner(company):
             await self._is_identity(user_id)
 
     async def ensure_can_accept_user_request(
@@ -119,3 +137,11 @@ class AccessService:
 
     async def ensure_can_get_company_average_scores(self, company: Company):
         await self._is_owner_or_admin(company)
+
+    async def ensure_can_get_company_users_last_attempt(
+        self, company: Company
+    ):
+        await self._is_owner_or_admin(company)
+
+    async def ensure_can_get_company_leaderboard(self, company: Company):
+        await self._is_owner_or_member(company)
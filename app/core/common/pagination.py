@@ -1,5 +1,10 @@
 from dataclasses import dataclass
 from enum import Enum
+from typing import Generic, TypeVar
+
+from app.core.common.base_error import ApplicationError
+
+TItem = TypeVar("TItem")
 
 
 class SortOrder(Enum):
@@ -12,3 +17,20 @@ class Pagination:
     offset: int | None = None
     limit: int | None = None
     order: SortOrder = SortOrder.ASC
+    cursor: str | None = None
+
+
+@dataclass(frozen=True)
+class Page(Generic[TItem]):
+    items: list[TItem]
+    total: int
+    next_cursor: str | None = None
+
+
+@dataclass(eq=False)
+class InvalidCursorError(ApplicationError):
+    cursor: str
+
+    @property
+    def message(self):
+        return f"The pagination cursor is invalid - {self.cursor[:64]}"
@@ -12,9 +12,69 @@ class CacheGateway(Protocol):
         raise NotImplementedError
 
     @abstractmethod
-    async def set_member_key(self, member_key: str, cached_key: str) -> None:
+    async def delete_cache(self, key: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_many(self, keys: list[str]) -> list[dict | None]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set_many(self, values: dict[str, dict], ttl: int) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set_member_key(self, member_key: str, *cached_keys: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove_member_keys(
+        self, member_key: str, cached_keys: list[str]
+    ) -> None:
         raise NotImplementedError
 
     @abstractmethod
     async def get_member_data(self, member_key: str) -> set | None:
         raise NotImplementedError
+
+    @abstractmethod
+    async def clear_member_keys(self, member_key: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def compact_member_keys(
+        self, member_key_pattern: str, marker_key_pattern: str
+    ) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def is_exist(self, key: str) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set_scores(
+        self, key: str, scores: dict[str, float], ttl: int
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def increment_score(
+        self, key: str, member: str, amount: float
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove_scores(self, key: str, *members: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_top_scores(
+        self, key: str, limit: int
+    ) -> list[tuple[str, float]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_score_rank(
+        self, key: str, member: str
+    ) -> tuple[int, float] | None:
+        raise NotImplementedError
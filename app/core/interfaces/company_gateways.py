@@ -2,7 +2,7 @@ from abc import abstractmethod
 from asyncio import Protocol
 from dataclasses import dataclass
 
-from app.core.common.pagination import Pagination
+from app.core.common.pagination import Page, Pagination
 from app.core.entities.company import (
     Company,
     CompanyId,
@@ -64,6 +64,10 @@ class CompanyUserGateway(Protocol):
     async def by_identity(self, user_id: UserId) -> CompanyUser | None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def by_user(self, user_id: UserId) -> list[CompanyUser]:
+        raise NotImplementedError
+
     @abstractmethod
     async def many(self, filters: CompanyUserFilters) -> list[CompanyUser]:
         raise NotImplementedError
@@ -92,13 +96,9 @@ class CompanyReader(Protocol):
         raise NotImplementedError
 
     @abstractmethod
-    async def many(
+    async def page(
         self, filters: CompanyFilters, pagination: Pagination
-    ) -> list[CompanyDetail]:
-        raise NotImplementedError
-
-    @abstractmethod
-    async def total(self, filters: CompanyFilters) -> int:
+    ) -> Page[CompanyDetail]:
         raise NotImplementedError
 
 
@@ -116,11 +116,7 @@ class CompanyUserReader(Protocol):
         raise NotImplementedError
 
     @abstractmethod
-    async def many(
+    async def page(
         self, filters: CompanyUserFilters, pagination: Pagination
-    ) -> list[CompanyUserDetail]:
-        raise NotImplementedError
-
-    @abstractmethod
-    async def total(self, filters: CompanyUserFilters) -> int:
+    ) -> Page[CompanyUserDetail]:
         raise NotImplementedError
@@ -2,7 +2,7 @@ from abc import abstractmethod
 from asyncio import Protocol
 from dataclasses import dataclass
 
-from app.core.common.pagination import Pagination
+from app.core.common.pagination import Page, Pagination
 from app.core.entities.company import CompanyId
 from app.core.entities.invitation import (
     Invitation,
@@ -52,13 +52,9 @@ class InvitationDetail(Details):
 
 class InvitationReader(Protocol):
     @abstractmethod
-    async def many(
+    async def page(
         self, filters: InvitationFilters, pagination: Pagination
-    ) -> list[InvitationDetail]:
-        raise NotImplementedError
-
-    @abstractmethod
-    async def total(self, filters: InvitationFilters) -> int:
+    ) -> Page[InvitationDetail]:
         raise NotImplementedError
 
 
@@ -89,10 +85,7 @@ class UserRequestDetail(Details):
 
 
 class UserRequestReader(Protocol):
-    async def many(
+    async def page(
         self, filters: UserRequestFilters, pagination: Pagination
-    ) -> list[UserRequestDetail]:
-        raise NotImplementedError
-
-    async def total(self, filters: UserRequestFilters) -> int:
+    ) -> Page[UserRequestDetail]:
         raise NotImplementedError
@@ -1,8 +1,10 @@
 from abc import abstractmethod
 from asyncio import Protocol
 from dataclasses import dataclass
+from datetime import datetime
 
-from app.core.common.pagination import Pagination
+from app.core.common.pagination import Page, Pagination
+from app.core.entities.company import CompanyUserId
 from app.core.entities.notification import (
     Notification,
     NotificationId,
@@ -21,6 +23,15 @@ class NotificationGateway(Protocol):
     ) -> Notification | None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def add_quiz_reminders(
+        self,
+        created_before: datetime,
+        from_company_user_id: CompanyUserId,
+        to_company_user_id: CompanyUserId,
+    ) -> int:
+        raise NotImplementedError
+
 
 @dataclass
 class NotificationFilters:
@@ -37,7 +48,7 @@ class NotificationDetail:
 
 class NotificationReader(Protocol):
     @abstractmethod
-    async def many(
+    async def page(
         self, filters: NotificationFilters, pagination: Pagination
-    ) -> list[NotificationDetail]:
+    ) -> Page[NotificationDetail]:
         raise NotImplementedError
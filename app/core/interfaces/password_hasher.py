@@ -6,9 +6,9 @@ from app.core.entities.value_objects import UserRawPassword
 
 class PasswordHasher(Protocol):
     @abstractmethod
-    def hash_password(self, raw_password: UserRawPassword) -> str: ...
+    async def hash_password(self, raw_password: UserRawPassword) -> str: ...
 
     @abstractmethod
-    def verify_password(
+    async def verify_password(
         self, raw_password: UserRawPassword, hashed_password: str
     ) -> None: ...
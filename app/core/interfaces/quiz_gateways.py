@@ -5,7 +5,7 @@ from datetime import datetime
 from decimal import Decimal
 from enum import Enum
 
-from app.core.common.pagination import Pagination
+from app.core.common.pagination import Page, Pagination
 from app.core.entities.company import CompanyId, CompanyUserId
 from app.core.entities.quiz import (
     Answer,
@@ -33,6 +33,14 @@ class QuizGateway(Protocol):
     async def by_id(self, quiz_id: QuizId) -> Quiz | None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def by_ids(self, quiz_ids: list[QuizId]) -> list[Quiz]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update_many(self, quizzes: list[Quiz]) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     async def many(self, filters: QuizFilters) -> list[Quiz]:
         raise NotImplementedError
@@ -54,7 +62,7 @@ class QuizParticipationGateway(Protocol):
         raise NotImplementedError
 
     @abstractmethod
-    async def many(self) -> list[QuizParticipation]:
+    async def last_company_user_id(self) -> CompanyUserId | None:
         raise NotImplementedError
 
 
@@ -64,9 +72,70 @@ class QuizResultGateway(Protocol):
         raise NotImplementedError
 
 
+class ScoreRollupGateway(Protocol):
+    @abstractmethod
+    async def add_score(
+        self,
+        company_id: CompanyId,
+        participated_at: datetime,
+        correct_answers: int,
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove_quiz(self, quiz_id: QuizId) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove_company_user(
+        self, company_user_id: CompanyUserId
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove_user(self, user_id: UserId) -> None:
+        raise NotImplementedError
+
+
+class UserQuizStatsGateway(Protocol):
+    @abstractmethod
+    async def add_participation(
+        self, user_id: UserId, quiz_id: QuizId, participated_at: datetime
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def add_result(
+        self,
+        user_id: UserId,
+        quiz_id: QuizId,
+        participated_at: datetime,
+        correct_answers: int,
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove_company_user(
+        self, company_user_id: CompanyUserId
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def last_user_id(self) -> UserId | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def rebuild(self, from_user_id: UserId, to_user_id: UserId) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def company_points(self, company_id: CompanyId) -> dict[UserId, int]:
+        raise NotImplementedError
+
+
 class QuestionGateway(Protocol):
     @abstractmethod
-    async def add(self, question: Question) -> None:
+    async def add_many(self, questions: list[Question]) -> None:
         raise NotImplementedError
 
 
@@ -76,21 +145,21 @@ class AnswerGateway(Protocol):
         raise NotImplementedError
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class AnswerDetail:
     answer_id: int
     text: str
     is_correct: bool
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class QuestionDetail:
     question_id: int
     title: str
     answers: list[AnswerDetail]
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class QuizDetail:
     quiz_id: int
     title: str
@@ -121,6 +190,22 @@ class TimeRange(str, Enum):
     YEAR = "year"
     MONTH = "month"
     WEEK = "week"
+    DAY = "day"
+    HOUR = "hour"
+
+
+@dataclass(frozen=True)
+class UserAccuracy:
+    company_user_id: int
+    user_id: int
+    accuracy: float | None
+
+
+@dataclass(frozen=True)
+class LeaderboardEntry:
+    user_id: int
+    rank: int
+    points: int
 
 
 @dataclass(frozen=True)
@@ -131,19 +216,23 @@ class UserLastAttempt:
 
 class QuizReader(Protocol):
     @abstractmethod
-    async def get_many(
+    async def page(
         self, filters: QuizFilters, pagination: Pagination
-    ) -> list[QuizDetail]:
+    ) -> Page[QuizDetail]:
         raise NotImplementedError
 
     @abstractmethod
-    async def total(self, filters: QuizFilters) -> int:
+    async def total_average_user_score(
+        self, company_user_id: CompanyUserId, company_id: CompanyId
+    ) -> float | None:
         raise NotImplementedError
 
     @abstractmethod
-    async def total_average_user_score(
-        self, company_user_id: CompanyUserId, company_id: CompanyId
-    ) -> float:
+    async def total_average_users_scores(
+        self,
+        company_id: CompanyId,
+        company_user_ids: list[CompanyUserId] | None = None,
+    ) -> list[UserAccuracy]:
         raise NotImplementedError
 
     @abstractmethod
@@ -174,7 +263,10 @@ class QuizReader(Protocol):
 
     @abstractmethod
     async def get_company_user_quiz_average_scores(
-        self, company_user_id: CompanyUserId, time_range: TimeRange
+        self,
+        company_user_id: CompanyUserId,
+        company_id: CompanyId,
+        time_range: TimeRange,
     ) -> list[AverageScore]:
         raise NotImplementedError
 
@@ -183,3 +275,27 @@ class QuizReader(Protocol):
         self, company_id: CompanyId
     ) -> list[UserLastAttempt]:
         raise NotImplementedError
+
+
+@dataclass(frozen=True)
+class QuizResultDetail:
+    quiz_result_id: int
+    participation_id: int
+    company_user_id: int
+    company_id: int
+    quiz_id: int
+    correct_answers: int
+
+
+class QuizResultReader(Protocol):
+    @abstractmethod
+    async def by_participation(
+        self, participation_id: QuizParticipationId
+    ) -> QuizResultDetail | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def by_company(
+        self, company_id: CompanyId
+    ) -> list[QuizResultDetail]:
+        raise NotImplementedError
@@ -4,5 +4,5 @@ from asyncio import Protocol
 
 class UploadFile(Protocol):
     @abstractmethod
-    def upload_quiz(self, file: bytes) -> list[dict]:
+    async def upload_quiz(self, file: bytes) -> list[dict]:
         raise NotImplementedError
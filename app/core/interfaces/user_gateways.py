@@ -2,7 +2,7 @@ from abc import abstractmethod
 from asyncio import Protocol
 from dataclasses import dataclass
 
-from app.core.common.pagination import Pagination
+from app.core.common.pagination import Page, Pagination
 from app.core.entities.user import User, UserId
 from app.core.entities.value_objects import UserEmail
 
@@ -51,11 +51,7 @@ class UserReader(Protocol):
         raise NotImplementedError
 
     @abstractmethod
-    async def get_users(
+    async def page(
         self, filters: UserFilters, pagination: Pagination
-    ) -> list[UserDetail]:
-        raise NotImplementedError
-
-    @abstractmethod
-    async def total(self, filters: UserFilters) -> int:
+    ) -> Page[UserDetail]:
         raise NotImplementedError
@@ -17,7 +17,7 @@ class GetCompanyUserInputData:
 @dataclass(frozen=True)
 class GetCompanyOutputData:
     user_detail: CompanyUserDetail
-    avg_score: float
+    avg_score: float | None
 
 
 @dataclass
@@ -21,6 +21,7 @@ class GetCompanyUsersInputData:
 class GetCompanyUsersOutputData:
     total: int
     users: list[CompanyUserDetail]
+    next_cursor: str | None = None
 
 
 @dataclass
@@ -37,9 +38,10 @@ class GetCompanyUsers:
         if not company:
             raise CompanyNotFoundError(data.filters.company_id)
 
-        users = await self.company_user_reader.many(
+        page = await self.company_user_reader.page(
             data.filters, data.pagination
         )
-        total = await self.company_user_reader.total(data.filters)
 
-        return GetCompanyUsersOutputData(total, users)
+        return GetCompanyUsersOutputData(
+            page.total, page.items, page.next_cursor
+        )
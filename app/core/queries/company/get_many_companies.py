@@ -18,6 +18,7 @@ class GetManyCompaniesInputData:
 class GetManyCompaniesOutputData:
     total: int
     companies: list[CompanyDetail]
+    next_cursor: str | None = None
 
 
 @dataclass
@@ -27,9 +28,8 @@ class GetManyCompanies:
     async def __call__(
         self, data: GetManyCompaniesInputData
     ) -> GetManyCompaniesOutputData:
-        total = await self.company_reader.total(data.filters)
-        companies = await self.company_reader.many(
-            data.filters, data.pagination
-        )
+        page = await self.company_reader.page(data.filters, data.pagination)
 
-        return GetManyCompaniesOutputData(total, companies)
+        return GetManyCompaniesOutputData(
+            page.total, page.items, page.next_cursor
+        )
@@ -32,6 +32,7 @@ class GetInvitationByUser(InputData):
 class GetInvitationOutputData:
     total: int
     invitations: list[InvitationDetail]
+    next_cursor: str | None = None
 
 
 @dataclass
@@ -67,7 +68,8 @@ class GetInvitations:
     async def _data_processing(
         self, filters: InvitationFilters, pagination: Pagination
     ) -> GetInvitationOutputData:
-        invitations = await self.invitation_reader.many(filters, pagination)
-        total = await self.invitation_reader.total(filters)
+        page = await self.invitation_reader.page(filters, pagination)
 
-        return GetInvitationOutputData(total, invitations)
+        return GetInvitationOutputData(
+            page.total, page.items, page.next_cursor
+        )
@@ -32,6 +32,7 @@ class GetUserRequestsByUser(InputData):
 class GetUserRequestsOutputData:
     total: int
     requests: list[UserRequestDetail]
+    next_cursor: str | None = None
 
 
 @dataclass
@@ -67,7 +68,8 @@ class GetUserRequests:
     async def _data_processing(
         self, filters: UserRequestFilters, pagination: Pagination
     ) -> GetUserRequestsOutputData:
-        requests = await self.user_request_reader.many(filters, pagination)
-        total = await self.user_request_reader.total(filters)
+        page = await self.user_request_reader.page(filters, pagination)
 
-        return GetUserRequestsOutputData(total, requests)
+        return GetUserRequestsOutputData(
+            page.total, page.items, page.next_cursor
+        )
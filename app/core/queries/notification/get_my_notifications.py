@@ -25,6 +25,8 @@ class GetMyNotificationsInputData:
 @dataclass(frozen=True)
 class GetMyNotificationsOutputData:
     notifications: list[NotificationDetail]
+    total: int = 0
+    next_cursor: str | None = None
 
 
 @dataclass
@@ -44,7 +46,7 @@ class GetMyNotifications:
         if not company_user:
             raise CompanyUserNotFoundError()
 
-        notifications = await self.notification_reader.many(
+        page = await self.notification_reader.page(
             NotificationFilters(
                 company_user_id=company_user.company_user_id,
                 status=data.status,
@@ -52,4 +54,6 @@ class GetMyNotifications:
             data.pagination,
         )
 
-        return GetMyNotificationsOutputData(notifications)
+        return GetMyNotificationsOutputData(
+            page.items, page.total, page.next_cursor
+        )
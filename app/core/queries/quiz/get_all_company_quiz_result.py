@@ -3,9 +3,8 @@ from dataclasses import dataclass
 from app.core.commands.company.errors import CompanyNotFoundError
 from app.core.common.access_service import AccessService
 from app.core.entities.company import CompanyId
-from app.core.interfaces.cache import CacheGateway
 from app.core.interfaces.company_gateways import CompanyGateway
-from app.utils.get_cache_key import get_member_key
+from app.core.interfaces.quiz_gateways import QuizResultReader
 
 
 @dataclass(frozen=True)
@@ -28,7 +27,7 @@ class GetAllCompanyQuizResultOutputData:
 class GetAllCompanyQuizResult:
     company_gateway: CompanyGateway
     access_service: AccessService
-    cache: CacheGateway
+    quiz_result_reader: QuizResultReader
 
     async def __call__(self, data: GetAllCompanyQuizResultInputData):
         company = await self.company_gateway.by_id(CompanyId(data.company_id))
@@ -37,13 +36,13 @@ class GetAllCompanyQuizResult:
 
         await self.access_service.ensure_can_get_quiz_result(company)
 
-        member_key = get_member_key(company.company_id)
-        participation_keys = await self.cache.get_member_data(member_key)
+        quiz_results = await self.quiz_result_reader.by_company(
+            company.company_id
+        )
 
         results = [
-            QuizResult(data["participation_id"], data["correct_answers"])
-            for key in participation_keys
-            if (data := await self.cache.get_cache(key))
+            QuizResult(result.participation_id, result.correct_answers)
+            for result in quiz_results
         ]
 
         return GetAllCompanyQuizResultOutputData(results=results)
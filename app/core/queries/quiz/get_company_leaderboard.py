@@ -0,0 +1,53 @@
+from dataclasses import dataclass
+
+from app.core.commands.company.errors import CompanyNotFoundError
+from app.core.commands.quiz.service import LeaderboardService
+from app.core.common.access_service import AccessService
+from app.core.entities.company import CompanyId
+from app.core.entities.user import UserId
+from app.core.interfaces.company_gateways import CompanyGateway
+from app.core.interfaces.id_provider import IdProvider
+from app.core.interfaces.quiz_gateways import LeaderboardEntry
+
+
+@dataclass(frozen=True)
+class GetCompanyLeaderboardInputData:
+    company_id: int
+    limit: int
+    user_id: int | None = None
+
+
+@dataclass(frozen=True)
+class GetCompanyLeaderboardOutputData:
+    top: list[LeaderboardEntry]
+    user_rank: LeaderboardEntry | None
+
+
+@dataclass
+class GetCompanyLeaderboard:
+    id_provider: IdProvider
+    company_gateway: CompanyGateway
+    access_service: AccessService
+    leaderboard_service: LeaderboardService
+
+    async def __call__(
+        self, data: GetCompanyLeaderboardInputData
+    ) -> GetCompanyLeaderboardOutputData:
+        company_id = CompanyId(data.company_id)
+
+        company = await self.company_gateway.by_id(company_id)
+        if not company:
+            raise CompanyNotFoundError(company_id)
+
+        await self.access_service.ensure_can_get_company_leaderboard(company)
+
+        if data.user_id is None:
+            user = await self.id_provider.get_user()
+            user_id = user.user_id
+        else:
+            user_id = UserId(data.user_id)
+
+        top = await self.leaderboard_service.top(company_id, data.limit)
+        user_rank = await self.leaderboard_service.rank(company_id, user_id)
+
+        return GetCompanyLeaderboardOutputData(top, user_rank)
@@ -51,7 +51,7 @@ class GetCompanyUserQuizAverage:
         )
 
         result = await self.quiz_reader.get_company_user_quiz_average_scores(
-            company_user_id, data.time_range
+            company_user_id, company.company_id, data.time_range
         )
 
         return GetCompanyUserQuizAverageOutputData(result)
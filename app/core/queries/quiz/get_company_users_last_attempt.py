@@ -32,7 +32,9 @@ class GetCompanyUserLastAttempt:
         if not company:
             raise CompanyNotFoundError(company_id)
 
-        await self.access_service._is_owner_or_admin(company)
+        await self.access_service.ensure_can_get_company_users_last_attempt(
+            company
+        )
 
         result = await self.quiz_reader.get_company_users_last_attempt(
             company_id
@@ -10,7 +10,6 @@ from app.core.commands.quiz.errors import (
 from app.core.commands.user.errors import AccessDeniedError
 from app.core.common.access_service import AccessService
 from app.core.entities.quiz import QuizParticipationId
-from app.core.interfaces.cache import CacheGateway
 from app.core.interfaces.company_gateways import (
     CompanyGateway,
     CompanyUserGateway,
@@ -18,8 +17,8 @@ from app.core.interfaces.company_gateways import (
 from app.core.interfaces.id_provider import IdProvider
 from app.core.interfaces.quiz_gateways import (
     QuizParticipationGateway,
+    QuizResultReader,
 )
-from app.utils.get_cache_key import get_quiz_result_cache_key
 
 
 @dataclass(frozen=True)
@@ -39,7 +38,7 @@ class GetQuizResult:
     quiz_participation_gateway: QuizParticipationGateway
     company_user_gateway: CompanyUserGateway
     company_gateway: CompanyGateway
-    cache: CacheGateway
+    quiz_result_reader: QuizResultReader
 
     async def by_user(
         self, data: GetQuizResultInputData
@@ -93,14 +92,14 @@ class GetQuizResult:
     async def _get_data(
         self, participation_id: QuizParticipationId
     ) -> GetQuizResultOutputData:
-        cache_key = get_quiz_result_cache_key(participation_id)
-
-        cache_data = await self.cache.get_cache(cache_key)
+        quiz_result = await self.quiz_result_reader.by_participation(
+            participation_id
+        )
 
         return (
             GetQuizResultOutputData(correct_answers=None)
-            if not cache_data
+            if not quiz_result
             else GetQuizResultOutputData(
-                correct_answers=cache_data["correct_answers"]
+                correct_answers=quiz_result.correct_answers
             )
         )
@@ -18,6 +18,7 @@ class GetAllQuizzesInputData:
 class GetAllQuizzesOutputData:
     total: int
     quizzes: list[QuizDetail]
+    next_cursor: str | None = None
 
 
 @dataclass
@@ -27,9 +28,8 @@ class GetAllQuizzes:
     async def __call__(
         self, data: GetAllQuizzesInputData
     ) -> GetAllQuizzesOutputData:
-        total = await self.quiz_reader.total(data.filters)
-        quizzes = await self.quiz_reader.get_many(
-            data.filters, data.pagination
-        )
+        page = await self.quiz_reader.page(data.filters, data.pagination)
 
-        return GetAllQuizzesOutputData(total, quizzes)
+        return GetAllQuizzesOutputData(
+            page.total, page.items, page.next_cursor
+        )
@@ -19,6 +19,7 @@ class GetUsersInputData:
 class GetUsersOutputData:
     total: int
     users: list[UserDetail]
+    next_cursor: str | None = None
 
 
 @dataclass
@@ -26,9 +27,10 @@ class GetUsers:
     user_reader: UserReader
 
     async def __call__(self, data: GetUsersInputData) -> GetUsersOutputData:
-        total = await self.user_reader.total(data.filters)
-        users = await self.user_reader.get_users(data.filters, data.pagination)
+        page = await self.user_reader.page(data.filters, data.pagination)
 
-        logging.info("Get users, total=%s", total)
+        logging.info("Get users, total=%s", page.total)
 
-        return GetUsersOutputData(total=total, users=users)
+        return GetUsersOutputData(
+            total=page.total, users=page.items, next_cursor=page.next_cursor
+        )
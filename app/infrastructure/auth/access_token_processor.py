@@ -1,3 +1,5 @@
+import hashlib
+from collections import OrderedDict
 from datetime import UTC, datetime
 
 from app.core.commands.user.errors import (
@@ -5,14 +7,46 @@ from app.core.commands.user.errors import (
     UnauthorizedError,
 )
 from app.core.commands.user.sign_in import AccessTokenData
+from app.infrastructure.cache.metrics import CacheStats
 from app.infrastructure.jwt.exception import JWTDecodeError, JWTExpiredError
 from app.infrastructure.jwt.jwt_processor import JWTProcessor, JWTToken
 
+# Maximum amount of decoded access tokens kept in memory
+TOKEN_CACHE_SIZE = 10000
+
+DECODE_QUERY = "decode"
+
 
 class AccessTokenProcessor:
     def __init__(self, jwt_processor: JWTProcessor):
         self.jwt_processor = jwt_processor
 
+        self.cache_size = TOKEN_CACHE_SIZE
+        self.cache: OrderedDict[bytes, AccessTokenData] = OrderedDict()
+        self.stats = CacheStats()
+
+    def _get_cached(self, key: bytes) -> AccessTokenData | None:
+        data = self.cache.get(key)
+        if data is None:
+            return None
+
+        if data.expires_in <= datetime.now(UTC):
+            del self.cache[key]
+            return None
+
+        self.cache.move_to_end(key)
+
+        return data
+
+    def _set_cached(self, key: bytes, data: AccessTokenData) -> None:
+        if self.cache_size <= 0:
+            return
+
+        self.cache[key] = data
+
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+
     def encode(self, token: AccessTokenData) -> JWTToken:
         token_payload = {
             "sub": {"email": token.email},
@@ -24,6 +58,21 @@ class AccessTokenProcessor:
         return token
 
     def decode(self, token: JWTToken) -> AccessTokenData:
+        key = hashlib.sha256(token.encode()).digest()
+
+        data = self._get_cached(key)
+        if data is not None:
+            self.stats.hit(DECODE_QUERY)
+            return data
+
+        self.stats.miss(DECODE_QUERY)
+
+        data = self._decode(token)
+        self._set_cached(key, data)
+
+        return data
+
+    def _decode(self, token: JWTToken) -> AccessTokenData:
         try:
             payload = self.jwt_processor.decode(token)
             sub = payload["sub"]
@@ -39,9 +88,9 @@ class AccessTokenProcessor:
         else:
             return data
 
-    def decode_oauth(self, token: JWTToken) -> AccessTokenData:
+    async def decode_oauth(self, token: JWTToken) -> AccessTokenData:
         try:
-            payload = self.jwt_processor.decode_oauth(token)
+            payload = await self.jwt_processor.decode_oauth(token)
 
             email = str(payload["email"])
             expires_in = datetime.fromtimestamp(float(payload["exp"]), UTC)
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class PasswordHasherConfig:
+    time_cost: int = 3
+    memory_cost: int = 65536
+    parallelism: int = 4
+    hash_len: int = 32
+    salt_len: int = 16
+    workers: int = 4
@@ -1,11 +1,16 @@
 from app.core.commands.user.errors import UnauthorizedError, UserNotFoundError
 from app.core.commands.user.sign_in import AccessTokenData
-from app.core.entities.user import User
-from app.core.entities.value_objects import UserEmail
+from app.core.entities.user import User, UserId
+from app.core.entities.value_objects import FullName, UserEmail
+from app.core.interfaces.cache import CacheGateway
 from app.core.interfaces.id_provider import IdProvider
 from app.core.interfaces.user_gateways import (
     UserGateway,
 )
+from app.utils.get_cache_key import (
+    USER_IDENTITY_TTL,
+    get_user_identity_cache_key,
+)
 
 
 class TokenIdProvider(IdProvider):
@@ -13,15 +18,55 @@ class TokenIdProvider(IdProvider):
         self,
         token: AccessTokenData,
         user_gateway: UserGateway,
+        cache: CacheGateway,
     ):
         self.token = token
         self.user_gateway = user_gateway
+        self.cache = cache
 
-    async def get_user(self) -> User:
-        user_email = self.token.email
+        self._user: User | None = None
+
+    def _dump_user(self, user: User) -> dict:
+        full_name = user.full_name or FullName(None, None)
+
+        # Password hash is never put into the cache
+        return {
+            "user_id": user.user_id,
+            "first_name": full_name.first_name,
+            "last_name": full_name.last_name,
+            "email": user.email.email,
+            "is_active": user.is_active,
+        }
+
+    def _load_user(self, data: dict) -> User:
+        return User(
+            user_id=UserId(data["user_id"]),
+            full_name=FullName(data["first_name"], data["last_name"]),
+            email=UserEmail(data["email"]),
+            hashed_password=None,
+            is_active=data["is_active"],
+        )
+
+    async def _get_user(self) -> User:
+        user_email = UserEmail(self.token.email)
+        cache_key = get_user_identity_cache_key(user_email)
 
-        user = await self.user_gateway.by_email(UserEmail(user_email))
+        cached_user = await self.cache.get_cache(cache_key)
+        if cached_user:
+            return self._load_user(cached_user)
+
+        user = await self.user_gateway.by_email(user_email)
         if not user:
             raise UnauthorizedError from UserNotFoundError
 
+        await self.cache.set_cache(
+            cache_key, self._dump_user(user), USER_IDENTITY_TTL
+        )
+
         return user
+
+    async def get_user(self) -> User:
+        if self._user is None:
+            self._user = await self._get_user()
+
+        return self._user
@@ -1,21 +1,47 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
 import argon2
 
 from app.core.commands.user.errors import PasswordMismatchError
 from app.core.entities.value_objects import UserRawPassword
 from app.core.interfaces.password_hasher import PasswordHasher
+from app.infrastructure.auth.config import PasswordHasherConfig
 
 
 class ArgonPasswordHasher(PasswordHasher):
-    def __init__(self, password_hasher: argon2.PasswordHasher):
-        self.ph = password_hasher
+    def __init__(self, config: PasswordHasherConfig):
+        self.ph = argon2.PasswordHasher(
+            time_cost=config.time_cost,
+            memory_cost=config.memory_cost,
+            parallelism=config.parallelism,
+            hash_len=config.hash_len,
+            salt_len=config.salt_len,
+        )
+        # Argon2 releases the GIL, so the amount of workers bounds
+        # how many hashes are computed at the same time
+        self.executor = ThreadPoolExecutor(
+            max_workers=config.workers, thread_name_prefix="password-hasher"
+        )
+
+    async def hash_password(self, raw_password: UserRawPassword) -> str:
+        loop = asyncio.get_running_loop()
 
-    def hash_password(self, raw_password: UserRawPassword) -> str:
-        return self.ph.hash(raw_password.password)
+        return await loop.run_in_executor(
+            self.executor, self.ph.hash, raw_password.password
+        )
 
-    def verify_password(
+    async def verify_password(
         self, raw_password: UserRawPassword, hashed_password: str
     ) -> None:
+        loop = asyncio.get_running_loop()
+
         try:
-            self.ph.verify(hashed_password, raw_password.password)
+            await loop.run_in_executor(
+                self.executor,
+                self.ph.verify,
+                hashed_password,
+                raw_password.password,
+            )
         except argon2.exceptions.VerifyMismatchError as error:
             raise PasswordMismatchError(raw_password.password) from error
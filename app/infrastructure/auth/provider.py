@@ -0,0 +1,18 @@
+import logging
+from typing import Iterator
+
+from app.core.interfaces.password_hasher import PasswordHasher
+from app.infrastructure.auth.config import PasswordHasherConfig
+from app.infrastructure.auth.password_hasher import ArgonPasswordHasher
+
+
+def get_password_hasher(
+    config: PasswordHasherConfig,
+) -> Iterator[PasswordHasher]:
+    password_hasher = ArgonPasswordHasher(config)
+
+    yield password_hasher
+
+    password_hasher.executor.shutdown(wait=True)
+
+    logging.info("Password hasher executor has been shut down.")
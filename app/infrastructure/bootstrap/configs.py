@@ -3,6 +3,7 @@ from dataclasses import dataclass
 
 from environs import Env
 
+from app.infrastructure.auth.config import PasswordHasherConfig
 from app.infrastructure.cache.config import RedisConfig
 from app.infrastructure.jwt.config import Auth0Config, JWTConfig
 from app.infrastructure.persistence.config import DBConfig
@@ -16,6 +17,7 @@ class AllConfigs:
     jwt: JWTConfig
     auth0: Auth0Config
     token_auth: TokenAuthConfig
+    password_hasher: PasswordHasherConfig
 
 
 def load_all_configs() -> AllConfigs:
@@ -28,6 +30,13 @@ def load_all_configs() -> AllConfigs:
         host=env.str("POSTGRES_HOST"),
         port=env.int("POSTGRES_PORT"),
         db_name=env.str("POSTGRES_DB"),
+        pool_size=env.int("POSTGRES_POOL_SIZE", 5),
+        max_overflow=env.int("POSTGRES_MAX_OVERFLOW", 10),
+        pool_timeout=env.int("POSTGRES_POOL_TIMEOUT", 30),
+        pool_recycle=env.int("POSTGRES_POOL_RECYCLE", 1800),
+        pool_pre_ping=env.bool("POSTGRES_POOL_PRE_PING", True),
+        statement_cache_size=env.int("POSTGRES_STATEMENT_CACHE_SIZE", 100),
+        statement_timeout=env.int("POSTGRES_STATEMENT_TIMEOUT", 0),
     )
 
     cache_config = RedisConfig(
@@ -35,6 +44,7 @@ def load_all_configs() -> AllConfigs:
         host=env.str("REDIS_HOST"),
         port=env.int("REDIS_PORT"),
         db=env.int("REDIS_DB"),
+        batch_size=env.int("REDIS_BATCH_SIZE", 1000),
     )
 
     jwt_config = JWTConfig(
@@ -42,7 +52,19 @@ def load_all_configs() -> AllConfigs:
     )
 
     auth0_config = Auth0Config(
-        domain=env.str("DOMAIN"), audience=env.str("AUDIENCE")
+        domain=env.str("DOMAIN"),
+        audience=env.str("AUDIENCE"),
+        jwks_ttl=env.int("JWKS_TTL", 600),
+        jwks_file=env.str("JWKS_FILE", None),
+    )
+
+    password_hasher_config = PasswordHasherConfig(
+        time_cost=env.int("ARGON2_TIME_COST", 3),
+        memory_cost=env.int("ARGON2_MEMORY_COST", 65536),
+        parallelism=env.int("ARGON2_PARALLELISM", 4),
+        hash_len=env.int("ARGON2_HASH_LEN", 32),
+        salt_len=env.int("ARGON2_SALT_LEN", 16),
+        workers=env.int("PASSWORD_HASHER_WORKERS", 4),
     )
 
     token_auth_config = TokenAuthConfig(token_cookies_key=jwt_config.key)
@@ -55,4 +77,5 @@ def load_all_configs() -> AllConfigs:
         jwt=jwt_config,
         token_auth=token_auth_config,
         auth0=auth0_config,
+        password_hasher=password_hasher_config,
     )
@@ -1,6 +1,5 @@
 from typing import Iterable
 
-import argon2
 from dishka import (
     AsyncContainer,
     Provider,
@@ -38,12 +37,22 @@ from app.core.commands.notification.mark_read_notification import (
     MarkReadNotification,
 )
 from app.core.commands.notification.service import NotificationService
+from app.core.commands.quiz.backfill_user_quiz_stats import (
+    BackfillUserQuizStats,
+)
 from app.core.commands.quiz.check_available_quiz import CheckAvailableQuiz
+from app.core.commands.quiz.compact_quiz_result_index import (
+    CompactQuizResultIndex,
+)
 from app.core.commands.quiz.create_quiz import CreateQuiz
 from app.core.commands.quiz.delete_quiz import DeleteQuiz
 from app.core.commands.quiz.edit_quiz_title import EditQuizTitle
 from app.core.commands.quiz.export_quiz_result import ExportQuizResult
 from app.core.commands.quiz.save_quiz_result import SaveQuizResult
+from app.core.commands.quiz.service import (
+    LeaderboardService,
+    QuizAnalyticsService,
+)
 from app.core.commands.quiz.take_quiz import TakeQuiz
 from app.core.commands.quiz.upload_quizzes import UploadQuizzes
 from app.core.commands.user.delete_user import DeleteUser
@@ -72,7 +81,6 @@ from app.core.interfaces.notification_gateways import (
     NotificationGateway,
     NotificationReader,
 )
-from app.core.interfaces.password_hasher import PasswordHasher
 from app.core.interfaces.quiz_gateways import (
     AnswerGateway,
     QuestionGateway,
@@ -80,8 +88,10 @@ from app.core.interfaces.quiz_gateways import (
     QuizParticipationGateway,
     QuizReader,
     QuizResultGateway,
+    QuizResultReader,
+    ScoreRollupGateway,
+    UserQuizStatsGateway,
 )
-from app.core.interfaces.upload_file import UploadFile
 from app.core.interfaces.user_gateways import UserGateway, UserReader
 from app.core.queries.company.get_company_by_id import GetCompanyById
 from app.core.queries.company.get_company_user import GetCompanyUser
@@ -102,6 +112,9 @@ from app.core.queries.quiz.get_all_quiz_average import GetAllQuizAverage
 from app.core.queries.quiz.get_company_average_scores import (
     GetCompanyAverageScores,
 )
+from app.core.queries.quiz.get_company_leaderboard import (
+    GetCompanyLeaderboard,
+)
 from app.core.queries.quiz.get_company_user_quiz_average import (
     GetCompanyUserQuizAverage,
 )
@@ -116,13 +129,15 @@ from app.core.queries.user.get_me import GetMe
 from app.core.queries.user.get_user import GetUserById
 from app.core.queries.user.get_users import GetUsers
 from app.infrastructure.auth.access_token_processor import AccessTokenProcessor
+from app.infrastructure.auth.config import PasswordHasherConfig
 from app.infrastructure.auth.id_provider import TokenIdProvider
-from app.infrastructure.auth.password_hasher import ArgonPasswordHasher
+from app.infrastructure.auth.provider import get_password_hasher
 from app.infrastructure.bootstrap.configs import load_all_configs
 from app.infrastructure.cache.cache import RedisCache
 from app.infrastructure.cache.config import RedisConfig
+from app.infrastructure.cache.metrics import CacheStats
 from app.infrastructure.cache.provider import get_redis
-from app.infrastructure.files.upload_file import ExcelFileUpload
+from app.infrastructure.files.provider import get_upload_file
 from app.infrastructure.gateways.company import (
     CompanyMapper,
     CompanyUserMapper,
@@ -145,13 +160,19 @@ from app.infrastructure.gateways.quiz import (
     QuizMapper,
     QuizParticipationMapper,
     QuizResultMapper,
+    ScoreRollupMapper,
     SQLAlchemyQuizReader,
+    SQLAlchemyQuizResultReader,
+    UserQuizStatsMapper,
 )
+from app.infrastructure.gateways.quiz_cache import CachedQuizReader
 from app.infrastructure.gateways.user import SQLAlchemyUserReader, UserMapper
 from app.infrastructure.jwt.config import Auth0Config, JWTConfig
+from app.infrastructure.jwt.jwks import JWKSCache, get_jwk_source
 from app.infrastructure.jwt.jwt_processor import JWTProcessor, PyJWTProcessor
 from app.infrastructure.persistence.commiter import SACommiter
 from app.infrastructure.persistence.config import DBConfig
+from app.infrastructure.persistence.metrics import QueryStats
 from app.infrastructure.persistence.provider import (
     get_async_session,
     get_async_sessionmaker,
@@ -211,13 +232,27 @@ def gateway_provider() -> Provider:
     )
     provider.provide(AnswerMapper, scope=Scope.REQUEST, provides=AnswerGateway)
 
+    provider.provide(SQLAlchemyQuizReader, scope=Scope.REQUEST)
     provider.provide(
-        SQLAlchemyQuizReader, scope=Scope.REQUEST, provides=QuizReader
+        CachedQuizReader, scope=Scope.REQUEST, provides=QuizReader
     )
 
     provider.provide(
         QuizResultMapper, scope=Scope.REQUEST, provides=QuizResultGateway
     )
+    provider.provide(
+        ScoreRollupMapper, scope=Scope.REQUEST, provides=ScoreRollupGateway
+    )
+    provider.provide(
+        UserQuizStatsMapper,
+        scope=Scope.REQUEST,
+        provides=UserQuizStatsGateway,
+    )
+    provider.provide(
+        SQLAlchemyQuizResultReader,
+        scope=Scope.REQUEST,
+        provides=QuizResultReader,
+    )
 
     provider.provide(
         QuizParticipationMapper,
@@ -248,6 +283,7 @@ def db_provider() -> Provider:
     provider.provide(get_engine, scope=Scope.APP)
     provider.provide(get_async_sessionmaker, scope=Scope.APP)
     provider.provide(get_async_session, scope=Scope.REQUEST)
+    provider.provide(QueryStats, scope=Scope.APP)
 
     return provider
 
@@ -310,7 +346,10 @@ def interactor_provider() -> Provider:
         GetCompanyAverageScores,
         GetCompanyUserQuizAverage,
         GetCompanyUserLastAttempt,
+        GetCompanyLeaderboard,
         CheckAvailableQuiz,
+        CompactQuizResultIndex,
+        BackfillUserQuizStats,
         scope=Scope.REQUEST,
     )
 
@@ -325,6 +364,7 @@ def cache_provider() -> Provider:
     provider = Provider()
 
     provider.provide(RedisCache, scope=Scope.REQUEST, provides=CacheGateway)
+    provider.provide(CacheStats, scope=Scope.APP)
     provider.provide(get_redis, scope=Scope.APP)
 
     return provider
@@ -334,8 +374,10 @@ def infrastructure_provider() -> Provider:
     provider = Provider()
 
     provider.provide(PyJWTProcessor, scope=Scope.APP, provides=JWTProcessor)
+    provider.provide(get_jwk_source, scope=Scope.APP)
+    provider.provide(JWKSCache, scope=Scope.APP)
     provider.provide(AccessTokenProcessor, scope=Scope.APP)
-    provider.provide(ExcelFileUpload, scope=Scope.APP, provides=UploadFile)
+    provider.provide(get_upload_file, scope=Scope.APP)
 
     return provider
 
@@ -343,13 +385,11 @@ def infrastructure_provider() -> Provider:
 def service_provider() -> Provider:
     provider = Provider()
 
-    provider.provide(
-        lambda: ArgonPasswordHasher(argon2.PasswordHasher()),
-        scope=Scope.APP,
-        provides=PasswordHasher,
-    )
+    provider.provide(get_password_hasher, scope=Scope.APP)
     provider.provide(AccessService, scope=Scope.REQUEST)
     provider.provide(NotificationService, scope=Scope.REQUEST)
+    provider.provide(LeaderboardService, scope=Scope.REQUEST)
+    provider.provide(QuizAnalyticsService, scope=Scope.REQUEST)
 
     return provider
 
@@ -370,6 +410,11 @@ def config_provider() -> Provider:
     provider.provide(
         lambda: config.auth0, scope=Scope.APP, provides=Auth0Config
     )
+    provider.provide(
+        lambda: config.password_hasher,
+        scope=Scope.APP,
+        provides=PasswordHasherConfig,
+    )
 
     return provider
 
@@ -398,10 +443,13 @@ class HTTPProvider(Provider):
 
     @provide(scope=Scope.REQUEST)
     def get_idp(
-        self, token_auth: TokenAuth, user_gateway: UserGateway
+        self,
+        token_auth: TokenAuth,
+        user_gateway: UserGateway,
+        cache: CacheGateway,
     ) -> IdProvider:
         token = token_auth.get_access_token()
-        id_provider = TokenIdProvider(token, user_gateway)
+        id_provider = TokenIdProvider(token, user_gateway, cache)
 
         return id_provider
 
@@ -3,11 +3,25 @@ import json
 from redis.asyncio import Redis
 
 from app.core.interfaces.cache import CacheGateway
+from app.infrastructure.cache.config import RedisConfig
+from app.utils.batched import batched
+
+# Bumps a member's score only while the sorted set exists, so an evicted or
+# not yet built set is never resurrected with a single member in it
+INCREMENT_EXISTING_SCORE = """
+if redis.call("EXISTS", KEYS[1]) == 1 then
+    redis.call("ZINCRBY", KEYS[1], ARGV[1], ARGV[2])
+end
+"""
 
 
 class RedisCache(CacheGateway):
-    def __init__(self, redis: Redis):
+    def __init__(self, redis: Redis, config: RedisConfig):
         self.redis = redis
+        self.batch_size = config.batch_size
+        self.increment_existing_score = redis.register_script(
+            INCREMENT_EXISTING_SCORE
+        )
 
     def _convert_value_to_json(self, value: dict) -> str:
         return json.dumps(value)
@@ -25,8 +39,142 @@ class RedisCache(CacheGateway):
 
         return None if not data else self._convert_json_to_dict(data)
 
-    async def set_member_key(self, member_key: str, cached_key: str) -> None:
-        await self.redis.sadd(member_key, cached_key)
+    async def delete_cache(self, key: str) -> None:
+        await self.redis.delete(key)
+
+    async def get_many(self, keys: list[str]) -> list[dict | None]:
+        values = []
+        for chunk in batched(keys, self.batch_size):
+            values.extend(await self.redis.mget(chunk))
+
+        return [
+            None if not data else self._convert_json_to_dict(data)
+            for data in values
+        ]
+
+    async def set_many(self, values: dict[str, dict], ttl: int) -> None:
+        for chunk in batched(values.items(), self.batch_size):
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, value in chunk:
+                    pipe.setex(key, ttl, self._convert_value_to_json(value))
+
+                await pipe.execute()
+
+    async def set_member_key(self, member_key: str, *cached_keys: str) -> None:
+        for chunk in batched(cached_keys, self.batch_size):
+            await self.redis.sadd(member_key, *chunk)
+
+    async def remove_member_keys(
+        self, member_key: str, cached_keys: list[str]
+    ) -> None:
+        for chunk in batched(cached_keys, self.batch_size):
+            await self.redis.srem(member_key, *chunk)
 
     async def get_member_data(self, member_key: str) -> set | None:
         return await self.redis.smembers(member_key)
+
+    async def clear_member_keys(self, member_key: str) -> None:
+        cached_keys = [
+            key
+            async for key in self.redis.sscan_iter(
+                member_key, count=self.batch_size
+            )
+        ]
+
+        for chunk in batched(cached_keys, self.batch_size):
+            await self.redis.delete(*chunk)
+
+        await self.redis.delete(member_key)
+
+    async def compact_member_keys(
+        self, member_key_pattern: str, marker_key_pattern: str
+    ) -> int:
+        removed = 0
+
+        async for member_key in self.redis.scan_iter(
+            match=member_key_pattern, count=self.batch_size, _type="set"
+        ):
+            pruned = False
+            cursor = None
+            while cursor != 0:
+                cursor, cached_keys = await self.redis.sscan(
+                    member_key, cursor or 0, count=self.batch_size
+                )
+                if not cached_keys:
+                    continue
+
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    for key in cached_keys:
+                        pipe.exists(key)
+
+                    is_exist = await pipe.execute()
+
+                expired_keys = [
+                    key
+                    for key, exist in zip(cached_keys, is_exist, strict=True)
+                    if not exist
+                ]
+                if expired_keys:
+                    removed += await self.redis.srem(member_key, *expired_keys)
+                    pruned = True
+
+            if pruned:
+                await self._drop_markers(member_key, marker_key_pattern)
+
+        return removed
+
+    async def _drop_markers(
+        self, member_key: str, marker_key_pattern: str
+    ) -> None:
+        # A set that lost members is no longer complete, so its markers are
+        # dropped and the next read reloads the set from the database
+        marker_keys = [
+            key
+            async for key in self.redis.sscan_iter(
+                member_key, match=marker_key_pattern, count=self.batch_size
+            )
+        ]
+        if not marker_keys:
+            return
+
+        await self.redis.delete(*marker_keys)
+        await self.redis.srem(member_key, *marker_keys)
+
+    async def is_exist(self, key: str) -> bool:
+        return bool(await self.redis.exists(key))
+
+    async def set_scores(
+        self, key: str, scores: dict[str, float], ttl: int
+    ) -> None:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            for chunk in batched(scores.items(), self.batch_size):
+                pipe.zadd(key, dict(chunk))
+            pipe.expire(key, ttl)
+
+            await pipe.execute()
+
+    async def increment_score(
+        self, key: str, member: str, amount: float
+    ) -> None:
+        await self.increment_existing_score(keys=[key], args=[amount, member])
+
+    async def remove_scores(self, key: str, *members: str) -> None:
+        for chunk in batched(members, self.batch_size):
+            await self.redis.zrem(key, *chunk)
+
+    async def get_top_scores(
+        self, key: str, limit: int
+    ) -> list[tuple[str, float]]:
+        return await self.redis.zrevrange(key, 0, limit - 1, withscores=True)
+
+    async def get_score_rank(
+        self, key: str, member: str
+    ) -> tuple[int, float] | None:
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.zrevrank(key, member)
+            pipe.zscore(key, member)
+
+            rank, score = await pipe.execute()
+
+        return None if rank is None else (rank, score)
@@ -7,6 +7,7 @@ class RedisConfig:
     host: str
     port: int
     db: int
+    batch_size: int = 1000
 
     def get_connection_url(self) -> str:
         return f"redis://:{self.password}@{self.host}:{self.port}/{self.db}"
@@ -0,0 +1,36 @@
+from collections import Counter
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class QueryCacheMetrics:
+    query: str
+    hits: int
+    misses: int
+    hit_ratio: float
+
+
+class CacheStats:
+    def __init__(self):
+        self.hits: Counter[str] = Counter()
+        self.misses: Counter[str] = Counter()
+
+    def hit(self, query: str) -> None:
+        self.hits[query] += 1
+
+    def miss(self, query: str) -> None:
+        self.misses[query] += 1
+
+    def metrics(self) -> list[QueryCacheMetrics]:
+        queries = sorted(self.hits.keys() | self.misses.keys())
+
+        return [
+            QueryCacheMetrics(
+                query=query,
+                hits=self.hits[query],
+                misses=self.misses[query],
+                hit_ratio=self.hits[query]
+                / (self.hits[query] + self.misses[query]),
+            )
+            for query in queries
+        ]
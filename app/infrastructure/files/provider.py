@@ -0,0 +1,15 @@
+import logging
+from typing import Iterator
+
+from app.core.interfaces.upload_file import UploadFile
+from app.infrastructure.files.upload_file import ExcelFileUpload
+
+
+def get_upload_file() -> Iterator[UploadFile]:
+    upload_file = ExcelFileUpload()
+
+    yield upload_file
+
+    upload_file.executor.shutdown(wait=True)
+
+    logging.info("Upload file executor has been shut down.")
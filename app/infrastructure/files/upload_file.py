@@ -1,42 +1,180 @@
-from io import BytesIO
+import asyncio
+import csv
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO, StringIO
+from zipfile import BadZipFile
 
 import pandas as pd
+from openpyxl import load_workbook
 
+from app.core.commands.quiz.errors import InvalidQuizFileError
 from app.core.interfaces.upload_file import UploadFile
 
+# Amount of uploads parsed simultaneously outside the event loop
+UPLOAD_WORKERS = 2
+
+XLSX_SIGNATURE = b"PK\x03\x04"
+PARQUET_SIGNATURE = b"PAR1"
+
+# Columns of CSV and Parquet uploads, one row per answer
+FLAT_COLUMNS = (
+    "quiz_id",
+    "quiz_title",
+    "quiz_description",
+    "question_id",
+    "question_title",
+    "answer_text",
+    "is_correct",
+)
+
+
+def _iter_sheet(rows: Iterator[tuple]) -> Iterator[dict]:
+    header = next(rows, None)
+    if header is None:
+        return
+
+    for row in rows:
+        if all(value is None for value in row):
+            continue
+
+        yield dict(zip(header, row, strict=False))
+
+
+def _parse_bool(value: object) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() in {"1", "true", "yes"}
+
+    return bool(value)
+
+
+def _parse_quiz_id(value: object) -> int | None:
+    # Blank ids are kept as None, the quiz is then created by the upload
+    if value is None or pd.isna(value) or not str(value).strip():
+        return None
+
+    return int(value)
+
+
+def _group_quizzes(
+    quizzes: Iterable[dict],
+    questions: Iterable[dict],
+    answers: Iterable[dict],
+) -> list[dict]:
+    quizzes_data = []
+    quizzes_map = {}
+    for quiz in quizzes:
+        quiz["questions"] = []
+        quizzes_map[quiz["quiz_id"]] = quiz
+        quizzes_data.append(quiz)
+
+    questions_map = {}
+    for question in questions:
+        question["answers"] = []
+        questions_map[question["question_id"]] = question
+
+        quiz = quizzes_map.get(question["quiz_id"])
+        if quiz is not None:
+            quiz["questions"].append(question)
+
+    for answer in answers:
+        question = questions_map.get(answer["question_id"])
+        if question is not None:
+            question["answers"].append(answer)
+
+    return quizzes_data
+
+
+def _group_flat_rows(rows: Iterable[dict]) -> list[dict]:
+    quizzes_map = {}
+    questions_map = {}
+    for row in rows:
+        quiz_id = row["quiz_id"]
+        # Rows of a quiz without an id are grouped by its title
+        quiz_key = quiz_id if quiz_id is not None else ("", row["quiz_title"])
+        if quiz_key not in quizzes_map:
+            quizzes_map[quiz_key] = {
+                "quiz_id": quiz_id,
+                "title": row["quiz_title"],
+                "description": row["quiz_description"],
+                "questions": [],
+            }
+
+        question_key = (quiz_key, row["question_id"])
+        if question_key not in questions_map:
+            question = {
+                "question_id": row["question_id"],
+                "quiz_id": quiz_id,
+                "title": row["question_title"],
+                "answers": [],
+            }
+            questions_map[question_key] = question
+            quizzes_map[quiz_key]["questions"].append(question)
+
+        questions_map[question_key]["answers"].append(
+            {
+                "question_id": row["question_id"],
+                "text": row["answer_text"],
+                "is_correct": _parse_bool(row["is_correct"]),
+            }
+        )
+
+    return list(quizzes_map.values())
+
+
+def parse_excel(file: bytes) -> list[dict]:
+    workbook = load_workbook(BytesIO(file), read_only=True, data_only=True)
+
+    try:
+        return _group_quizzes(
+            _iter_sheet(workbook["Quizzes"].iter_rows(values_only=True)),
+            _iter_sheet(workbook["Questions"].iter_rows(values_only=True)),
+            _iter_sheet(workbook["Answers"].iter_rows(values_only=True)),
+        )
+    finally:
+        workbook.close()
+
+
+def parse_csv(text: str) -> list[dict]:
+    rows = csv.DictReader(StringIO(text))
+
+    return _group_flat_rows(
+        {**row, "quiz_id": _parse_quiz_id(row["quiz_id"])} for row in rows
+    )
+
+
+def parse_parquet(file: bytes) -> list[dict]:
+    frame = pd.read_parquet(BytesIO(file), columns=list(FLAT_COLUMNS))
+
+    return _group_flat_rows(
+        {**row, "quiz_id": _parse_quiz_id(row["quiz_id"])}
+        for row in frame.to_dict(orient="records")
+    )
+
+
+def parse_quiz_file(file: bytes) -> list[dict]:
+    # Missing sheets or columns and malformed values surface as
+    # KeyError/ValueError from any of the parsers
+    try:
+        if file.startswith(XLSX_SIGNATURE):
+            return parse_excel(file)
+
+        if file.startswith(PARQUET_SIGNATURE):
+            return parse_parquet(file)
+
+        # Anything else is accepted only as UTF-8 text
+        return parse_csv(file.decode("utf-8-sig"))
+    except (BadZipFile, KeyError, ValueError, csv.Error) as err:
+        raise InvalidQuizFileError() from err
+
 
 class ExcelFileUpload(UploadFile):
-    def upload_quiz(self, file: bytes) -> list[dict]:
-        excel_file = BytesIO(file)
-
-        quizzes_df = pd.read_excel(excel_file, sheet_name="Quizzes")
-        questions_df = pd.read_excel(excel_file, sheet_name="Questions")
-        answers_df = pd.read_excel(excel_file, sheet_name="Answers")
-
-        quizzes_data = quizzes_df.to_dict(orient="records")
-        questions_data = questions_df.to_dict(orient="records")
-        answers_data = answers_df.to_dict(orient="records")
-
-        questions_map = {}
-        for question in questions_data:
-            question_id = question["question_id"]
-            question["answers"] = []
-            questions_map[question_id] = question
-
-        for answer in answers_data:
-            question_id = answer["question_id"]
-            questions_map.setdefault(question_id, {"answers": []})
-            questions_map[question_id]["answers"].append(answer)
-
-        quizzes_map = {}
-        for quiz in quizzes_data:
-            quiz_id = quiz["quiz_id"]
-            quiz["questions"] = []
-            quizzes_map[quiz_id] = quiz
-
-        for question in questions_map.values():
-            quiz_id = question["quiz_id"]
-            quizzes_map.setdefault(quiz_id, {"questions": []})
-            quizzes_map[quiz_id]["questions"].append(question)
-
-        return quizzes_data
+    def __init__(self) -> None:
+        self.executor = ThreadPoolExecutor(
+            max_workers=UPLOAD_WORKERS, thread_name_prefix="quiz-upload"
+        )
+
+    async def upload_quiz(self, file: bytes) -> list[dict]:
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(self.executor, parse_quiz_file, file)
@@ -3,7 +3,7 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.commands.user.errors import UnexpectedError
-from app.core.common.pagination import Pagination, SortOrder
+from app.core.common.pagination import Page, Pagination
 from app.core.entities.company import (
     Company,
     CompanyId,
@@ -22,6 +22,7 @@ from app.core.interfaces.company_gateways import (
     CompanyUserGateway,
     CompanyUserReader,
 )
+from app.infrastructure.gateways.pagination import fetch_page, paginate
 from app.infrastructure.persistence.models.company import companies_table
 from app.infrastructure.persistence.models.company_user import (
     company_users_table,
@@ -50,13 +51,7 @@ class CompanyMapper(CompanyGateway):
         return result.scalar()
 
     async def by_id(self, company_id: CompanyId) -> Company | None:
-        query = select(Company).where(
-            companies_table.c.company_id == company_id
-        )
-
-        result = await self.session.execute(query)
-
-        return result.scalar_one_or_none()
+        return await self.session.get(Company, company_id)
 
     async def delete(self, company_id: CompanyId) -> None:
         query = delete(Company).where(
@@ -95,6 +90,15 @@ class CompanyUserMapper(CompanyUserGateway):
     async def by_company(
         self, company_id: CompanyId, user_id: UserId
     ) -> CompanyUser | None:
+        # Memberships already loaded in this session are reused without SQL
+        for loaded in self.session.identity_map.values():
+            if (
+                isinstance(loaded, CompanyUser)
+                and loaded.company_id == company_id
+                and loaded.user_id == user_id
+            ):
+                return loaded
+
         query = select(CompanyUser).where(
             and_(
                 company_users_table.c.user_id == user_id,
@@ -109,22 +113,25 @@ class CompanyUserMapper(CompanyUserGateway):
     async def by_id(
         self, company_user_id: CompanyUserId
     ) -> CompanyUser | None:
+        return await self.session.get(CompanyUser, company_user_id)
+
+    async def by_identity(self, user_id: UserId) -> CompanyUser | None:
         query = select(CompanyUser).where(
-            company_users_table.c.company_user_id == company_user_id
+            company_users_table.c.user_id == user_id
         )
 
         result = await self.session.execute(query)
 
         return result.scalar_one_or_none()
 
-    async def by_identity(self, user_id: UserId) -> CompanyUser | None:
+    async def by_user(self, user_id: UserId) -> list[CompanyUser]:
         query = select(CompanyUser).where(
             company_users_table.c.user_id == user_id
         )
 
         result = await self.session.execute(query)
 
-        return result.scalar_one_or_none()
+        return list(result.scalars().all())
 
     async def many(self, filters: CompanyUserFilters) -> list[CompanyUser]:
         query = select(CompanyUser).where(
@@ -177,9 +184,9 @@ class SQLAlchemyCompanyReader(CompanyReader):
 
         return self._load_company(row) if row else None
 
-    async def many(
+    def _companies_query(
         self, filters: CompanyFilters, pagination: Pagination
-    ) -> list[CompanyDetail]:
+    ) -> Select:
         query = select(
             companies_table.c.company_id,
             companies_table.c.company_name,
@@ -190,29 +197,36 @@ class SQLAlchemyCompanyReader(CompanyReader):
         if filters:
             query = self._make_filters(query, filters)
 
-        if pagination.order is SortOrder.ASC:
-            query = query.order_by(companies_table.c.created_at.asc())
-        else:
-            query = query.order_by(companies_table.c.created_at.desc())
-
-        if pagination.offset is not None:
-            query = query.offset(pagination.offset)
-        if pagination.limit is not None:
-            query = query.limit(pagination.limit)
+        return paginate(
+            query,
+            companies_table.c.created_at,
+            companies_table.c.company_id,
+            pagination,
+        )
 
-        result = await self.session.execute(query)
+    async def page(
+        self, filters: CompanyFilters, pagination: Pagination
+    ) -> Page[CompanyDetail]:
+        page = await fetch_page(
+            self.session,
+            self._companies_query(filters, pagination),
+            self._total_query(filters),
+            pagination,
+        )
 
-        return [self._load_company(row) for row in result.mappings()]
+        return Page(
+            [self._load_company(row) for row in page.items],
+            page.total,
+            page.next_cursor,
+        )
 
-    async def total(self, filters: CompanyFilters) -> int:
+    def _total_query(self, filters: CompanyFilters) -> Select:
         query = select(func.count(companies_table.c.company_id))
 
         if filters:
             query = self._make_filters(query, filters)
 
-        total: int = await self.session.scalar(query)
-
-        return total
+        return query
 
 
 class SQLAlchemyCompanyUserReader(CompanyUserReader):
@@ -250,9 +264,9 @@ class SQLAlchemyCompanyUserReader(CompanyUserReader):
 
         return None if not row else self._load_model(row)
 
-    async def many(
+    def _company_users_query(
         self, filters: CompanyUserFilters, pagination: Pagination
-    ) -> list[CompanyUserDetail]:
+    ) -> Select:
         query = select(
             company_users_table.c.company_user_id,
             company_users_table.c.company_id,
@@ -262,21 +276,30 @@ class SQLAlchemyCompanyUserReader(CompanyUserReader):
 
         query = self._make_filters(query, filters)
 
-        if pagination.order is SortOrder.ASC:
-            query = query.order_by(company_users_table.c.created_at.asc())
-        else:
-            query = query.order_by(company_users_table.c.created_at.desc())
-
-        if pagination.offset is not None:
-            query = query.offset(pagination.offset)
-        if pagination.limit is not None:
-            query = query.limit(pagination.limit)
+        return paginate(
+            query,
+            company_users_table.c.created_at,
+            company_users_table.c.company_user_id,
+            pagination,
+        )
 
-        result = await self.session.execute(query)
+    async def page(
+        self, filters: CompanyUserFilters, pagination: Pagination
+    ) -> Page[CompanyUserDetail]:
+        page = await fetch_page(
+            self.session,
+            self._company_users_query(filters, pagination),
+            self._total_query(filters),
+            pagination,
+        )
 
-        return [self._load_model(row) for row in result.mappings()]
+        return Page(
+            [self._load_model(row) for row in page.items],
+            page.total,
+            page.next_cursor,
+        )
 
-    async def total(self, filters: CompanyUserFilters) -> int:
+    def _total_query(self, filters: CompanyUserFilters) -> Select:
         query = select(func.count(company_users_table.c.company_user_id))
         query = query.where(
             company_users_table.c.company_id == filters.company_id
@@ -284,6 +307,4 @@ class SQLAlchemyCompanyUserReader(CompanyUserReader):
 
         query = self._make_filters(query, filters)
 
-        total: int = await self.session.scalar(query)
-
-        return total
+        return query
@@ -3,7 +3,7 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.commands.user.errors import UnexpectedError
-from app.core.common.pagination import Pagination, SortOrder
+from app.core.common.pagination import Page, Pagination
 from app.core.entities.company import CompanyId
 from app.core.entities.invitation import (
     Invitation,
@@ -23,6 +23,7 @@ from app.core.interfaces.invitation_gateways import (
     UserRequestGateway,
     UserRequestReader,
 )
+from app.infrastructure.gateways.pagination import fetch_page, paginate
 from app.infrastructure.persistence.models.invite import (
     invitations_table,
     user_requests_table,
@@ -57,13 +58,7 @@ class InvitationMapper(InvitationGateway):
             raise UnexpectedError from error
 
     async def by_id(self, invitation_id: InvitationId) -> Invitation | None:
-        query = select(Invitation).where(
-            invitations_table.c.invitation_id == invitation_id
-        )
-
-        result = await self.session.execute(query)
-
-        return result.scalar_one_or_none()
+        return await self.session.get(Invitation, invitation_id)
 
 
 class UserRequestMapper(UserRequestGateway):
@@ -96,13 +91,7 @@ class UserRequestMapper(UserRequestGateway):
     async def by_id(
         self, user_request_id: UserRequestId
     ) -> UserRequest | None:
-        query = select(UserRequest).where(
-            user_requests_table.c.user_request_id == user_request_id
-        )
-
-        result = await self.session.execute(query)
-
-        return result.scalar_one_or_none()
+        return await self.session.get(UserRequest, user_request_id)
 
 
 class SQLAlchemyInvitationReader(InvitationReader):
@@ -129,9 +118,9 @@ class SQLAlchemyInvitationReader(InvitationReader):
 
         return query
 
-    async def many(
+    def _invitations_query(
         self, filters: InvitationFilters, pagination: Pagination
-    ) -> list[InvitationDetail]:
+    ) -> Select:
         query = select(
             invitations_table.c.company_id,
             invitations_table.c.invitation_id,
@@ -140,28 +129,35 @@ class SQLAlchemyInvitationReader(InvitationReader):
 
         query = self._make_filters(query, filters)
 
-        if pagination.order is SortOrder.ASC:
-            query = query.order_by(invitations_table.c.created_at.asc())
-        else:
-            query = query.order_by(invitations_table.c.created_at.desc())
-
-        if pagination.offset is not None:
-            query = query.offset(pagination.offset)
-        if pagination.limit is not None:
-            query = query.limit(pagination.limit)
+        return paginate(
+            query,
+            invitations_table.c.created_at,
+            invitations_table.c.invitation_id,
+            pagination,
+        )
 
-        result = await self.session.execute(query)
+    async def page(
+        self, filters: InvitationFilters, pagination: Pagination
+    ) -> Page[InvitationDetail]:
+        page = await fetch_page(
+            self.session,
+            self._invitations_query(filters, pagination),
+            self._total_query(filters),
+            pagination,
+        )
 
-        return [self._load_model(row) for row in result.mappings()]
+        return Page(
+            [self._load_model(row) for row in page.items],
+            page.total,
+            page.next_cursor,
+        )
 
-    async def total(self, filters: InvitationFilters) -> int:
+    def _total_query(self, filters: InvitationFilters) -> Select:
         query = select(func.count(invitations_table.c.invitation_id))
 
         query = self._make_filters(query, filters)
 
-        total: int = await self.session.scalar(query)
-
-        return total
+        return query
 
 
 class SQLAlchemyUserRequestReader(UserRequestReader):
@@ -190,9 +186,9 @@ class SQLAlchemyUserRequestReader(UserRequestReader):
 
         return query
 
-    async def many(
+    def _user_requests_query(
         self, filters: UserRequestFilters, pagination: Pagination
-    ) -> list[UserRequestDetail]:
+    ) -> Select:
         query = select(
             user_requests_table.c.company_id,
             user_requests_table.c.user_request_id,
@@ -201,25 +197,32 @@ class SQLAlchemyUserRequestReader(UserRequestReader):
 
         query = self._make_filters(query, filters)
 
-        if pagination.order is SortOrder.ASC:
-            query = query.order_by(user_requests_table.c.created_at.asc())
-        else:
-            query = query.order_by(user_requests_table.c.created_at.desc())
-
-        if pagination.offset is not None:
-            query = query.offset(pagination.offset)
-        if pagination.limit is not None:
-            query = query.limit(pagination.limit)
+        return paginate(
+            query,
+            user_requests_table.c.created_at,
+            user_requests_table.c.user_request_id,
+            pagination,
+        )
 
-        result = await self.session.execute(query)
+    async def page(
+        self, filters: UserRequestFilters, pagination: Pagination
+    ) -> Page[UserRequestDetail]:
+        page = await fetch_page(
+            self.session,
+            self._user_requests_query(filters, pagination),
+            self._total_query(filters),
+            pagination,
+        )
 
-        return [self._load_model(row) for row in result.mappings()]
+        return Page(
+            [self._load_model(row) for row in page.items],
+            page.total,
+            page.next_cursor,
+        )
 
-    async def total(self, filters: UserRequestFilters) -> int:
+    def _total_query(self, filters: UserRequestFilters) -> Select:
         query = select(func.count(user_requests_table.c.user_request_id))
 
         query = self._make_filters(query, filters)
 
-        total: int = await self.session.scalar(query)
-
-        return total
+        return query
@@ -1,9 +1,12 @@
-from sqlalchemy import RowMapping, Select, select
+from datetime import datetime
+
+from sqlalchemy import RowMapping, Select, String, cast, func, insert, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.commands.user.errors import UnexpectedError
-from app.core.common.pagination import Pagination, SortOrder
+from app.core.common.pagination import Page, Pagination
+from app.core.entities.company import CompanyUserId
 from app.core.entities.notification import Notification, NotificationId
 from app.core.interfaces.notification_gateways import (
     NotificationDetail,
@@ -11,9 +14,13 @@ from app.core.interfaces.notification_gateways import (
     NotificationGateway,
     NotificationReader,
 )
+from app.infrastructure.gateways.pagination import fetch_page, paginate
 from app.infrastructure.persistence.models.notification import (
     notifications_table,
 )
+from app.infrastructure.persistence.models.quiz import (
+    quiz_participations_table,
+)
 
 
 class NotificationMapper(NotificationGateway):
@@ -29,13 +36,45 @@ class NotificationMapper(NotificationGateway):
             raise UnexpectedError from error
 
     async def by_id(self, notification_id: NotificationId) -> Notification:
-        query = select(Notification).where(
-            notifications_table.c.notification_id == notification_id
+        return await self.session.get(Notification, notification_id)
+
+    async def add_quiz_reminders(
+        self,
+        created_before: datetime,
+        from_company_user_id: CompanyUserId,
+        to_company_user_id: CompanyUserId,
+    ) -> int:
+        last_participations = (
+            select(
+                quiz_participations_table.c.company_user_id,
+                func.concat(
+                    "It's time to re-run the quiz ",
+                    cast(quiz_participations_table.c.quiz_id, String),
+                ),
+            )
+            .where(
+                quiz_participations_table.c.company_user_id
+                > from_company_user_id,
+                quiz_participations_table.c.company_user_id
+                <= to_company_user_id,
+            )
+            .group_by(
+                quiz_participations_table.c.company_user_id,
+                quiz_participations_table.c.quiz_id,
+            )
+            .having(
+                func.max(quiz_participations_table.c.created_at)
+                <= created_before.replace(tzinfo=None)
+            )
+        )
+
+        query = insert(notifications_table).from_select(
+            ["send_to", "text"], last_participations
         )
 
         result = await self.session.execute(query)
 
-        return result.scalar_one_or_none()
+        return result.rowcount
 
 
 class SQLAlchemyNotificationReader(NotificationReader):
@@ -62,9 +101,9 @@ class SQLAlchemyNotificationReader(NotificationReader):
             status=row.status,
         )
 
-    async def many(
+    def _notifications_query(
         self, filters: NotificationFilters, pagination: Pagination
-    ) -> list[NotificationDetail]:
+    ) -> Select:
         query = select(
             notifications_table.c.notification_id,
             notifications_table.c.text,
@@ -73,16 +112,30 @@ class SQLAlchemyNotificationReader(NotificationReader):
 
         query = self._make_filters(query, filters)
 
-        if pagination.order is SortOrder.ASC:
-            query = query.order_by(notifications_table.c.created_at.asc())
-        else:
-            query = query.order_by(notifications_table.c.created_at.desc())
+        return paginate(
+            query,
+            notifications_table.c.created_at,
+            notifications_table.c.notification_id,
+            pagination,
+        )
 
-        if pagination.offset is not None:
-            query = query.offset(pagination.offset)
-        if pagination.limit is not None:
-            query = query.limit(pagination.limit)
+    def _total_query(self, filters: NotificationFilters) -> Select:
+        query = select(func.count(notifications_table.c.notification_id))
 
-        result = await self.session.execute(query)
+        return self._make_filters(query, filters)
 
-        return [self._load_model(row) for row in result.mappings()]
+    async def page(
+        self, filters: NotificationFilters, pagination: Pagination
+    ) -> Page[NotificationDetail]:
+        page = await fetch_page(
+            self.session,
+            self._notifications_query(filters, pagination),
+            self._total_query(filters),
+            pagination,
+        )
+
+        return Page(
+            [self._load_model(row) for row in page.items],
+            page.total,
+            page.next_cursor,
+        )
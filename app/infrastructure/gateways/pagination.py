@@ -0,0 +1,111 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from sqlalchemy import ColumnElement, RowMapping, Select, func, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.common.pagination import (
+    InvalidCursorError,
+    Page,
+    Pagination,
+    SortOrder,
+)
+
+TOTAL_COLUMN = "total_count"
+CURSOR_CREATED_AT_COLUMN = "cursor_created_at"
+CURSOR_ID_COLUMN = "cursor_id"
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    data = json.dumps([created_at.isoformat(), row_id]).encode()
+
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    padding = "=" * (-len(cursor) % 4)
+
+    try:
+        data = base64.urlsafe_b64decode(cursor + padding)
+        created_at, row_id = json.loads(data)
+
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (binascii.Error, TypeError, ValueError) as error:
+        raise InvalidCursorError(cursor) from error
+
+
+def paginate(
+    query: Select,
+    created_at: ColumnElement,
+    row_id: ColumnElement,
+    pagination: Pagination,
+) -> Select:
+    # Rows are ordered by (created_at, id), the id makes the order total
+    # so a cursor always points between two distinct rows
+    if pagination.order is SortOrder.ASC:
+        query = query.order_by(created_at.asc(), row_id.asc())
+    else:
+        query = query.order_by(created_at.desc(), row_id.desc())
+
+    if pagination.cursor is not None:
+        position = tuple_(created_at, row_id)
+        last = tuple_(*decode_cursor(pagination.cursor))
+
+        if pagination.order is SortOrder.ASC:
+            query = query.where(position > last)
+        else:
+            query = query.where(position < last)
+    elif pagination.offset is not None:
+        query = query.offset(pagination.offset)
+
+    if pagination.limit is not None:
+        query = query.limit(pagination.limit)
+
+    return query.add_columns(
+        created_at.label(CURSOR_CREATED_AT_COLUMN),
+        row_id.label(CURSOR_ID_COLUMN),
+    )
+
+
+async def fetch_page(
+    session: AsyncSession,
+    query: Select,
+    count_query: Select,
+    pagination: Pagination,
+) -> Page[RowMapping]:
+    if pagination.cursor is None:
+        # Total is computed by a window over the filtered rows before
+        # LIMIT/OFFSET, so the page and its total come in one round trip
+        total_column = func.count().over()
+    else:
+        # The window would only see rows after the cursor
+        total_column = count_query.scalar_subquery()
+
+    query = query.add_columns(total_column.label(TOTAL_COLUMN))
+
+    # One extra row tells whether there is a page after this one
+    if pagination.limit is not None:
+        query = query.limit(pagination.limit + 1)
+
+    result = await session.execute(query)
+    rows = result.mappings().all()
+
+    next_cursor = None
+    if pagination.limit is not None and len(rows) > pagination.limit:
+        rows = rows[: pagination.limit]
+        next_cursor = encode_cursor(
+            rows[-1][CURSOR_CREATED_AT_COLUMN], rows[-1][CURSOR_ID_COLUMN]
+        )
+
+    if rows:
+        return Page(list(rows), rows[0][TOTAL_COLUMN], next_cursor)
+
+    if not pagination.offset and pagination.cursor is None:
+        return Page([], 0)
+
+    # Page past the end, there are no rows to report the total on
+    total: int = await session.scalar(count_query)
+
+    return Page([], total)
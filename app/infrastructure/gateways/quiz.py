@@ -1,21 +1,38 @@
+from collections.abc import Sequence
+from dataclasses import asdict
 from datetime import datetime
 from decimal import Decimal
 
 from sqlalchemy import (
+    ColumnElement,
     Float,
+    Integer,
+    Numeric,
     RowMapping,
+    Select,
+    String,
+    Subquery,
     and_,
+    any_,
     between,
+    bindparam,
     cast,
+    column,
     delete,
     func,
+    insert,
     select,
+    true,
+    update,
+    values,
 )
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.commands.user.errors import UnexpectedError
-from app.core.common.pagination import Pagination, SortOrder
+from app.core.common.pagination import Page, Pagination
 from app.core.entities.company import CompanyId, CompanyUserId
 from app.core.entities.quiz import (
     Answer,
@@ -27,6 +44,7 @@ from app.core.entities.quiz import (
     QuizResult,
 )
 from app.core.entities.user import UserId
+from app.core.interfaces.cache import CacheGateway
 from app.core.interfaces.quiz_gateways import (
     AnswerDetail,
     AnswerGateway,
@@ -40,19 +58,33 @@ from app.core.interfaces.quiz_gateways import (
     QuizGateway,
     QuizParticipationGateway,
     QuizReader,
+    QuizResultDetail,
     QuizResultGateway,
+    QuizResultReader,
+    ScoreRollupGateway,
     TimeRange,
+    UserAccuracy,
     UserLastAttempt,
+    UserQuizStatsGateway,
 )
+from app.infrastructure.gateways.pagination import fetch_page, paginate
 from app.infrastructure.persistence.models.company_user import (
     company_users_table,
 )
 from app.infrastructure.persistence.models.quiz import (
     answers_table,
+    company_score_rollups_table,
     questions_table,
     quiz_participations_table,
     quiz_results_table,
     quizzes_table,
+    user_quiz_stats_table,
+)
+from app.utils.get_cache_key import (
+    QUIZ_RESULT_TTL,
+    get_member_key,
+    get_quiz_result_cache_key,
+    get_quiz_results_loaded_key,
 )
 
 
@@ -69,11 +101,59 @@ class QuizMapper(QuizGateway):
             raise UnexpectedError from error
 
     async def by_id(self, quiz_id: QuizId) -> Quiz | None:
-        query = select(Quiz).where(quizzes_table.c.quiz_id == quiz_id)
+        return await self.session.get(Quiz, quiz_id)
+
+    async def by_ids(self, quiz_ids: list[QuizId]) -> list[Quiz]:
+        if not quiz_ids:
+            return []
+
+        query = select(quizzes_table).where(
+            quizzes_table.c.quiz_id
+            == any_(bindparam("quiz_ids", quiz_ids, type_=ARRAY(Integer)))
+        )
 
         result = await self.session.execute(query)
 
-        return result.scalar_one_or_none()
+        return [
+            Quiz(
+                quiz_id=QuizId(row.quiz_id),
+                company_id=CompanyId(row.company_id),
+                title=row.title,
+                description=row.description,
+                participation_count=row.participation_count,
+            )
+            for row in result
+        ]
+
+    async def update_many(self, quizzes: list[Quiz]) -> None:
+        if not quizzes:
+            return
+
+        new_values = (
+            values(
+                column("quiz_id", Integer),
+                column("title", String),
+                column("description", String),
+                name="new_values",
+            )
+            .data(
+                [
+                    (quiz.quiz_id, quiz.title, quiz.description)
+                    for quiz in quizzes
+                ]
+            )
+            .alias("new_values")
+        )
+        query = (
+            update(quizzes_table)
+            .where(quizzes_table.c.quiz_id == new_values.c.quiz_id)
+            .values(
+                title=new_values.c.title,
+                description=new_values.c.description,
+            )
+        )
+
+        await self.session.execute(query)
 
     async def delete(self, quiz_id: QuizId) -> None:
         query = delete(Quiz).where(quizzes_table.c.quiz_id == quiz_id)
@@ -85,24 +165,48 @@ class QuestionMapper(QuestionGateway):
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def add(self, question: Question) -> None:
-        self.session.add(question)
+    async def add_many(self, questions: list[Question]) -> None:
+        if not questions:
+            return
+
+        query = insert(questions_table).returning(
+            questions_table.c.question_id, sort_by_parameter_order=True
+        )
+        rows = [
+            {"quiz_id": question.quiz_id, "title": question.title}
+            for question in questions
+        ]
 
         try:
-            await self.session.flush()
+            result = await self.session.execute(query, rows)
         except IntegrityError as error:
             raise UnexpectedError from error
 
+        for question, question_id in zip(
+            questions, result.scalars(), strict=True
+        ):
+            question.question_id = question_id
+
 
 class AnswerMapper(AnswerGateway):
     def __init__(self, session: AsyncSession):
         self.session = session
 
     async def add_many(self, answers: list[Answer]) -> None:
-        self.session.add_all(answers)
+        if not answers:
+            return
+
+        rows = [
+            {
+                "question_id": answer.question_id,
+                "text": answer.text,
+                "is_correct": answer.is_correct,
+            }
+            for answer in answers
+        ]
 
         try:
-            await self.session.flush()
+            await self.session.execute(insert(answers_table), rows)
         except IntegrityError as error:
             raise UnexpectedError from error
 
@@ -122,21 +226,12 @@ class QuizParticipationMapper(QuizParticipationGateway):
     async def by_id(
         self, quiz_participation_id: QuizParticipationId
     ) -> QuizParticipation | None:
-        query = select(QuizParticipation).where(
-            quiz_participations_table.c.quiz_participation_id
-            == quiz_participation_id
-        )
-
-        result = await self.session.execute(query)
+        return await self.session.get(QuizParticipation, quiz_participation_id)
 
-        return result.scalar_one_or_none()
-
-    async def many(self) -> list[QuizParticipation]:
-        query = select(QuizParticipation)
-
-        result = await self.session.execute(query)
+    async def last_company_user_id(self) -> CompanyUserId | None:
+        query = select(func.max(quiz_participations_table.c.company_user_id))
 
-        return list(result.scalars().all())
+        return await self.session.scalar(query)
 
 
 class QuizResultMapper(QuizResultGateway):
@@ -152,30 +247,449 @@ class QuizResultMapper(QuizResultGateway):
             raise UnexpectedError from error
 
 
-class SQLAlchemyQuizReader(QuizReader):
+class ScoreRollupMapper(ScoreRollupGateway):
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    def _load_models(self, rows: list[RowMapping]) -> list[QuizDetail]:
-        quizzes = {}
-        for row in rows:
-            quiz_id = row["quiz_id"]
-
-            if quiz_id not in quizzes:
-                quizzes[quiz_id] = QuizDetail(
-                    quiz_id=quiz_id,
-                    title=row["title"],
-                    description=row["description"],
-                    participation_count=row["participation_count"],
-                    questions=[],
+    async def add_score(
+        self,
+        company_id: CompanyId,
+        participated_at: datetime,
+        correct_answers: int,
+    ) -> None:
+        participated_at = participated_at.replace(tzinfo=None)
+
+        query = pg_insert(company_score_rollups_table).values(
+            [
+                {
+                    "company_id": company_id,
+                    "time_range": time_range.value,
+                    "bucket_start": func.date_trunc(
+                        time_range.value, participated_at
+                    ),
+                    "score_sum": correct_answers,
+                    "result_count": 1,
+                }
+                for time_range in TimeRange
+            ]
+        )
+        query = query.on_conflict_do_update(
+            index_elements=[
+                company_score_rollups_table.c.company_id,
+                company_score_rollups_table.c.time_range,
+                company_score_rollups_table.c.bucket_start,
+            ],
+            set_={
+                "score_sum": company_score_rollups_table.c.score_sum
+                + query.excluded.score_sum,
+                "result_count": company_score_rollups_table.c.result_count
+                + query.excluded.result_count,
+            },
+        )
+
+        await self.session.execute(query)
+
+    def _scores_query(self) -> Select:
+        time_ranges = values(
+            column("time_range", String), name="time_ranges"
+        ).data([(time_range.value,) for time_range in TimeRange])
+
+        bucket_start = func.date_trunc(
+            time_ranges.c.time_range, quiz_participations_table.c.created_at
+        )
+
+        return (
+            select(
+                quizzes_table.c.company_id,
+                time_ranges.c.time_range,
+                bucket_start.label("bucket_start"),
+                func.sum(quiz_results_table.c.correct_answers).label(
+                    "score_sum"
+                ),
+                func.count(quiz_results_table.c.quiz_result_id).label(
+                    "result_count"
+                ),
+            )
+            .select_from(
+                quiz_results_table.join(
+                    quiz_participations_table,
+                    quiz_results_table.c.quiz_participation_id
+                    == quiz_participations_table.c.quiz_participation_id,
+                )
+                .join(
+                    quizzes_table,
+                    quiz_participations_table.c.quiz_id
+                    == quizzes_table.c.quiz_id,
                 )
+                .join(time_ranges, true())
+            )
+            .group_by(
+                quizzes_table.c.company_id,
+                time_ranges.c.time_range,
+                bucket_start,
+            )
+        )
 
-            question_id = row["question_id"]
-            quiz = quizzes[quiz_id]
-            question = next(
-                (q for q in quiz.questions if q.question_id == question_id),
-                None,
+    async def _subtract_scores(self, condition: ColumnElement[bool]) -> None:
+        # Must run before the results matching condition are deleted
+        removed = self._scores_query().where(condition).subquery()
+
+        query = (
+            update(company_score_rollups_table)
+            .values(
+                score_sum=company_score_rollups_table.c.score_sum
+                - removed.c.score_sum,
+                result_count=company_score_rollups_table.c.result_count
+                - removed.c.result_count,
+            )
+            .where(
+                company_score_rollups_table.c.company_id
+                == removed.c.company_id,
+                company_score_rollups_table.c.time_range
+                == removed.c.time_range,
+                company_score_rollups_table.c.bucket_start
+                == removed.c.bucket_start,
+            )
+        )
+
+        await self.session.execute(query)
+
+    async def remove_quiz(self, quiz_id: QuizId) -> None:
+        await self._subtract_scores(
+            quiz_participations_table.c.quiz_id == quiz_id
+        )
+
+    async def remove_company_user(
+        self, company_user_id: CompanyUserId
+    ) -> None:
+        await self._subtract_scores(
+            quiz_participations_table.c.company_user_id == company_user_id
+        )
+
+    async def remove_user(self, user_id: UserId) -> None:
+        company_user_ids = select(company_users_table.c.company_user_id).where(
+            company_users_table.c.user_id == user_id
+        )
+
+        await self._subtract_scores(
+            quiz_participations_table.c.company_user_id.in_(company_user_ids)
+        )
+
+
+class UserQuizStatsMapper(UserQuizStatsGateway):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def _upsert(
+        self,
+        user_id: UserId,
+        quiz_id: QuizId,
+        participated_at: datetime,
+        correct_answers: int,
+        result_count: int,
+    ) -> None:
+        query = pg_insert(user_quiz_stats_table).values(
+            user_id=user_id,
+            quiz_id=quiz_id,
+            score_sum=correct_answers,
+            result_count=result_count,
+            last_completed_at=participated_at.replace(tzinfo=None),
+        )
+        query = query.on_conflict_do_update(
+            index_elements=[
+                user_quiz_stats_table.c.user_id,
+                user_quiz_stats_table.c.quiz_id,
+            ],
+            set_={
+                "score_sum": user_quiz_stats_table.c.score_sum
+                + query.excluded.score_sum,
+                "result_count": user_quiz_stats_table.c.result_count
+                + query.excluded.result_count,
+                "last_completed_at": func.greatest(
+                    user_quiz_stats_table.c.last_completed_at,
+                    query.excluded.last_completed_at,
+                ),
+            },
+        )
+
+        await self.session.execute(query)
+
+    async def add_participation(
+        self, user_id: UserId, quiz_id: QuizId, participated_at: datetime
+    ) -> None:
+        await self._upsert(user_id, quiz_id, participated_at, 0, 0)
+
+    async def add_result(
+        self,
+        user_id: UserId,
+        quiz_id: QuizId,
+        participated_at: datetime,
+        correct_answers: int,
+    ) -> None:
+        await self._upsert(
+            user_id, quiz_id, participated_at, correct_answers, 1
+        )
+
+    async def remove_company_user(
+        self, company_user_id: CompanyUserId
+    ) -> None:
+        # A user is a member of a company at most once, so the stats on
+        # that company's quizzes all come from this company user
+        company_user = (
+            select(
+                company_users_table.c.user_id, company_users_table.c.company_id
+            )
+            .where(company_users_table.c.company_user_id == company_user_id)
+            .subquery()
+        )
+
+        query = delete(user_quiz_stats_table).where(
+            user_quiz_stats_table.c.user_id
+            == select(company_user.c.user_id).scalar_subquery(),
+            user_quiz_stats_table.c.quiz_id.in_(
+                select(quizzes_table.c.quiz_id).where(
+                    quizzes_table.c.company_id
+                    == select(company_user.c.company_id).scalar_subquery()
+                )
+            ),
+        )
+
+        await self.session.execute(query)
+
+    async def last_user_id(self) -> UserId | None:
+        query = select(func.max(company_users_table.c.user_id))
+
+        return await self.session.scalar(query)
+
+    async def company_points(self, company_id: CompanyId) -> dict[UserId, int]:
+        query = (
+            select(
+                user_quiz_stats_table.c.user_id,
+                func.sum(user_quiz_stats_table.c.score_sum).label("points"),
+            )
+            .join(
+                quizzes_table,
+                quizzes_table.c.quiz_id == user_quiz_stats_table.c.quiz_id,
+            )
+            .where(quizzes_table.c.company_id == company_id)
+            .group_by(user_quiz_stats_table.c.user_id)
+            .having(func.sum(user_quiz_stats_table.c.result_count) > 0)
+        )
+
+        result = await self.session.execute(query)
+
+        return {row.user_id: int(row.points) for row in result}
+
+    async def rebuild(self, from_user_id: UserId, to_user_id: UserId) -> int:
+        in_range = and_(
+            company_users_table.c.user_id > from_user_id,
+            company_users_table.c.user_id <= to_user_id,
+        )
+
+        await self.session.execute(
+            delete(user_quiz_stats_table).where(
+                user_quiz_stats_table.c.user_id > from_user_id,
+                user_quiz_stats_table.c.user_id <= to_user_id,
+            )
+        )
+
+        stats = (
+            select(
+                company_users_table.c.user_id,
+                quiz_participations_table.c.quiz_id,
+                func.coalesce(
+                    func.sum(quiz_results_table.c.correct_answers), 0
+                ),
+                func.count(quiz_results_table.c.quiz_result_id),
+                func.max(quiz_participations_table.c.created_at),
+            )
+            .select_from(
+                quiz_participations_table.join(
+                    company_users_table,
+                    quiz_participations_table.c.company_user_id
+                    == company_users_table.c.company_user_id,
+                ).outerjoin(
+                    quiz_results_table,
+                    quiz_results_table.c.quiz_participation_id
+                    == quiz_participations_table.c.quiz_participation_id,
+                )
+            )
+            .where(
+                in_range, quiz_participations_table.c.created_at.is_not(None)
+            )
+            .group_by(
+                company_users_table.c.user_id,
+                quiz_participations_table.c.quiz_id,
+            )
+        )
+
+        result = await self.session.execute(
+            insert(user_quiz_stats_table).from_select(
+                [
+                    "user_id",
+                    "quiz_id",
+                    "score_sum",
+                    "result_count",
+                    "last_completed_at",
+                ],
+                stats,
+            )
+        )
+
+        return result.rowcount
+
+
+class SQLAlchemyQuizResultReader(QuizResultReader):
+    def __init__(self, session: AsyncSession, cache: CacheGateway):
+        self.session = session
+        self.cache = cache
+
+    def _load_model(self, row: RowMapping | dict) -> QuizResultDetail:
+        return QuizResultDetail(
+            quiz_result_id=row["quiz_result_id"],
+            participation_id=row["participation_id"],
+            company_user_id=row["company_user_id"],
+            company_id=row["company_id"],
+            quiz_id=row["quiz_id"],
+            correct_answers=row["correct_answers"],
+        )
+
+    def _select_results(self) -> Select:
+        return (
+            select(
+                quiz_results_table.c.quiz_result_id,
+                quiz_results_table.c.quiz_participation_id.label(
+                    "participation_id"
+                ),
+                quiz_participations_table.c.company_user_id,
+                company_users_table.c.company_id,
+                quiz_participations_table.c.quiz_id,
+                quiz_results_table.c.correct_answers,
+            )
+            .select_from(
+                quiz_results_table.join(
+                    quiz_participations_table,
+                    quiz_results_table.c.quiz_participation_id
+                    == quiz_participations_table.c.quiz_participation_id,
+                ).join(
+                    company_users_table,
+                    quiz_participations_table.c.company_user_id
+                    == company_users_table.c.company_user_id,
+                )
+            )
+            .distinct(quiz_results_table.c.quiz_participation_id)
+            .order_by(
+                quiz_results_table.c.quiz_participation_id,
+                quiz_results_table.c.quiz_result_id.desc(),
+            )
+        )
+
+    async def _set_cache(
+        self, company_id: CompanyId, results: list[QuizResultDetail]
+    ) -> None:
+        cache_data = {
+            get_quiz_result_cache_key(result.participation_id): asdict(result)
+            for result in results
+        }
+
+        await self.cache.set_many(cache_data, QUIZ_RESULT_TTL)
+        await self.cache.set_member_key(
+            get_member_key(company_id), *cache_data.keys()
+        )
+
+    async def by_participation(
+        self, participation_id: QuizParticipationId
+    ) -> QuizResultDetail | None:
+        cache_key = get_quiz_result_cache_key(participation_id)
+
+        cache_data = await self.cache.get_cache(cache_key)
+        if cache_data:
+            return self._load_model(cache_data)
+
+        query = self._select_results().where(
+            quiz_results_table.c.quiz_participation_id == participation_id
+        )
+
+        result = await self.session.execute(query)
+        row = result.mappings().one_or_none()
+        if not row:
+            return None
+
+        quiz_result = self._load_model(row)
+        await self._set_cache(quiz_result.company_id, [quiz_result])
+
+        return quiz_result
+
+    async def by_company(
+        self, company_id: CompanyId
+    ) -> list[QuizResultDetail]:
+        member_key = get_member_key(company_id)
+        loaded_key = get_quiz_results_loaded_key(company_id)
+        participation_keys = list(
+            await self.cache.get_member_data(member_key) or ()
+        )
+
+        # The loaded marker joins the member set only after a full load
+        # from Postgres, so a partially cached or evicted set is reloaded
+        if loaded_key in participation_keys:
+            cached_data = await self.cache.get_many(participation_keys)
+
+            if all(cached_data):
+                return [
+                    self._load_model(data)
+                    for key, data in zip(
+                        participation_keys, cached_data, strict=True
+                    )
+                    if key != loaded_key
+                ]
+
+            expired_keys = [
+                key
+                for key, data in zip(
+                    participation_keys, cached_data, strict=True
+                )
+                if not data
+            ]
+            await self.cache.remove_member_keys(member_key, expired_keys)
+
+        query = self._select_results().where(
+            company_users_table.c.company_id == company_id
+        )
+
+        result = await self.session.execute(query)
+        quiz_results = [self._load_model(row) for row in result.mappings()]
+
+        await self._set_cache(company_id, quiz_results)
+        await self.cache.set_cache(
+            loaded_key, {"company_id": company_id}, QUIZ_RESULT_TTL
+        )
+        await self.cache.set_member_key(member_key, loaded_key)
+
+        return quiz_results
+
+
+class SQLAlchemyQuizReader(QuizReader):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    def _load_models(
+        self, quiz_rows: list[RowMapping], question_rows: list[RowMapping]
+    ) -> list[QuizDetail]:
+        quizzes = {
+            row["quiz_id"]: QuizDetail(
+                quiz_id=row["quiz_id"],
+                title=row["title"],
+                description=row["description"],
+                participation_count=row["participation_count"],
+                questions=[],
             )
+            for row in quiz_rows
+        }
+
+        questions: dict[int, QuestionDetail] = {}
+        for row in question_rows:
+            question_id = row["question_id"]
+            question = questions.get(question_id)
 
             if not question:
                 question = QuestionDetail(
@@ -183,7 +697,8 @@ class SQLAlchemyQuizReader(QuizReader):
                     title=row["question_title"],
                     answers=[],
                 )
-                quiz.questions.append(question)
+                questions[question_id] = question
+                quizzes[row["quiz_id"]].questions.append(question)
 
             answer = AnswerDetail(
                 answer_id=row["answer_id"],
@@ -194,25 +709,48 @@ class SQLAlchemyQuizReader(QuizReader):
 
         return list(quizzes.values())
 
-    async def get_many(
+    def _make_filters(self, query: Select, filters: QuizFilters) -> Select:
+        if filters and filters.company_id:
+            query = query.where(
+                quizzes_table.c.company_id == filters.company_id
+            )
+
+        return query
+
+    def _quizzes_query(
         self, filters: QuizFilters, pagination: Pagination
+    ) -> Select:
+        quizzes_query = select(
+            quizzes_table.c.quiz_id,
+            quizzes_table.c.title,
+            quizzes_table.c.description,
+            quizzes_table.c.participation_count,
+        )
+
+        quizzes_query = self._make_filters(quizzes_query, filters)
+
+        return paginate(
+            quizzes_query,
+            quizzes_table.c.created_at,
+            quizzes_table.c.quiz_id,
+            pagination,
+        )
+
+    async def _load_quizzes(
+        self, quiz_rows: Sequence[RowMapping]
     ) -> list[QuizDetail]:
-        query = (
+        if not quiz_rows:
+            return []
+
+        questions_query = (
             select(
-                quizzes_table.c.quiz_id,
-                quizzes_table.c.title,
-                quizzes_table.c.description,
-                quizzes_table.c.participation_count,
+                questions_table.c.quiz_id,
                 questions_table.c.question_id,
                 questions_table.c.title.label("question_title"),
                 answers_table.c.answer_id,
                 answers_table.c.text.label("answer_text"),
                 answers_table.c.is_correct,
             )
-            .join(
-                questions_table,
-                and_(quizzes_table.c.quiz_id == questions_table.c.quiz_id),
-            )
             .join(
                 answers_table,
                 and_(
@@ -220,95 +758,142 @@ class SQLAlchemyQuizReader(QuizReader):
                     == answers_table.c.question_id
                 ),
             )
-        )
-
-        if filters and filters.company_id:
-            query = query.where(
-                quizzes_table.c.company_id == filters.company_id
+            .where(
+                questions_table.c.quiz_id.in_(
+                    [row["quiz_id"] for row in quiz_rows]
+                )
             )
+            .order_by(questions_table.c.question_id, answers_table.c.answer_id)
+        )
 
-        if pagination.order is SortOrder.ASC:
-            query = query.order_by(quizzes_table.c.created_at.asc())
-        else:
-            query = query.order_by(quizzes_table.c.created_at.desc())
+        result = await self.session.execute(questions_query)
+        question_rows = result.mappings().all()
 
-        if pagination.offset is not None:
-            query = query.offset(pagination.offset)
-        if pagination.limit is not None:
-            query = query.limit(pagination.limit)
+        return self._load_models(list(quiz_rows), list(question_rows))
 
-        result = await self.session.execute(query)
-        rows = result.mappings().all()
+    async def page(
+        self, filters: QuizFilters, pagination: Pagination
+    ) -> Page[QuizDetail]:
+        page = await fetch_page(
+            self.session,
+            self._quizzes_query(filters, pagination),
+            self._total_query(filters),
+            pagination,
+        )
 
-        return self._load_models(list(rows))
+        return Page(
+            await self._load_quizzes(page.items),
+            page.total,
+            page.next_cursor,
+        )
 
-    async def total(self, filters: QuizFilters) -> int:
+    def _total_query(self, filters: QuizFilters) -> Select:
         query = select(func.count(quizzes_table.c.quiz_id))
 
-        if filters and filters.company_id:
-            query = query.where(
-                quizzes_table.c.company_id == filters.company_id
-            )
+        return self._make_filters(query, filters)
 
-        total: int = await self.session.scalar(query)
-
-        return total
-
-    async def total_average_user_score(
-        self, company_user_id: CompanyUserId, company_id: CompanyId
-    ) -> float:
-        total_possible_correct_answers_query = (
-            select(func.count(answers_table.c.answer_id))
-            .join(
-                questions_table,
-                and_(
-                    questions_table.c.question_id
-                    == answers_table.c.question_id
+    def _possible_correct_answers_query(
+        self, company_id: CompanyId
+    ) -> Subquery:
+        return (
+            select(
+                questions_table.c.quiz_id,
+                func.count(answers_table.c.answer_id).label(
+                    "possible_correct_answers"
                 ),
             )
+            .join(
+                answers_table,
+                answers_table.c.question_id == questions_table.c.question_id,
+            )
             .join(
                 quizzes_table,
-                and_(quizzes_table.c.quiz_id == questions_table.c.quiz_id),
+                quizzes_table.c.quiz_id == questions_table.c.quiz_id,
             )
             .where(
                 quizzes_table.c.company_id == company_id,
                 answers_table.c.is_correct.is_(True),
             )
-            .label("total_possible_correct_answers")
+            .group_by(questions_table.c.quiz_id)
+            .subquery("possible")
         )
 
-        user_correct_answers_query = (
-            select(func.count(quiz_results_table.c.correct_answers))
-            .join(
-                quiz_participations_table,
-                and_(
-                    quiz_participations_table.c.quiz_participation_id
-                    == quiz_results_table.c.quiz_participation_id
-                ),
-            )
-            .where(
-                and_(
-                    quiz_participations_table.c.company_user_id
-                    == company_user_id,
-                    quiz_participations_table.c.quiz_id
-                    == quizzes_table.c.quiz_id,
-                    quizzes_table.c.company_id == company_id,
-                )
-            )
-            .label("user_correct_answers")
-        )
+    def _accuracy_query(self, company_id: CompanyId) -> Select:
+        # Every result is measured against the correct answers of its own
+        # quiz, so retakes and untaken quizzes do not skew the percentage
+        possible = self._possible_correct_answers_query(company_id)
 
-        query = select(
+        return select(
             (
-                cast(user_correct_answers_query, Float)
-                / cast(total_possible_correct_answers_query, Float)
+                cast(func.sum(quiz_results_table.c.correct_answers), Float)
+                / cast(
+                    func.nullif(
+                        func.sum(possible.c.possible_correct_answers), 0
+                    ),
+                    Float,
+                )
                 * 100
             ).label("accuracy_percentage")
+        ).select_from(
+            quiz_results_table.join(
+                quiz_participations_table,
+                quiz_participations_table.c.quiz_participation_id
+                == quiz_results_table.c.quiz_participation_id,
+            ).join(
+                possible,
+                possible.c.quiz_id == quiz_participations_table.c.quiz_id,
+            )
+        )
+
+    async def total_average_user_score(
+        self, company_user_id: CompanyUserId, company_id: CompanyId
+    ) -> float | None:
+        query = self._accuracy_query(company_id).where(
+            quiz_participations_table.c.company_user_id == company_user_id
         )
 
         result = await self.session.execute(query)
-        accuracy_percentage = result.scalar()
-        return accuracy_percentage
+
+        return result.scalar()
+
+    async def total_average_users_scores(
+        self,
+        company_id: CompanyId,
+        company_user_ids: list[CompanyUserId] | None = None,
+    ) -> list[UserAccuracy]:
+        query = (
+            self._accuracy_query(company_id)
+            .add_columns(
+                company_users_table.c.company_user_id,
+                company_users_table.c.user_id,
+            )
+            .join(
+                company_users_table,
+                company_users_table.c.company_user_id
+                == quiz_participations_table.c.company_user_id,
+            )
+            .where(company_users_table.c.company_id == company_id)
+            .group_by(
+                company_users_table.c.company_user_id,
+                company_users_table.c.user_id,
+            )
+        )
+
+        if company_user_ids is not None:
+            query = query.where(
+                company_users_table.c.company_user_id.in_(company_user_ids)
+            )
+
+        result = await self.session.execute(query)
+
+        return [
+            UserAccuracy(
+                company_user_id=row.company_user_id,
+                user_id=row.user_id,
+                accuracy=row.accuracy_percentage,
+            )
+            for row in result
+        ]
 
     async def total_average(self) -> float:
         total_possible_correct_answers_query = (
@@ -335,25 +920,10 @@ class SQLAlchemyQuizReader(QuizReader):
         return average_score_percentage
 
     async def get_overall_rating(self, user_id: UserId) -> Decimal:
-        query = (
-            select(
-                func.avg(quiz_results_table.c.correct_answers).label(
-                    "overall_rating"
-                )
-            )
-            .select_from(
-                quiz_results_table.join(
-                    quiz_participations_table,
-                    quiz_results_table.c.quiz_participation_id
-                    == quiz_participations_table.c.quiz_participation_id,
-                ).join(
-                    company_users_table,
-                    quiz_participations_table.c.company_user_id
-                    == company_users_table.c.company_user_id,
-                )
-            )
-            .where(company_users_table.c.user_id == user_id)
-        )
+        query = select(
+            cast(func.sum(user_quiz_stats_table.c.score_sum), Numeric)
+            / func.nullif(func.sum(user_quiz_stats_table.c.result_count), 0)
+        ).where(user_quiz_stats_table.c.user_id == user_id)
 
         result = await self.session.execute(query)
 
@@ -365,33 +935,22 @@ class SQLAlchemyQuizReader(QuizReader):
         start_date: datetime,
         end_date: datetime,
     ) -> list[QuizAverage]:
-        query = (
-            select(
-                quiz_participations_table.c.quiz_id,
-                func.avg(quiz_results_table.c.correct_answers).label(
-                    "average_score"
-                ),
-            )
-            .select_from(
-                quiz_results_table.join(
-                    quiz_participations_table,
-                    quiz_results_table.c.quiz_participation_id
-                    == quiz_participations_table.c.quiz_participation_id,
-                ).join(
-                    company_users_table,
-                    quiz_participations_table.c.company_user_id
-                    == company_users_table.c.company_user_id,
-                )
-            )
-            .where(
-                company_users_table.c.user_id == user_id,
-                between(
-                    quiz_participations_table.c.created_at,
-                    start_date,
-                    end_date,
-                ),
-            )
-            .group_by(quiz_participations_table.c.quiz_id)
+        # The period applies to the last participation in each quiz, as the
+        # aggregate keeps no per-result timestamps
+        query = select(
+            user_quiz_stats_table.c.quiz_id,
+            (
+                cast(user_quiz_stats_table.c.score_sum, Numeric)
+                / user_quiz_stats_table.c.result_count
+            ).label("average_score"),
+        ).where(
+            user_quiz_stats_table.c.user_id == user_id,
+            user_quiz_stats_table.c.result_count > 0,
+            between(
+                user_quiz_stats_table.c.last_completed_at,
+                start_date,
+                end_date,
+            ),
         )
 
         result = await self.session.execute(query)
@@ -405,32 +964,18 @@ class SQLAlchemyQuizReader(QuizReader):
     async def get_all_last_quiz_completion_times(
         self, user_id: UserId
     ) -> list[LastQuizCompletionTimes]:
-        query = (
-            select(
-                quiz_participations_table.c.quiz_id,
-                func.max(quiz_participations_table.c.created_at).label(
-                    "last_completed"
-                ),
-            )
-            .select_from(
-                quiz_participations_table.join(
-                    company_users_table,
-                    quiz_participations_table.c.company_user_id
-                    == company_users_table.c.company_user_id,
-                )
-            )
-            .where(company_users_table.c.user_id == user_id)
-            .group_by(quiz_participations_table.c.quiz_id)
-        )
+        query = select(
+            user_quiz_stats_table.c.quiz_id,
+            user_quiz_stats_table.c.last_completed_at,
+        ).where(user_quiz_stats_table.c.user_id == user_id)
 
         result = await self.session.execute(query)
-        rows = result.fetchall()
 
         return [
             LastQuizCompletionTimes(
-                quiz_id=row.quiz_id, completion_data=row.last_completed
+                quiz_id=row.quiz_id, completion_data=row.last_completed_at
             )
-            for row in rows
+            for row in result
         ]
 
     async def get_company_average_scores_over_time(
@@ -438,39 +983,34 @@ class SQLAlchemyQuizReader(QuizReader):
     ) -> list[AverageScore]:
         query = (
             select(
-                func.date_trunc(
-                    time_range, quiz_participations_table.c.created_at
-                ).label("time_range"),
-                func.avg(quiz_results_table.c.correct_answers).label(
-                    "average_score"
-                ),
+                company_score_rollups_table.c.bucket_start,
+                (
+                    cast(company_score_rollups_table.c.score_sum, Numeric)
+                    / company_score_rollups_table.c.result_count
+                ).label("average_score"),
             )
-            .select_from(
-                quiz_results_table.join(
-                    quiz_participations_table,
-                    quiz_results_table.c.quiz_participation_id
-                    == quiz_participations_table.c.quiz_participation_id,
-                ).join(
-                    quizzes_table,
-                    quiz_participations_table.c.quiz_id
-                    == quizzes_table.c.quiz_id,
-                )
+            .where(
+                company_score_rollups_table.c.company_id == company_id,
+                company_score_rollups_table.c.time_range == time_range,
+                company_score_rollups_table.c.result_count > 0,
             )
-            .where(quizzes_table.c.company_id == company_id)
-            .group_by("time_range")
-            .order_by("time_range")
+            .order_by(company_score_rollups_table.c.bucket_start)
         )
 
         result = await self.session.execute(query)
-        rows = result.fetchall()
 
         return [
-            AverageScore(start_date=row.time_range, average=row.average_score)
-            for row in rows
+            AverageScore(
+                start_date=row.bucket_start, average=row.average_score
+            )
+            for row in result
         ]
 
     async def get_company_user_quiz_average_scores(
-        self, company_user_id: CompanyUserId, time_range: TimeRange
+        self,
+        company_user_id: CompanyUserId,
+        company_id: CompanyId,
+        time_range: TimeRange,
     ) -> list[AverageScore]:
         query = (
             select(
@@ -488,12 +1028,15 @@ class SQLAlchemyQuizReader(QuizReader):
                     quiz_results_table.c.quiz_participation_id
                     == quiz_participations_table.c.quiz_participation_id,
                 ).join(
-                    company_users_table,
-                    quiz_participations_table.c.company_user_id
-                    == company_users_table.c.company_user_id,
+                    quizzes_table,
+                    quiz_participations_table.c.quiz_id
+                    == quizzes_table.c.quiz_id,
                 )
             )
-            .where(company_users_table.c.user_id == company_user_id)
+            .where(
+                quiz_participations_table.c.company_user_id == company_user_id,
+                quizzes_table.c.company_id == company_id,
+            )
             .group_by(quiz_participations_table.c.quiz_id, "time_range")
             .order_by(quiz_participations_table.c.quiz_id, "time_range")
         )
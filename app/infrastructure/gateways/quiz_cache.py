@@ -0,0 +1,212 @@
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from decimal import Decimal
+from typing import TypeVar
+
+from app.core.common.pagination import Page, Pagination
+from app.core.entities.company import CompanyId, CompanyUserId
+from app.core.entities.user import UserId
+from app.core.interfaces.cache import CacheGateway
+from app.core.interfaces.quiz_gateways import (
+    AverageScore,
+    LastQuizCompletionTimes,
+    QuizAverage,
+    QuizDetail,
+    QuizFilters,
+    QuizReader,
+    TimeRange,
+    UserAccuracy,
+    UserLastAttempt,
+)
+from app.infrastructure.cache.metrics import CacheStats
+from app.infrastructure.gateways.quiz import SQLAlchemyQuizReader
+from app.utils.get_cache_key import (
+    ANALYTICS_TTL,
+    TOTAL_AVERAGE_TTL,
+    get_analytics_cache_key,
+    get_analytics_member_key,
+    get_total_average_cache_key,
+)
+
+T = TypeVar("T")
+
+
+# Company entries are registered under the company analytics member key,
+# which commands clear whenever results or memberships change
+class CachedQuizReader(QuizReader):
+    def __init__(
+        self,
+        reader: SQLAlchemyQuizReader,
+        cache: CacheGateway,
+        stats: CacheStats,
+    ):
+        self.reader = reader
+        self.cache = cache
+        self.stats = stats
+
+    async def _read_through(
+        self,
+        query: str,
+        cache_key: str,
+        load: Callable[[], Awaitable[T]],
+        dump: Callable[[T], object],
+        restore: Callable[[object], T],
+        ttl: int,
+        member_key: str | None = None,
+    ) -> T:
+        cached = await self.cache.get_cache(cache_key)
+        if cached is not None:
+            self.stats.hit(query)
+
+            return restore(cached["result"])
+
+        self.stats.miss(query)
+
+        result = await load()
+
+        await self.cache.set_cache(cache_key, {"result": dump(result)}, ttl)
+        if member_key:
+            await self.cache.set_member_key(member_key, cache_key)
+
+        return result
+
+    def _dump_average_scores(self, scores: list[AverageScore]) -> list:
+        return [
+            {
+                "start_date": score.start_date.isoformat(),
+                "average": str(score.average),
+            }
+            for score in scores
+        ]
+
+    def _load_average_scores(self, data: list) -> list[AverageScore]:
+        return [
+            AverageScore(
+                start_date=datetime.fromisoformat(score["start_date"]),
+                average=Decimal(score["average"]),
+            )
+            for score in data
+        ]
+
+    def _dump_last_attempts(self, attempts: list[UserLastAttempt]) -> list:
+        return [
+            {
+                "user_id": attempt.user_id,
+                "last_attempt": attempt.last_attempt.isoformat(),
+            }
+            for attempt in attempts
+        ]
+
+    def _load_last_attempts(self, data: list) -> list[UserLastAttempt]:
+        return [
+            UserLastAttempt(
+                user_id=attempt["user_id"],
+                last_attempt=datetime.fromisoformat(attempt["last_attempt"]),
+            )
+            for attempt in data
+        ]
+
+    async def get_company_average_scores_over_time(
+        self, company_id: CompanyId, time_range: TimeRange
+    ) -> list[AverageScore]:
+        query = "company_average_scores"
+
+        return await self._read_through(
+            query,
+            get_analytics_cache_key(
+                company_id, query, TimeRange(time_range).value
+            ),
+            lambda: self.reader.get_company_average_scores_over_time(
+                company_id, time_range
+            ),
+            self._dump_average_scores,
+            self._load_average_scores,
+            ANALYTICS_TTL,
+            get_analytics_member_key(company_id),
+        )
+
+    async def get_company_user_quiz_average_scores(
+        self,
+        company_user_id: CompanyUserId,
+        company_id: CompanyId,
+        time_range: TimeRange,
+    ) -> list[AverageScore]:
+        query = "company_user_average_scores"
+
+        return await self._read_through(
+            query,
+            get_analytics_cache_key(
+                company_id,
+                query,
+                company_user_id,
+                TimeRange(time_range).value,
+            ),
+            lambda: self.reader.get_company_user_quiz_average_scores(
+                company_user_id, company_id, time_range
+            ),
+            self._dump_average_scores,
+            self._load_average_scores,
+            ANALYTICS_TTL,
+            get_analytics_member_key(company_id),
+        )
+
+    async def get_company_users_last_attempt(
+        self, company_id: CompanyId
+    ) -> list[UserLastAttempt]:
+        query = "company_users_last_attempt"
+
+        return await self._read_through(
+            query,
+            get_analytics_cache_key(company_id, query),
+            lambda: self.reader.get_company_users_last_attempt(company_id),
+            self._dump_last_attempts,
+            self._load_last_attempts,
+            ANALYTICS_TTL,
+            get_analytics_member_key(company_id),
+        )
+
+    async def total_average(self) -> float:
+        return await self._read_through(
+            "total_average",
+            get_total_average_cache_key(),
+            self.reader.total_average,
+            lambda average: average,
+            lambda average: average,
+            TOTAL_AVERAGE_TTL,
+        )
+
+    async def page(
+        self, filters: QuizFilters, pagination: Pagination
+    ) -> Page[QuizDetail]:
+        return await self.reader.page(filters, pagination)
+
+    async def total_average_user_score(
+        self, company_user_id: CompanyUserId, company_id: CompanyId
+    ) -> float | None:
+        return await self.reader.total_average_user_score(
+            company_user_id, company_id
+        )
+
+    async def total_average_users_scores(
+        self,
+        company_id: CompanyId,
+        company_user_ids: list[CompanyUserId] | None = None,
+    ) -> list[UserAccuracy]:
+        return await self.reader.total_average_users_scores(
+            company_id, company_user_ids
+        )
+
+    async def get_overall_rating(self, user_id: UserId) -> Decimal:
+        return await self.reader.get_overall_rating(user_id)
+
+    async def get_user_quiz_averages(
+        self, user_id: UserId, start_data: datetime, end_data: datetime
+    ) -> list[QuizAverage]:
+        return await self.reader.get_user_quiz_averages(
+            user_id, start_data, end_data
+        )
+
+    async def get_all_last_quiz_completion_times(
+        self, user_id: UserId
+    ) -> list[LastQuizCompletionTimes]:
+        return await self.reader.get_all_last_quiz_completion_times(user_id)
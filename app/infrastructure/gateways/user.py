@@ -1,11 +1,9 @@
-from typing import Iterable
-
 from sqlalchemy import RowMapping, Select, delete, exists, func, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.commands.user.errors import UnexpectedError
-from app.core.common.pagination import Pagination, SortOrder
+from app.core.common.pagination import Page, Pagination
 from app.core.entities.user import User, UserId
 from app.core.entities.value_objects import UserEmail
 from app.core.interfaces.user_gateways import (
@@ -14,6 +12,7 @@ from app.core.interfaces.user_gateways import (
     UserGateway,
     UserReader,
 )
+from app.infrastructure.gateways.pagination import fetch_page, paginate
 from app.infrastructure.persistence.models.user import users_table
 
 
@@ -37,11 +36,7 @@ class UserMapper(UserGateway):
             raise UnexpectedError from error
 
     async def by_id(self, user_id: UserId) -> User | None:
-        query = select(User).where(users_table.c.user_id == user_id)
-
-        result = await self.session.execute(query)
-
-        return result.scalar_one_or_none()
+        return await self.session.get(User, user_id)
 
     async def by_email(self, email: UserEmail) -> User | None:
         query = select(User).where(users_table.c.user_email == email.to_row())
@@ -101,9 +96,9 @@ class SQLAlchemyUserReader(UserReader):
 
         return None if not row else self._load_user(row)
 
-    async def get_users(
+    def _users_query(
         self, filters: UserFilters, pagination: Pagination
-    ) -> Iterable[UserDetail]:
+    ) -> Select:
         query = select(
             users_table.c.user_id,
             users_table.c.user_email,
@@ -114,26 +109,30 @@ class SQLAlchemyUserReader(UserReader):
         if filters:
             query = self._make_filters(query, filters)
 
-        if pagination.order is SortOrder.ASC:
-            query = query.order_by(users_table.c.created_at.asc())
-        else:
-            query = query.order_by(users_table.c.created_at.desc())
-
-        if pagination.offset is not None:
-            query = query.offset(pagination.offset)
-        if pagination.limit is not None:
-            query = query.limit(pagination.limit)
-
-        result = await self.session.execute(query)
-
-        return [self._load_user(row) for row in result.mappings()]
+        return paginate(
+            query, users_table.c.created_at, users_table.c.user_id, pagination
+        )
 
-    async def total(self, filters: UserFilters) -> int:
+    def _total_query(self, filters: UserFilters) -> Select:
         query = select(func.count(users_table.c.user_id))
 
         if filters:
             query = self._make_filters(query, filters)
 
-        total: int = await self.session.scalar(query)
+        return query
 
-        return total
+    async def page(
+        self, filters: UserFilters, pagination: Pagination
+    ) -> Page[UserDetail]:
+        page = await fetch_page(
+            self.session,
+            self._users_query(filters, pagination),
+            self._total_query(filters),
+            pagination,
+        )
+
+        return Page(
+            [self._load_user(row) for row in page.items],
+            page.total,
+            page.next_cursor,
+        )
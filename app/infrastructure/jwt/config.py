@@ -11,3 +11,5 @@ class JWTConfig:
 class Auth0Config:
     domain: str
     audience: str
+    jwks_ttl: int = 600
+    jwks_file: str | None = None
@@ -0,0 +1,113 @@
+import asyncio
+import json
+import logging
+import time
+from abc import abstractmethod
+from pathlib import Path
+from typing import Any, Protocol
+
+from jwt import PyJWK, PyJWKClient, PyJWKSet
+from jwt.exceptions import PyJWKClientError, PyJWKError, PyJWKSetError
+
+from app.infrastructure.jwt.config import Auth0Config
+from app.infrastructure.jwt.exception import JWTDecodeError
+
+# Unknown kids and failed refreshes never trigger refetching more often
+# than this, in seconds
+MIN_REFRESH_INTERVAL = 30
+
+
+class JWKSource(Protocol):
+    @abstractmethod
+    def fetch(self) -> dict[str, Any]: ...
+
+
+class RemoteJWKSource(JWKSource):
+    def __init__(self, url: str):
+        self.client = PyJWKClient(url, cache_jwk_set=False, cache_keys=False)
+
+    def fetch(self) -> dict[str, Any]:
+        return self.client.fetch_data()
+
+
+class FileJWKSource(JWKSource):
+    def __init__(self, path: str):
+        self.path = Path(path)
+
+    def fetch(self) -> dict[str, Any]:
+        return json.loads(self.path.read_text())
+
+
+def get_jwk_source(auth0_config: Auth0Config) -> JWKSource:
+    if auth0_config.jwks_file:
+        return FileJWKSource(auth0_config.jwks_file)
+
+    return RemoteJWKSource(
+        f"https://{auth0_config.domain}/.well-known/jwks.json"
+    )
+
+
+class JWKSCache:
+    def __init__(self, source: JWKSource, auth0_config: Auth0Config):
+        self.source = source
+        self.ttl = auth0_config.jwks_ttl
+
+        self.keys: dict[str, PyJWK] = {}
+        self.fetched_at: float | None = None
+        self.attempted_at: float | None = None
+        self.lock = asyncio.Lock()
+
+    def _is_expired(self) -> bool:
+        return (
+            self.fetched_at is None
+            or time.monotonic() - self.fetched_at >= self.ttl
+        )
+
+    def _can_refresh(self) -> bool:
+        return (
+            self.attempted_at is None
+            or time.monotonic() - self.attempted_at >= MIN_REFRESH_INTERVAL
+        )
+
+    async def _refresh(self) -> None:
+        self.attempted_at = time.monotonic()
+
+        try:
+            data = await asyncio.to_thread(self.source.fetch)
+            jwk_set = PyJWKSet.from_dict(data)
+        except (
+            PyJWKClientError,
+            PyJWKError,
+            PyJWKSetError,
+            OSError,
+            ValueError,
+        ) as err:
+            raise JWTDecodeError from err
+
+        self.keys = {key.key_id: key for key in jwk_set.keys}
+        self.fetched_at = time.monotonic()
+
+    async def get_signing_key(self, kid: str) -> PyJWK:
+        key = self.keys.get(kid)
+        if key and not self._is_expired():
+            return key
+
+        async with self.lock:
+            key = self.keys.get(kid)
+            if (self._is_expired() or not key) and self._can_refresh():
+                try:
+                    await self._refresh()
+                except JWTDecodeError:
+                    # Keys of the last good keyset stay valid until the
+                    # identity provider is reachable again
+                    if not key:
+                        raise
+
+                    logging.warning("JWKS refresh failed, using cached keys")
+                else:
+                    key = self.keys.get(kid)
+
+        if not key:
+            raise JWTDecodeError
+
+        return key
@@ -2,10 +2,10 @@ from abc import abstractmethod
 from typing import Any, Protocol, TypeAlias
 
 import jwt
-from jwt import PyJWKClient
 
 from app.infrastructure.jwt.config import Auth0Config, JWTConfig
 from app.infrastructure.jwt.exception import JWTDecodeError, JWTExpiredError
+from app.infrastructure.jwt.jwks import JWKSCache
 
 JWTPayload: TypeAlias = dict[str, Any]
 JWTToken: TypeAlias = str
@@ -19,13 +19,19 @@ class JWTProcessor(Protocol):
     def decode(self, token: JWTToken) -> JWTPayload: ...
 
     @abstractmethod
-    def decode_oauth(self, token: JWTToken) -> JWTPayload: ...
+    async def decode_oauth(self, token: JWTToken) -> JWTPayload: ...
 
 
 class PyJWTProcessor(JWTProcessor):
-    def __init__(self, jwt_config: JWTConfig, auth0_config: Auth0Config):
+    def __init__(
+        self,
+        jwt_config: JWTConfig,
+        auth0_config: Auth0Config,
+        jwks_cache: JWKSCache,
+    ):
         self.jwt_config = jwt_config
         self.auth0_config = auth0_config
+        self.jwks_cache = jwks_cache
 
     def encode(self, payload: JWTPayload) -> JWTToken:
         return jwt.encode(
@@ -44,12 +50,13 @@ class PyJWTProcessor(JWTProcessor):
         except jwt.DecodeError as exc:
             raise JWTDecodeError from exc
 
-    def decode_oauth(self, token: JWTToken) -> JWTPayload:
-        jwt_client = PyJWKClient(
-            f"https://{self.auth0_config.domain}/.well-known/jwks.json"
-        )
+    async def decode_oauth(self, token: JWTToken) -> JWTPayload:
+        try:
+            kid = jwt.get_unverified_header(token).get("kid")
+        except jwt.DecodeError as exc:
+            raise JWTDecodeError from exc
 
-        key = jwt_client.get_signing_key_from_jwt(token)
+        key = await self.jwks_cache.get_signing_key(kid)
 
         try:
             return jwt.decode(
@@ -0,0 +1,170 @@
+"""secondary indexes
+
+Revision ID: 5c1f0e7a9b2d
+Revises: ad268d31dbfd
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5c1f0e7a9b2d"
+down_revision: Union[str, None] = "ad268d31dbfd"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        op.f("ix_users_created_at"),
+        "users",
+        ["created_at"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_companies_created_at"),
+        "companies",
+        ["created_at"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_companies_owner_id"),
+        "companies",
+        ["owner_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_company_users_company_id_created_at"),
+        "company_users",
+        ["company_id", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_company_users_user_id"),
+        "company_users",
+        ["user_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_invitations_company_id_created_at"),
+        "invitations",
+        ["company_id", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_invitations_user_id_created_at"),
+        "invitations",
+        ["user_id", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_quizzes_company_id_created_at"),
+        "quizzes",
+        ["company_id", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_user_requests_company_id_created_at"),
+        "user_requests",
+        ["company_id", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_user_requests_user_id_created_at"),
+        "user_requests",
+        ["user_id", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_notifications_send_to_created_at"),
+        "notifications",
+        ["send_to", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_notifications_send_to_status_created_at"),
+        "notifications",
+        ["send_to", "status", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_questions_quiz_id"),
+        "questions",
+        ["quiz_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_quiz_participations_company_user_id_quiz_id_created_at"),
+        "quiz_participations",
+        ["company_user_id", "quiz_id", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_quiz_participations_quiz_id_created_at"),
+        "quiz_participations",
+        ["quiz_id", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_answers_question_id"),
+        "answers",
+        ["question_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_quiz_results_quiz_participation_id"),
+        "quiz_results",
+        ["quiz_participation_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_quiz_results_quiz_participation_id"),
+        table_name="quiz_results",
+    )
+    op.drop_index(op.f("ix_answers_question_id"), table_name="answers")
+    op.drop_index(
+        op.f("ix_quiz_participations_quiz_id_created_at"),
+        table_name="quiz_participations",
+    )
+    op.drop_index(
+        op.f("ix_quiz_participations_company_user_id_quiz_id_created_at"),
+        table_name="quiz_participations",
+    )
+    op.drop_index(op.f("ix_questions_quiz_id"), table_name="questions")
+    op.drop_index(
+        op.f("ix_notifications_send_to_status_created_at"),
+        table_name="notifications",
+    )
+    op.drop_index(
+        op.f("ix_notifications_send_to_created_at"), table_name="notifications"
+    )
+    op.drop_index(
+        op.f("ix_user_requests_user_id_created_at"), table_name="user_requests"
+    )
+    op.drop_index(
+        op.f("ix_user_requests_company_id_created_at"),
+        table_name="user_requests",
+    )
+    op.drop_index(
+        op.f("ix_quizzes_company_id_created_at"), table_name="quizzes"
+    )
+    op.drop_index(
+        op.f("ix_invitations_user_id_created_at"), table_name="invitations"
+    )
+    op.drop_index(
+        op.f("ix_invitations_company_id_created_at"), table_name="invitations"
+    )
+    op.drop_index(op.f("ix_company_users_user_id"), table_name="company_users")
+    op.drop_index(
+        op.f("ix_company_users_company_id_created_at"),
+        table_name="company_users",
+    )
+    op.drop_index(op.f("ix_companies_owner_id"), table_name="companies")
+    op.drop_index(op.f("ix_companies_created_at"), table_name="companies")
+    op.drop_index(op.f("ix_users_created_at"), table_name="users")
@@ -0,0 +1,207 @@
+"""keyset pagination indexes
+
+Revision ID: 8d3a6b2e4f1c
+Revises: 5c1f0e7a9b2d
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d3a6b2e4f1c"
+down_revision: Union[str, None] = "5c1f0e7a9b2d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index(op.f("ix_users_created_at"), table_name="users")
+    op.create_index(
+        op.f("ix_users_created_at_user_id"),
+        "users",
+        ["created_at", "user_id"],
+        unique=False,
+    )
+    op.drop_index(op.f("ix_companies_created_at"), table_name="companies")
+    op.create_index(
+        op.f("ix_companies_created_at_company_id"),
+        "companies",
+        ["created_at", "company_id"],
+        unique=False,
+    )
+    op.drop_index(
+        op.f("ix_company_users_company_id_created_at"),
+        table_name="company_users",
+    )
+    op.create_index(
+        op.f("ix_company_users_company_id_created_at_company_user_id"),
+        "company_users",
+        ["company_id", "created_at", "company_user_id"],
+        unique=False,
+    )
+    op.drop_index(
+        op.f("ix_invitations_user_id_created_at"), table_name="invitations"
+    )
+    op.create_index(
+        op.f("ix_invitations_user_id_created_at_invitation_id"),
+        "invitations",
+        ["user_id", "created_at", "invitation_id"],
+        unique=False,
+    )
+    op.drop_index(
+        op.f("ix_invitations_company_id_created_at"), table_name="invitations"
+    )
+    op.create_index(
+        op.f("ix_invitations_company_id_created_at_invitation_id"),
+        "invitations",
+        ["company_id", "created_at", "invitation_id"],
+        unique=False,
+    )
+    op.drop_index(
+        op.f("ix_user_requests_user_id_created_at"), table_name="user_requests"
+    )
+    op.create_index(
+        op.f("ix_user_requests_user_id_created_at_user_request_id"),
+        "user_requests",
+        ["user_id", "created_at", "user_request_id"],
+        unique=False,
+    )
+    op.drop_index(
+        op.f("ix_user_requests_company_id_created_at"),
+        table_name="user_requests",
+    )
+    op.create_index(
+        op.f("ix_user_requests_company_id_created_at_user_request_id"),
+        "user_requests",
+        ["company_id", "created_at", "user_request_id"],
+        unique=False,
+    )
+    op.drop_index(
+        op.f("ix_notifications_send_to_created_at"), table_name="notifications"
+    )
+    op.create_index(
+        op.f("ix_notifications_send_to_created_at_notification_id"),
+        "notifications",
+        ["send_to", "created_at", "notification_id"],
+        unique=False,
+    )
+    op.drop_index(
+        op.f("ix_notifications_send_to_status_created_at"),
+        table_name="notifications",
+    )
+    op.create_index(
+        op.f("ix_notifications_send_to_status_created_at_notification_id"),
+        "notifications",
+        ["send_to", "status", "created_at", "notification_id"],
+        unique=False,
+    )
+    op.drop_index(
+        op.f("ix_quizzes_company_id_created_at"), table_name="quizzes"
+    )
+    op.create_index(
+        op.f("ix_quizzes_company_id_created_at_quiz_id"),
+        "quizzes",
+        ["company_id", "created_at", "quiz_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_quizzes_company_id_created_at_quiz_id"), table_name="quizzes"
+    )
+    op.create_index(
+        op.f("ix_quizzes_company_id_created_at"),
+        "quizzes",
+        ["company_id", "created_at"],
+        unique=False,
+    )
+    op.drop_index(
+        op.f("ix_notifications_send_to_status_created_at_notification_id"),
+        table_name="notifications",
+    )
+    op.create_index(
+        op.f("ix_notifications_send_to_status_created_at"),
+        "notifications",
+        ["send_to", "status", "created_at"],
+        unique=False,
+    )
+    op.drop_index(
+        op.f("ix_notifications_send_to_created_at_notification_id"),
+        table_name="notifications",
+    )
+    op.create_index(
+        op.f("ix_notifications_send_to_created_at"),
+        "notifications",
+        ["send_to", "created_at"],
+        unique=False,
+    )
+    op.drop_index(
+        op.f("ix_user_requests_company_id_created_at_user_request_id"),
+        table_name="user_requests",
+    )
+    op.create_index(
+        op.f("ix_user_requests_company_id_created_at"),
+        "user_requests",
+        ["company_id", "created_at"],
+        unique=False,
+    )
+    op.drop_index(
+        op.f("ix_user_requests_user_id_created_at_user_request_id"),
+        table_name="user_requests",
+    )
+    op.create_index(
+        op.f("ix_user_requests_user_id_created_at"),
+        "user_requests",
+        ["user_id", "created_at"],
+        unique=False,
+    )
+    op.drop_index(
+        op.f("ix_invitations_company_id_created_at_invitation_id"),
+        table_name="invitations",
+    )
+    op.create_index(
+        op.f("ix_invitations_company_id_created_at"),
+        "invitations",
+        ["company_id", "created_at"],
+        unique=False,
+    )
+    op.drop_index(
+        op.f("ix_invitations_user_id_created_at_invitation_id"),
+        table_name="invitations",
+    )
+    op.create_index(
+        op.f("ix_invitations_user_id_created_at"),
+        "invitations",
+        ["user_id", "created_at"],
+        unique=False,
+    )
+    op.drop_index(
+        op.f("ix_company_users_company_id_created_at_company_user_id"),
+        table_name="company_users",
+    )
+    op.create_index(
+        op.f("ix_company_users_company_id_created_at"),
+        "company_users",
+        ["company_id", "created_at"],
+        unique=False,
+    )
+    op.drop_index(
+        op.f("ix_companies_created_at_company_id"), table_name="companies"
+    )
+    op.create_index(
+        op.f("ix_companies_created_at"),
+        "companies",
+        ["created_at"],
+        unique=False,
+    )
+    op.drop_index(op.f("ix_users_created_at_user_id"), table_name="users")
+    op.create_index(
+        op.f("ix_users_created_at"),
+        "users",
+        ["created_at"],
+        unique=False,
+    )
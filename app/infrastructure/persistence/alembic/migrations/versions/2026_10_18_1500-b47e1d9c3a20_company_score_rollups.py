@@ -0,0 +1,70 @@
+"""company score rollups
+
+Revision ID: b47e1d9c3a20
+Revises: 8d3a6b2e4f1c
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b47e1d9c3a20"
+down_revision: Union[str, None] = "8d3a6b2e4f1c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "company_score_rollups",
+        sa.Column("company_id", sa.Integer(), nullable=False),
+        sa.Column("time_range", sa.String(length=8), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(), nullable=False),
+        sa.Column("score_sum", sa.BigInteger(), nullable=False),
+        sa.Column("result_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["company_id"],
+            ["companies.company_id"],
+            name=op.f("fk_company_score_rollups_company_id_companies"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint(
+            "company_id",
+            "time_range",
+            "bucket_start",
+            name=op.f("pk_company_score_rollups"),
+        ),
+    )
+    op.execute(
+        """
+        INSERT INTO company_score_rollups (
+            company_id, time_range, bucket_start, score_sum, result_count
+        )
+        SELECT
+            quizzes.company_id,
+            time_ranges.time_range,
+            date_trunc(
+                time_ranges.time_range, quiz_participations.created_at
+            ),
+            sum(quiz_results.correct_answers),
+            count(quiz_results.quiz_result_id)
+        FROM quiz_results
+        JOIN quiz_participations
+            ON quiz_results.quiz_participation_id
+            = quiz_participations.quiz_participation_id
+        JOIN quizzes ON quiz_participations.quiz_id = quizzes.quiz_id
+        CROSS JOIN (
+            VALUES ('year'), ('month'), ('week'), ('day'), ('hour')
+        ) AS time_ranges (time_range)
+        WHERE quiz_participations.created_at IS NOT NULL
+        GROUP BY 1, 2, 3
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("company_score_rollups")
@@ -0,0 +1,48 @@
+"""user quiz stats
+
+Revision ID: e2c95a7d1b38
+Revises: b47e1d9c3a20
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2c95a7d1b38"
+down_revision: Union[str, None] = "b47e1d9c3a20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_quiz_stats",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("quiz_id", sa.Integer(), nullable=False),
+        sa.Column("score_sum", sa.BigInteger(), nullable=False),
+        sa.Column("result_count", sa.Integer(), nullable=False),
+        sa.Column("last_completed_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["quiz_id"],
+            ["quizzes.quiz_id"],
+            name=op.f("fk_user_quiz_stats_quiz_id_quizzes"),
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.user_id"],
+            name=op.f("fk_user_quiz_stats_user_id_users"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint(
+            "user_id", "quiz_id", name=op.f("pk_user_quiz_stats")
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("user_quiz_stats")
@@ -0,0 +1,32 @@
+"""user quiz stats quiz id index
+
+Revision ID: 3f8a2c6d9e14
+Revises: e2c95a7d1b38
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f8a2c6d9e14"
+down_revision: Union[str, None] = "e2c95a7d1b38"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        op.f("ix_user_quiz_stats_quiz_id"),
+        "user_quiz_stats",
+        ["quiz_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_user_quiz_stats_quiz_id"), table_name="user_quiz_stats"
+    )
@@ -20,7 +20,13 @@ class BaseDBConfig:
 
 @dataclass
 class DBConfig(BaseDBConfig):
-    pass
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: int = 30
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+    statement_cache_size: int = 100
+    statement_timeout: int = 0  # In milliseconds, 0 disables the timeout
 
 
 @dataclass
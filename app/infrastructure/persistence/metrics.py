@@ -0,0 +1,109 @@
+import time
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# Amount of latest checkouts used to compute latency statistics
+LATENCY_WINDOW = 1000
+
+
+@dataclass(frozen=True)
+class PoolMetrics:
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    checkout_avg_ms: float
+    checkout_p99_ms: float
+    checkout_max_ms: float
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.checkouts = 0
+        self.checkout_latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    def connect(self):
+        started_at = time.perf_counter()
+
+        connection = super().connect()
+
+        self.checkouts += 1
+        self.checkout_latencies.append(time.perf_counter() - started_at)
+
+        return connection
+
+    def metrics(self) -> PoolMetrics:
+        latencies = sorted(self.checkout_latencies)
+
+        if latencies:
+            average = sum(latencies) / len(latencies)
+            p99 = latencies[
+                min(len(latencies) - 1, int(len(latencies) * 0.99))
+            ]
+            maximum = latencies[-1]
+        else:
+            average = p99 = maximum = 0.0
+
+        return PoolMetrics(
+            size=self.size(),
+            checked_in=self.checkedin(),
+            checked_out=self.checkedout(),
+            overflow=self.overflow(),
+            checkouts=self.checkouts,
+            checkout_avg_ms=average * 1000,
+            checkout_p99_ms=p99 * 1000,
+            checkout_max_ms=maximum * 1000,
+        )
+
+
+@dataclass(frozen=True)
+class QueryMetrics:
+    requests: int
+    queries: int
+    queries_per_request_avg: float
+    queries_per_request_max: int
+
+
+class QueryCounter:
+    def __init__(self):
+        self.queries = 0
+
+
+# Counter of the session scope (request or task) running in this context
+current_query_counter: ContextVar[QueryCounter | None] = ContextVar(
+    "current_query_counter", default=None
+)
+
+
+def count_query(conn, cursor, statement, parameters, context, executemany):
+    counter = current_query_counter.get()
+    if counter is not None:
+        counter.queries += 1
+
+
+class QueryStats:
+    def __init__(self):
+        self.requests = 0
+        self.queries = 0
+        self.max_queries = 0
+
+    def record(self, counter: QueryCounter) -> None:
+        self.requests += 1
+        self.queries += counter.queries
+        self.max_queries = max(self.max_queries, counter.queries)
+
+    def metrics(self) -> QueryMetrics:
+        return QueryMetrics(
+            requests=self.requests,
+            queries=self.queries,
+            queries_per_request_avg=(
+                self.queries / self.requests if self.requests else 0.0
+            ),
+            queries_per_request_max=self.max_queries,
+        )
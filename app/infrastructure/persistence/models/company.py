@@ -46,6 +46,8 @@ companies_table = sa.Table(
         onupdate=sa.func.now(),
         server_onupdate=sa.func.now(),
     ),
+    sa.Index("ix_companies_owner_id", "owner_id"),
+    sa.Index("ix_companies_created_at_company_id", "created_at", "company_id"),
 )
 
 
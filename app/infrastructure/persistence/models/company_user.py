@@ -40,6 +40,13 @@ company_users_table = sa.Table(
         onupdate=sa.func.now(),
         server_onupdate=sa.func.now(),
     ),
+    sa.Index("ix_company_users_user_id", "user_id"),
+    sa.Index(
+        "ix_company_users_company_id_created_at_company_user_id",
+        "company_id",
+        "created_at",
+        "company_user_id",
+    ),
 )
 
 
@@ -40,6 +40,18 @@ invitations_table = sa.Table(
         onupdate=sa.func.now(),
         server_onupdate=sa.func.now(),
     ),
+    sa.Index(
+        "ix_invitations_user_id_created_at_invitation_id",
+        "user_id",
+        "created_at",
+        "invitation_id",
+    ),
+    sa.Index(
+        "ix_invitations_company_id_created_at_invitation_id",
+        "company_id",
+        "created_at",
+        "invitation_id",
+    ),
 )
 
 user_requests_table = sa.Table(
@@ -77,6 +89,18 @@ user_requests_table = sa.Table(
         onupdate=sa.func.now(),
         server_onupdate=sa.func.now(),
     ),
+    sa.Index(
+        "ix_user_requests_user_id_created_at_user_request_id",
+        "user_id",
+        "created_at",
+        "user_request_id",
+    ),
+    sa.Index(
+        "ix_user_requests_company_id_created_at_user_request_id",
+        "company_id",
+        "created_at",
+        "user_request_id",
+    ),
 )
 
 
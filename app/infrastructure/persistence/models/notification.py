@@ -38,6 +38,19 @@ notifications_table = sa.Table(
         onupdate=sa.func.now(),
         server_onupdate=sa.func.now(),
     ),
+    sa.Index(
+        "ix_notifications_send_to_created_at_notification_id",
+        "send_to",
+        "created_at",
+        "notification_id",
+    ),
+    sa.Index(
+        "ix_notifications_send_to_status_created_at_notification_id",
+        "send_to",
+        "status",
+        "created_at",
+        "notification_id",
+    ),
 )
 
 
@@ -43,6 +43,12 @@ quizzes_table = sa.Table(
         onupdate=sa.func.now(),
         server_onupdate=sa.func.now(),
     ),
+    sa.Index(
+        "ix_quizzes_company_id_created_at_quiz_id",
+        "company_id",
+        "created_at",
+        "quiz_id",
+    ),
 )
 
 questions_table = sa.Table(
@@ -75,6 +81,7 @@ questions_table = sa.Table(
         onupdate=sa.func.now(),
         server_onupdate=sa.func.now(),
     ),
+    sa.Index("ix_questions_quiz_id", "quiz_id"),
 )
 
 answers_table = sa.Table(
@@ -108,6 +115,7 @@ answers_table = sa.Table(
         onupdate=sa.func.now(),
         server_onupdate=sa.func.now(),
     ),
+    sa.Index("ix_answers_question_id", "question_id"),
 )
 
 quiz_participations_table = sa.Table(
@@ -144,6 +152,17 @@ quiz_participations_table = sa.Table(
         onupdate=sa.func.now(),
         server_onupdate=sa.func.now(),
     ),
+    sa.Index(
+        "ix_quiz_participations_company_user_id_quiz_id_created_at",
+        "company_user_id",
+        "quiz_id",
+        "created_at",
+    ),
+    sa.Index(
+        "ix_quiz_participations_quiz_id_created_at",
+        "quiz_id",
+        "created_at",
+    ),
 )
 
 quiz_results_table = sa.Table(
@@ -164,6 +183,47 @@ quiz_results_table = sa.Table(
         ),
     ),
     sa.Column("correct_answers", sa.Integer, default=0, nullable=False),
+    sa.Index("ix_quiz_results_quiz_participation_id", "quiz_participation_id"),
+)
+
+# Per-company score sums and counts by time bucket, maintained on every
+# saved quiz result
+company_score_rollups_table = sa.Table(
+    "company_score_rollups",
+    mapper_registry.metadata,
+    sa.Column(
+        "company_id",
+        sa.Integer,
+        sa.ForeignKey("companies.company_id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    sa.Column("time_range", sa.String(length=8), primary_key=True),
+    sa.Column("bucket_start", sa.DateTime, primary_key=True),
+    sa.Column("score_sum", sa.BigInteger, default=0, nullable=False),
+    sa.Column("result_count", sa.Integer, default=0, nullable=False),
+)
+
+# Per-user, per-quiz score sums and last completion, maintained when
+# quizzes are taken and results are saved
+user_quiz_stats_table = sa.Table(
+    "user_quiz_stats",
+    mapper_registry.metadata,
+    sa.Column(
+        "user_id",
+        sa.Integer,
+        sa.ForeignKey("users.user_id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    sa.Column(
+        "quiz_id",
+        sa.Integer,
+        sa.ForeignKey("quizzes.quiz_id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    sa.Column("score_sum", sa.BigInteger, default=0, nullable=False),
+    sa.Column("result_count", sa.Integer, default=0, nullable=False),
+    sa.Column("last_completed_at", sa.DateTime, nullable=False),
+    sa.Index("ix_user_quiz_stats_quiz_id", "quiz_id"),
 )
 
 
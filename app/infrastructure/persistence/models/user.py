@@ -36,6 +36,7 @@ users_table = sa.Table(
         onupdate=sa.func.now(),
         server_onupdate=sa.func.now(),
     ),
+    sa.Index("ix_users_created_at_user_id", "created_at", "user_id"),
 )
 
 
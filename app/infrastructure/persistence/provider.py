@@ -1,6 +1,7 @@
 import logging
 from typing import AsyncGenerator, AsyncIterable
 
+from sqlalchemy import event, make_url
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -9,14 +10,39 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from app.infrastructure.persistence.config import DBConfig
+from app.infrastructure.persistence.metrics import (
+    InstrumentedPool,
+    QueryCounter,
+    QueryStats,
+    count_query,
+    current_query_counter,
+)
 
 
 async def get_engine(config: DBConfig) -> AsyncGenerator[AsyncEngine, None]:
+    url = make_url(config.get_connection_url()).update_query_dict(
+        {"prepared_statement_cache_size": str(config.statement_cache_size)}
+    )
+
     engine = create_async_engine(
-        config.get_connection_url(),
+        url,
         future=True,
+        poolclass=InstrumentedPool,
+        pool_size=config.pool_size,
+        max_overflow=config.max_overflow,
+        pool_timeout=config.pool_timeout,
+        pool_recycle=config.pool_recycle,
+        pool_pre_ping=config.pool_pre_ping,
+        connect_args={
+            "statement_cache_size": config.statement_cache_size,
+            "server_settings": {
+                "statement_timeout": str(config.statement_timeout)
+            },
+        },
     )
 
+    event.listen(engine.sync_engine, "before_cursor_execute", count_query)
+
     logging.info("Engine was created.")
 
     yield engine
@@ -42,6 +68,16 @@ def get_async_sessionmaker(
 
 async def get_async_session(
     session_factory: async_sessionmaker[AsyncSession],
+    query_stats: QueryStats,
 ) -> AsyncIterable[AsyncSession]:
-    async with session_factory() as session:
-        yield session
+    counter = QueryCounter()
+    current_query_counter.set(counter)
+
+    try:
+        async with session_factory() as session:
+            yield session
+    finally:
+        current_query_counter.set(None)
+        query_stats.record(counter)
+
+        logging.debug("Session ran %s queries", counter.queries)
@@ -8,6 +8,9 @@ from dishka import AsyncContainer
 from app.infrastructure.tasks.check_available_quiz import (
     check_available_quiz_task,
 )
+from app.infrastructure.tasks.compact_quiz_result_index import (
+    compact_quiz_result_index_task,
+)
 
 
 def setup_tasks(
@@ -18,3 +21,8 @@ def setup_tasks(
         trigger=CronTrigger(hour=0, minute=0, timezone=UTC),
         args=(container,),
     )
+    scheduler.add_job(
+        compact_quiz_result_index_task,
+        trigger=IntervalTrigger(hours=1, timezone=UTC),
+        args=(container,),
+    )
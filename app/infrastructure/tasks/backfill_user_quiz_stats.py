@@ -0,0 +1,31 @@
+import asyncio
+import logging
+
+from dishka import AsyncContainer
+
+from app.core.commands.quiz.backfill_user_quiz_stats import (
+    BackfillUserQuizStats,
+)
+from app.infrastructure.bootstrap.di import setup_http_di
+
+
+async def backfill_user_quiz_stats_task(container: AsyncContainer):
+    async with container() as cnt:
+        backfill_user_quiz_stats_cmd = await cnt.get(BackfillUserQuizStats)
+
+        await backfill_user_quiz_stats_cmd()
+
+
+async def main() -> None:
+    container = setup_http_di()
+
+    try:
+        await backfill_user_quiz_stats_task(container)
+    finally:
+        await container.close()
+
+
+if __name__ == "__main__":
+    # One-off job: python -m app.infrastructure.tasks.backfill_user_quiz_stats
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -0,0 +1,12 @@
+from dishka import AsyncContainer
+
+from app.core.commands.quiz.compact_quiz_result_index import (
+    CompactQuizResultIndex,
+)
+
+
+async def compact_quiz_result_index_task(container: AsyncContainer):
+    async with container() as cnt:
+        compact_quiz_result_index_cmd = await cnt.get(CompactQuizResultIndex)
+
+        await compact_quiz_result_index_cmd()
@@ -0,0 +1,44 @@
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+# Application-wide key of the Postgres advisory lock guarding the scheduler
+SCHEDULER_LOCK_KEY = 7_105_001
+
+
+class SchedulerLock:
+    def __init__(self, connection: AsyncConnection):
+        self.connection = connection
+
+    async def release(self) -> None:
+        try:
+            await self.connection.execute(
+                select(func.pg_advisory_unlock(SCHEDULER_LOCK_KEY))
+            )
+            await self.connection.commit()
+        finally:
+            await self.connection.close()
+
+
+async def acquire_scheduler_lock(engine: AsyncEngine) -> SchedulerLock | None:
+    # Only the worker holding the lock runs scheduled tasks. The lock lives
+    # in the database, so it is shared by every worker on every host of the
+    # deployment, and Postgres releases it when the holding connection
+    # closes, e.g. when that worker exits
+    connection = await engine.connect()
+
+    try:
+        acquired = await connection.scalar(
+            select(func.pg_try_advisory_lock(SCHEDULER_LOCK_KEY))
+        )
+        # Session-level advisory locks outlive the transaction, so the
+        # connection is not left idle in a transaction while holding it
+        await connection.commit()
+    except BaseException:
+        await connection.close()
+        raise
+
+    if not acquired:
+        await connection.close()
+        return None
+
+    return SchedulerLock(connection)
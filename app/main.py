@@ -1,5 +1,6 @@
 import logging
 from contextlib import asynccontextmanager
+from importlib.util import find_spec
 
 import uvicorn
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -7,23 +8,27 @@ from dishka import AsyncContainer
 from dishka.integrations.fastapi import setup_dishka
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.ext.asyncio import AsyncEngine
 
 from app.config import load_config
 from app.infrastructure.bootstrap.di import setup_http_di
 from app.infrastructure.persistence.models import map_tables
 from app.infrastructure.tasks import setup_tasks
+from app.infrastructure.tasks.lock import acquire_scheduler_lock
 from app.routers import setup_routers
 
 logger = logging.getLogger(__name__)
 
 
-def setup_scheduler(container: AsyncContainer) -> None:
+def setup_scheduler(container: AsyncContainer) -> AsyncIOScheduler:
     scheduler = AsyncIOScheduler()
 
     setup_tasks(scheduler, container)
 
     scheduler.start()
 
+    return scheduler
+
 
 def setup_middlewares(app: FastAPI) -> None:
     app.add_middleware(
@@ -37,8 +42,23 @@ def setup_middlewares(app: FastAPI) -> None:
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    container = app.state.dishka_container
+
+    scheduler = None
+    scheduler_lock = await acquire_scheduler_lock(
+        await container.get(AsyncEngine)
+    )
+    if scheduler_lock:
+        scheduler = setup_scheduler(container)
+        logger.info("Scheduler started in this worker")
+
     yield
-    await app.state.dishka_container.close()
+
+    if scheduler:
+        scheduler.shutdown()
+        await scheduler_lock.release()
+
+    await container.close()
 
 
 def create_app() -> FastAPI:
@@ -58,22 +78,33 @@ def create_app() -> FastAPI:
     container = setup_http_di()
     setup_dishka(container, app)
 
-    setup_scheduler(container)
-
     map_tables()
 
     return app
 
 
+def select_loop() -> str:
+    return "uvloop" if find_spec("uvloop") else "asyncio"
+
+
+def select_http() -> str:
+    return "httptools" if find_spec("httptools") else "h11"
+
+
 if __name__ == "__main__":
     config = load_config()
+    web_config = config.web_config
 
     uvicorn.run(
         "app.main:create_app",
-        host=config.web_config.server_host,
-        port=config.web_config.server_port,
+        host=web_config.server_host,
+        port=web_config.server_port,
         log_level=logging.INFO,
-        reload=True,
+        reload=web_config.reload,
+        workers=None if web_config.reload else web_config.workers,
+        loop=select_loop(),
+        http=select_http(),
+        timeout_graceful_shutdown=web_config.graceful_shutdown_timeout,
         factory=True,
         lifespan="on",
     )
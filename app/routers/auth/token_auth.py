@@ -40,5 +40,5 @@ class TokenAuth:
 
         return token
 
-    def get_token_data(self, token: str) -> AccessTokenData:
-        return self.token_processor.decode_oauth(token)
+    async def get_token_data(self, token: str) -> AccessTokenData:
+        return await self.token_processor.decode_oauth(token)
@@ -136,11 +136,12 @@ async def get_many_companies(
     offset: Annotated[int, Query(ge=0)] = 0,
     limit: Annotated[int, Query(ge=1, le=1000)] = 1000,
     order: SortOrder = SortOrder.ASC,
+    cursor: str | None = None,
 ):
     response = await action(
         GetManyCompaniesInputData(
             filters=CompanyFilters(visibility=visibility),
-            pagination=Pagination(offset, limit, order),
+            pagination=Pagination(offset, limit, order, cursor),
         )
     )
 
@@ -155,13 +156,14 @@ async def get_company_users(
     offset: Annotated[int, Query(ge=0)] = 0,
     limit: Annotated[int, Query(ge=1, le=1000)] = 1000,
     order: SortOrder = SortOrder.ASC,
+    cursor: str | None = None,
 ) -> OkResponse[GetCompanyUsersOutputData]:
     response = await action(
         GetCompanyUsersInputData(
             filters=CompanyUserFilters(
                 company_id=company_id, company_role=company_role
             ),
-            pagination=Pagination(offset, limit, order),
+            pagination=Pagination(offset, limit, order, cursor),
         )
     )
 
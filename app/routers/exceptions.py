@@ -22,6 +22,7 @@ from app.core.commands.quiz.errors import (
     InvalidAnswerQuantityError,
     InvalidAnswersValidateError,
     InvalidQuestionQuantityError,
+    InvalidQuizFileError,
     QuizNotFoundError,
     QuizParticipationNotFoundError,
 )
@@ -34,6 +35,7 @@ from app.core.commands.user.errors import (
     UserNotFoundError,
 )
 from app.core.common.base_error import ApplicationError
+from app.core.common.pagination import InvalidCursorError
 from app.core.entities.errors import (
     CompanyDescriptionTooLongError,
     CompanyNameTooLongError,
@@ -67,6 +69,9 @@ def setup_exception_handlers(app: FastAPI) -> None:
     app.add_exception_handler(
         EmptyError, error_handler(status.HTTP_400_BAD_REQUEST)
     )
+    app.add_exception_handler(
+        InvalidCursorError, error_handler(status.HTTP_400_BAD_REQUEST)
+    )
     app.add_exception_handler(
         InvalidUserEmailError,
         error_handler(status.HTTP_422_UNPROCESSABLE_ENTITY),
@@ -86,6 +91,10 @@ def setup_exception_handlers(app: FastAPI) -> None:
         InvalidAnswersValidateError,
         error_handler(status.HTTP_422_UNPROCESSABLE_ENTITY),
     )
+    app.add_exception_handler(
+        InvalidQuizFileError,
+        error_handler(status.HTTP_422_UNPROCESSABLE_ENTITY),
+    )
     app.add_exception_handler(
         QuizNotFoundError, error_handler(status.HTTP_404_NOT_FOUND)
     )
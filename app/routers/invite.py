@@ -59,9 +59,12 @@ async def get_all_received_invitations_by_user(
     offset: Annotated[int, Query(ge=0)] = 0,
     limit: Annotated[int, Query(ge=1, le=1000)] = 1000,
     order: SortOrder = SortOrder.ASC,
+    cursor: str | None = None,
 ) -> OkResponse[GetInvitationOutputData]:
     response = await action.by_user(
-        GetInvitationByUser(pagination=Pagination(offset, limit, order))
+        GetInvitationByUser(
+            pagination=Pagination(offset, limit, order, cursor)
+        )
     )
 
     return OkResponse(result=response)
@@ -74,10 +77,12 @@ async def get_all_receiver_invitations_by_owner(
     offset: Annotated[int, Query(ge=0)] = 0,
     limit: Annotated[int, Query(ge=1, le=1000)] = 1000,
     order: SortOrder = SortOrder.ASC,
+    cursor: str | None = None,
 ) -> OkResponse[GetInvitationOutputData]:
     response = await action.by_owner(
         GetInvitationByOwner(
-            pagination=Pagination(offset, limit, order), company_id=company_id
+            pagination=Pagination(offset, limit, order, cursor),
+            company_id=company_id,
         )
     )
 
@@ -90,9 +95,10 @@ async def get_all_user_request_by_user(
     offset: Annotated[int, Query(ge=0)] = 0,
     limit: Annotated[int, Query(ge=1, le=1000)] = 1000,
     order: SortOrder = SortOrder.ASC,
+    cursor: str | None = None,
 ) -> OkResponse[GetUserRequestsOutputData]:
     response = await action.by_user(
-        GetUserRequestsByUser(Pagination(offset, limit, order))
+        GetUserRequestsByUser(Pagination(offset, limit, order, cursor))
     )
 
     return OkResponse(result=response)
@@ -105,9 +111,12 @@ async def get_all_user_request_by_owner(
     offset: Annotated[int, Query(ge=0)] = 0,
     limit: Annotated[int, Query(ge=1, le=1000)] = 1000,
     order: SortOrder = SortOrder.ASC,
+    cursor: str | None = None,
 ) -> OkResponse[GetUserRequestsOutputData]:
     response = await action.by_owner(
-        GetUserRequestsByOwner(Pagination(offset, limit, order), company_id)
+        GetUserRequestsByOwner(
+            Pagination(offset, limit, order, cursor), company_id
+        )
     )
 
     return OkResponse(result=response)
@@ -0,0 +1,56 @@
+from dishka import FromDishka
+from dishka.integrations.fastapi import DishkaRoute, inject
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.interfaces.id_provider import IdProvider
+from app.infrastructure.auth.access_token_processor import AccessTokenProcessor
+from app.infrastructure.cache.metrics import CacheStats, QueryCacheMetrics
+from app.infrastructure.persistence.metrics import (
+    PoolMetrics,
+    QueryMetrics,
+    QueryStats,
+)
+from app.routers.responses.base import OkResponse
+
+
+@inject
+async def authenticate(id_provider: FromDishka[IdProvider]) -> None:
+    await id_provider.get_user()
+
+
+# Metrics expose internals of the deployment, only signed in users see them
+metrics_router = APIRouter(
+    prefix="/metrics",
+    tags=["Metrics"],
+    route_class=DishkaRoute,
+    dependencies=[Depends(authenticate)],
+)
+
+
+@metrics_router.get("/db-pool", status_code=status.HTTP_200_OK)
+async def get_db_pool_metrics(
+    engine: FromDishka[AsyncEngine],
+) -> OkResponse[PoolMetrics]:
+    return OkResponse(result=engine.pool.metrics())
+
+
+@metrics_router.get("/db-queries", status_code=status.HTTP_200_OK)
+async def get_db_query_metrics(
+    stats: FromDishka[QueryStats],
+) -> OkResponse[QueryMetrics]:
+    return OkResponse(result=stats.metrics())
+
+
+@metrics_router.get("/quiz-reader-cache", status_code=status.HTTP_200_OK)
+async def get_quiz_reader_cache_metrics(
+    stats: FromDishka[CacheStats],
+) -> OkResponse[list[QueryCacheMetrics]]:
+    return OkResponse(result=stats.metrics())
+
+
+@metrics_router.get("/access-token-cache", status_code=status.HTTP_200_OK)
+async def get_access_token_cache_metrics(
+    token_processor: FromDishka[AccessTokenProcessor],
+) -> OkResponse[list[QueryCacheMetrics]]:
+    return OkResponse(result=token_processor.stats.metrics())
@@ -33,12 +33,13 @@ async def get_my_notifications(
     offset: Annotated[int, Query(ge=0)] = 0,
     limit: Annotated[int, Query(ge=1, le=1000)] = 1000,
     order: SortOrder = SortOrder.ASC,
+    cursor: str | None = None,
 ) -> OkResponse[GetMyNotificationsOutputData]:
     output_data = await action(
         GetMyNotificationsInputData(
             company_id=company_id,
             status=notification_status,
-            pagination=Pagination(offset, limit, order),
+            pagination=Pagination(offset, limit, order, cursor),
         )
     )
 
@@ -54,6 +54,11 @@ from app.core.queries.quiz.get_company_average_scores import (
     GetCompanyAverageScoresInputData,
     GetCompanyAverageScoresOutputData,
 )
+from app.core.queries.quiz.get_company_leaderboard import (
+    GetCompanyLeaderboard,
+    GetCompanyLeaderboardInputData,
+    GetCompanyLeaderboardOutputData,
+)
 from app.core.queries.quiz.get_company_user_quiz_average import (
     GetCompanyUserQuizAverage,
     GetCompanyUserQuizAverageInputData,
@@ -168,6 +173,20 @@ async def get_company_users_last_attempt(
     return OkResponse(result=output_data)
 
 
+@quiz_router.get("/leaderboard/{company_id}", status_code=status.HTTP_200_OK)
+async def get_company_leaderboard(
+    company_id: int,
+    action: FromDishka[GetCompanyLeaderboard],
+    limit: Annotated[int, Query(ge=1, le=1000)] = 10,
+    user_id: int | None = None,
+) -> OkResponse[GetCompanyLeaderboardOutputData]:
+    output_data = await action(
+        GetCompanyLeaderboardInputData(company_id, limit, user_id)
+    )
+
+    return OkResponse(result=output_data)
+
+
 @quiz_router.get("/average", status_code=status.HTTP_200_OK)
 async def get_total_quizzes_average(
     action: FromDishka[GetTotalQuizAverage],
@@ -237,10 +256,11 @@ async def get_all_quizzes(
     offset: Annotated[int, Query(ge=0)] = 0,
     limit: Annotated[int, Query(ge=1, le=1000)] = 1000,
     order: SortOrder = SortOrder.ASC,
+    cursor: str | None = None,
 ) -> OkResponse[GetAllQuizzesOutputData]:
     output_data = await action(
         GetAllQuizzesInputData(
-            QuizFilters(company_id), Pagination(offset, limit, order)
+            QuizFilters(company_id), Pagination(offset, limit, order, cursor)
         )
     )
 
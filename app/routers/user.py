@@ -142,7 +142,7 @@ async def sing_in_by_auth0(
     token_auth: FromDishka[TokenAuth],
     token: str = Depends(HTTPBearer()),
 ):
-    access_token_data = token_auth.get_token_data(token.credentials)
+    access_token_data = await token_auth.get_token_data(token.credentials)
 
     await create_new_user(SignInByOauthInputData(access_token_data.email))
 
@@ -273,11 +273,14 @@ async def get_users(
     offset: Annotated[int, Query(ge=0)] = 0,
     limit: Annotated[int, Query(ge=1, le=1000)] = 1000,
     order: SortOrder = SortOrder.ASC,
+    cursor: str | None = None,
 ) -> OkResponse[GetUsersOutputData]:
     response = await action(
         GetUsersInputData(
             filters=UserFilters(is_active=is_active),
-            pagination=Pagination(offset=offset, limit=limit, order=order),
+            pagination=Pagination(
+                offset=offset, limit=limit, order=order, cursor=cursor
+            ),
         )
     )
 
@@ -0,0 +1,11 @@
+from itertools import islice
+from typing import Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+
+def batched(iterable: Iterable[T], size: int) -> Iterator[tuple[T, ...]]:
+    iterator = iter(iterable)
+
+    while chunk := tuple(islice(iterator, size)):
+        yield chunk
@@ -1,5 +1,12 @@
 from app.core.entities.company import CompanyId
 from app.core.entities.quiz import QuizParticipationId
+from app.core.entities.value_objects import UserEmail
+
+QUIZ_RESULT_TTL = 172800  # TTL in second(48 hours)
+USER_IDENTITY_TTL = 60  # TTL in second(1 minute)
+LEADERBOARD_TTL = 86400  # TTL in second(24 hours)
+ANALYTICS_TTL = 3600  # TTL in second(1 hour)
+TOTAL_AVERAGE_TTL = 60  # TTL in second(1 minute)
 
 
 def get_quiz_result_cache_key(participation_id: QuizParticipationId) -> str:
@@ -8,3 +15,39 @@ def get_quiz_result_cache_key(participation_id: QuizParticipationId) -> str:
 
 def get_member_key(company_id: CompanyId) -> str:
     return f"company:{company_id}"
+
+
+def get_quiz_results_loaded_key(company_id: CompanyId) -> str:
+    return f"quiz_results_loaded:{company_id}"
+
+
+def get_member_key_pattern() -> str:
+    return "company:*"
+
+
+def get_quiz_results_loaded_key_pattern() -> str:
+    return "quiz_results_loaded:*"
+
+
+def get_user_identity_cache_key(email: UserEmail) -> str:
+    return f"user_identity:{email}"
+
+
+def get_leaderboard_key(company_id: CompanyId) -> str:
+    return f"leaderboard:{company_id}"
+
+
+def get_analytics_member_key(company_id: CompanyId) -> str:
+    return f"analytics:{company_id}"
+
+
+def get_analytics_cache_key(
+    company_id: CompanyId, query: str, *params: object
+) -> str:
+    return ":".join(
+        (get_analytics_member_key(company_id), query, *map(str, params))
+    )
+
+
+def get_total_average_cache_key() -> str:
+    return "analytics:total_average"
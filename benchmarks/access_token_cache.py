@@ -0,0 +1,67 @@
+"""Benchmark for the decoded access-token cache of AccessTokenProcessor.
+
+Run with ``python -m benchmarks.access_token_cache``.
+"""
+
+import timeit
+from datetime import UTC, datetime, timedelta
+
+from app.core.commands.user.sign_in import AccessTokenData
+from app.infrastructure.auth.access_token_processor import (
+    DECODE_QUERY,
+    AccessTokenProcessor,
+)
+from app.infrastructure.jwt.config import Auth0Config, JWTConfig
+from app.infrastructure.jwt.jwks import FileJWKSource, JWKSCache
+from app.infrastructure.jwt.jwt_processor import PyJWTProcessor
+
+
+def make_processor(cache_size: int) -> AccessTokenProcessor:
+    auth0_config = Auth0Config(domain="example.com", audience="quiz-app")
+    jwt_processor = PyJWTProcessor(
+        JWTConfig(key="benchmark-secret-key-of-32-bytes!", algorithm="HS256"),
+        auth0_config,
+        JWKSCache(FileJWKSource("jwks.json"), auth0_config),
+    )
+
+    processor = AccessTokenProcessor(jwt_processor)
+    processor.cache_size = cache_size
+
+    return processor
+
+
+def main() -> None:
+    requests = 50_000
+    users = 100
+
+    processor = make_processor(cache_size=0)
+    expires_in = datetime.now(UTC) + timedelta(hours=1)
+    tokens = [
+        processor.encode(
+            AccessTokenData(
+                email=f"user{user}@gmail.com", expires_in=expires_in
+            )
+        )
+        for user in range(users)
+    ]
+
+    for name, cache_size in (("without cache", 0), ("with cache", users)):
+        processor = make_processor(cache_size)
+
+        elapsed = timeit.timeit(
+            lambda processor=processor: [
+                processor.decode(tokens[request % users])
+                for request in range(requests)
+            ],
+            number=1,
+        )
+
+        print(  # noqa: T201
+            f"{name}: {requests / elapsed:,.0f} req/s "
+            f"(hits={processor.stats.hits[DECODE_QUERY]}, "
+            f"misses={processor.stats.misses[DECODE_QUERY]})"
+        )
+
+
+if __name__ == "__main__":
+    main()
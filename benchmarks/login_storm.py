@@ -0,0 +1,90 @@
+"""Load test: latency of unrelated requests during a login storm.
+
+Runs concurrent password verifications while a probe coroutine, standing in
+for an unrelated endpoint, measures how late the event loop serves it.
+
+Run with ``python -m benchmarks.login_storm``.
+"""
+
+import asyncio
+import statistics
+import time
+
+import argon2
+
+from app.core.entities.value_objects import UserRawPassword
+from app.infrastructure.auth.config import PasswordHasherConfig
+from app.infrastructure.auth.password_hasher import ArgonPasswordHasher
+
+LOGINS = 50
+LOGIN_INTERVAL = 0.01
+PROBE_INTERVAL = 0.005
+
+
+class BlockingPasswordHasher:
+    """Previous behaviour: argon2 called directly on the event loop."""
+
+    def __init__(self, config: PasswordHasherConfig):
+        self.ph = argon2.PasswordHasher(
+            time_cost=config.time_cost,
+            memory_cost=config.memory_cost,
+            parallelism=config.parallelism,
+        )
+
+    async def verify_password(
+        self, raw_password: UserRawPassword, hashed_password: str
+    ) -> None:
+        self.ph.verify(hashed_password, raw_password.password)
+
+
+async def probe(latencies: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        started_at = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        latencies.append(time.perf_counter() - started_at - PROBE_INTERVAL)
+
+
+async def login(hasher, number: int, hashed_password: str) -> None:
+    await asyncio.sleep(number * LOGIN_INTERVAL)
+
+    await hasher.verify_password(
+        UserRawPassword("someSuper123#Password"), hashed_password
+    )
+
+
+async def run(name: str, hasher, hashed_password: str) -> None:
+    latencies = []
+    stop = asyncio.Event()
+
+    probe_task = asyncio.create_task(probe(latencies, stop))
+    started_at = time.perf_counter()
+
+    await asyncio.gather(
+        *(login(hasher, number, hashed_password) for number in range(LOGINS))
+    )
+
+    elapsed = time.perf_counter() - started_at
+    stop.set()
+    await probe_task
+
+    p99 = statistics.quantiles(latencies, n=100)[98] * 1000
+    print(  # noqa: T201
+        f"{name}: {LOGINS / elapsed:,.0f} logins/s, "
+        f"unrelated request p99 delay {p99:.1f} ms "
+        f"({len(latencies)} probes)"
+    )
+
+
+async def main() -> None:
+    config = PasswordHasherConfig()
+    hasher = ArgonPasswordHasher(config)
+    hashed_password = await hasher.hash_password(
+        UserRawPassword("someSuper123#Password")
+    )
+
+    await run("blocking", BlockingPasswordHasher(config), hashed_password)
+    await run("executor", hasher, hashed_password)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
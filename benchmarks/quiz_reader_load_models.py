@@ -0,0 +1,60 @@
+"""Micro-benchmark for SQLAlchemyQuizReader._load_models.
+
+Run with ``python -m benchmarks.quiz_reader_load_models``.
+"""
+
+import timeit
+
+from app.infrastructure.gateways.quiz import SQLAlchemyQuizReader
+
+
+def make_rows(
+    quizzes: int, questions: int, answers: int
+) -> tuple[list[dict], list[dict]]:
+    quiz_rows = [
+        {
+            "quiz_id": quiz_id,
+            "title": f"Quiz {quiz_id}",
+            "description": "Description",
+            "participation_count": 0,
+        }
+        for quiz_id in range(quizzes)
+    ]
+
+    question_rows = [
+        {
+            "quiz_id": quiz_id,
+            "question_id": quiz_id * questions + question,
+            "question_title": f"Question {question}",
+            "answer_id": (quiz_id * questions + question) * answers + answer,
+            "answer_text": f"Answer {answer}",
+            "is_correct": answer == 0,
+        }
+        for quiz_id in range(quizzes)
+        for question in range(questions)
+        for answer in range(answers)
+    ]
+
+    return quiz_rows, question_rows
+
+
+def main() -> None:
+    reader = SQLAlchemyQuizReader(session=None)
+
+    for quizzes, questions, answers in [(10, 100, 4), (5, 1000, 4)]:
+        quiz_rows, question_rows = make_rows(quizzes, questions, answers)
+
+        number = 10
+        elapsed = timeit.timeit(
+            lambda: reader._load_models(quiz_rows, question_rows),  # noqa: B023
+            number=number,
+        )
+
+        print(  # noqa: T201
+            f"{quizzes} quizzes x {questions} questions x {answers} answers "
+            f"({len(question_rows)} rows): {elapsed / number * 1000:.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -8,12 +8,21 @@ from app.core.commands.company.leave_from_company import (
     LeaveFromCompany,
     LeaveFromCompanyInputData,
 )
+from app.core.commands.quiz.service import (
+    LeaderboardService,
+    QuizAnalyticsService,
+)
+from tests.mocks.cache import FakeCache
 from tests.mocks.commiter import FakeCommiter
 from tests.mocks.company_gateways import (
     FakeCompanyMapper,
     FakeCompanyUserMapper,
 )
 from tests.mocks.id_provider import FakeIdProvider
+from tests.mocks.quiz_gateways import (
+    FakeScoreRollupMapper,
+    FakeUserQuizStatsMapper,
+)
 
 
 @pytest.mark.parametrize(
@@ -28,6 +37,11 @@ async def test_leave_from_company(
     id_provider: FakeIdProvider,
     company_gateway: FakeCompanyMapper,
     company_user_gateway: FakeCompanyUserMapper,
+    score_rollup_gateway: FakeScoreRollupMapper,
+    user_quiz_stats_gateway: FakeUserQuizStatsMapper,
+    leaderboard_service: LeaderboardService,
+    analytics_service: QuizAnalyticsService,
+    cache: FakeCache,
     commiter: FakeCommiter,
     company_id: int,
     user_id: int,
@@ -36,7 +50,21 @@ async def test_leave_from_company(
     id_provider.user.user_id = user_id
 
     command = LeaveFromCompany(
-        id_provider, company_gateway, company_user_gateway, commiter
+        id_provider,
+        company_gateway,
+        company_user_gateway,
+        score_rollup_gateway,
+        user_quiz_stats_gateway,
+        leaderboard_service,
+        analytics_service,
+        cache,
+        commiter,
+    )
+    cache.scores["leaderboard:1"] = {"1": 4, "2": 3}
+    await cache.set_cache("quiz_result:1", {"correct_answers": 2}, 0)
+    await cache.set_cache("quiz_results_loaded:1", {"company_id": 1}, 0)
+    await cache.set_member_key(
+        "company:1", "quiz_result:1", "quiz_results_loaded:1"
     )
     input_data = LeaveFromCompanyInputData(company_id)
 
@@ -47,9 +75,18 @@ async def test_leave_from_company(
             await coro
 
         assert not company_user_gateway.deleted
+        assert not score_rollup_gateway.removed
+        assert not user_quiz_stats_gateway.removed
         assert not commiter.commited
+        assert cache.scores["leaderboard:1"] == {"1": 4, "2": 3}
+        assert "quiz_results_loaded:1" in cache.member_keys["company:1"]
     else:
         await coro
 
         assert company_user_gateway.deleted
+        assert score_rollup_gateway.removed
+        assert user_quiz_stats_gateway.removed
         assert commiter.commited
+        assert cache.scores["leaderboard:1"] == {"1": 4}
+        assert "company:1" not in cache.member_keys
+        assert "quiz_results_loaded:1" not in cache.cache
@@ -8,12 +8,21 @@ from app.core.commands.company.remove_user_from_company import (
     RemoveUserFromCompany,
     RemoveUserFromCompanyInputData,
 )
+from app.core.commands.quiz.service import (
+    LeaderboardService,
+    QuizAnalyticsService,
+)
 from app.core.common.access_service import AccessService
+from tests.mocks.cache import FakeCache
 from tests.mocks.commiter import FakeCommiter
 from tests.mocks.company_gateways import (
     FakeCompanyMapper,
     FakeCompanyUserMapper,
 )
+from tests.mocks.quiz_gateways import (
+    FakeScoreRollupMapper,
+    FakeUserQuizStatsMapper,
+)
 
 
 @pytest.mark.parametrize(
@@ -27,6 +36,11 @@ from tests.mocks.company_gateways import (
 async def test_remove_user_from_company(
     company_gateway: FakeCompanyMapper,
     company_user_gateway: FakeCompanyUserMapper,
+    score_rollup_gateway: FakeScoreRollupMapper,
+    user_quiz_stats_gateway: FakeUserQuizStatsMapper,
+    leaderboard_service: LeaderboardService,
+    analytics_service: QuizAnalyticsService,
+    cache: FakeCache,
     access_service: AccessService,
     commiter: FakeCommiter,
     company_id: int,
@@ -34,7 +48,21 @@ async def test_remove_user_from_company(
     exc_class,
 ) -> None:
     command = RemoveUserFromCompany(
-        company_gateway, company_user_gateway, access_service, commiter
+        company_gateway,
+        company_user_gateway,
+        score_rollup_gateway,
+        user_quiz_stats_gateway,
+        leaderboard_service,
+        analytics_service,
+        access_service,
+        cache,
+        commiter,
+    )
+    cache.scores["leaderboard:1"] = {"1": 4, "2": 3}
+    await cache.set_cache("quiz_result:1", {"correct_answers": 2}, 0)
+    await cache.set_cache("quiz_results_loaded:1", {"company_id": 1}, 0)
+    await cache.set_member_key(
+        "company:1", "quiz_result:1", "quiz_results_loaded:1"
     )
     input_data = RemoveUserFromCompanyInputData(company_id, user_id)
 
@@ -45,9 +73,18 @@ async def test_remove_user_from_company(
             await coro
 
         assert not company_user_gateway.deleted
+        assert not score_rollup_gateway.removed
+        assert not user_quiz_stats_gateway.removed
         assert not commiter.commited
+        assert cache.scores["leaderboard:1"] == {"1": 4, "2": 3}
+        assert "quiz_results_loaded:1" in cache.member_keys["company:1"]
     else:
         await coro
 
         assert company_user_gateway.deleted
+        assert score_rollup_gateway.removed
+        assert user_quiz_stats_gateway.removed
         assert commiter.commited
+        assert cache.scores["leaderboard:1"] == {"1": 4}
+        assert "company:1" not in cache.member_keys
+        assert "quiz_results_loaded:1" not in cache.cache
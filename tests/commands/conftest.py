@@ -1,6 +1,10 @@
 import pytest
 
 from app.core.commands.notification.service import NotificationService
+from app.core.commands.quiz.service import (
+    LeaderboardService,
+    QuizAnalyticsService,
+)
 from app.core.common.access_service import AccessService
 from app.core.entities.user import User
 from tests.mocks.cache import FakeCache
@@ -21,6 +25,8 @@ from tests.mocks.quiz_gateways import (
     FakeQuizMapper,
     FakeQuizParticipationMapper,
     FakeQuizResultMapper,
+    FakeScoreRollupMapper,
+    FakeUserQuizStatsMapper,
 )
 from tests.mocks.user_gateways import FakeUserMapper
 
@@ -87,6 +93,16 @@ def quiz_result_gateway() -> FakeQuizResultMapper:
     return FakeQuizResultMapper()
 
 
+@pytest.fixture
+def score_rollup_gateway() -> FakeScoreRollupMapper:
+    return FakeScoreRollupMapper()
+
+
+@pytest.fixture
+def user_quiz_stats_gateway() -> FakeUserQuizStatsMapper:
+    return FakeUserQuizStatsMapper()
+
+
 @pytest.fixture
 def cache() -> FakeCache:
     return FakeCache()
@@ -103,3 +119,15 @@ def notification_service(
     company_user_gateway: FakeCompanyUserMapper,
 ) -> NotificationService:
     return NotificationService(notification_gateway, company_user_gateway)
+
+
+@pytest.fixture
+def leaderboard_service(
+    cache: FakeCache, user_quiz_stats_gateway: FakeUserQuizStatsMapper
+) -> LeaderboardService:
+    return LeaderboardService(cache, user_quiz_stats_gateway)
+
+
+@pytest.fixture
+def analytics_service(cache: FakeCache) -> QuizAnalyticsService:
+    return QuizAnalyticsService(cache)
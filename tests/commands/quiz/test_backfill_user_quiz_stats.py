@@ -0,0 +1,36 @@
+from app.core.commands.quiz.backfill_user_quiz_stats import (
+    BATCH_SIZE,
+    BackfillUserQuizStats,
+)
+from app.core.entities.user import UserId
+from tests.mocks.commiter import FakeCommiter
+from tests.mocks.quiz_gateways import FakeUserQuizStatsMapper
+
+
+async def test_backfill_user_quiz_stats(
+    user_quiz_stats_gateway: FakeUserQuizStatsMapper,
+    commiter: FakeCommiter,
+) -> None:
+    user_quiz_stats_gateway.max_user_id = UserId(BATCH_SIZE + 1)
+
+    command = BackfillUserQuizStats(user_quiz_stats_gateway, commiter)
+
+    await command()
+
+    assert user_quiz_stats_gateway.rebuilt == [
+        (0, BATCH_SIZE),
+        (BATCH_SIZE, BATCH_SIZE * 2),
+    ]
+    assert commiter.commited
+
+
+async def test_backfill_user_quiz_stats_without_users(
+    user_quiz_stats_gateway: FakeUserQuizStatsMapper,
+    commiter: FakeCommiter,
+) -> None:
+    command = BackfillUserQuizStats(user_quiz_stats_gateway, commiter)
+
+    await command()
+
+    assert not user_quiz_stats_gateway.rebuilt
+    assert not commiter.commited
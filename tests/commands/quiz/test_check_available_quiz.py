@@ -0,0 +1,19 @@
+from app.core.commands.quiz.check_available_quiz import CheckAvailableQuiz
+from tests.mocks.commiter import FakeCommiter
+from tests.mocks.notification_gateway import FakeNotificationMapper
+from tests.mocks.quiz_gateways import FakeQuizParticipationMapper
+
+
+async def test_check_available_quiz(
+    participation_gateway: FakeQuizParticipationMapper,
+    notification_gateway: FakeNotificationMapper,
+    commiter: FakeCommiter,
+) -> None:
+    command = CheckAvailableQuiz(
+        participation_gateway, notification_gateway, commiter
+    )
+
+    await command()
+
+    assert notification_gateway.saved
+    assert commiter.commited
@@ -0,0 +1,15 @@
+from app.core.commands.quiz.compact_quiz_result_index import (
+    CompactQuizResultIndex,
+)
+from tests.mocks.cache import FakeCache
+
+
+async def test_compact_quiz_result_index(cache: FakeCache) -> None:
+    await cache.set_cache("quiz_result:1", {"correct_answers": 2}, 1)
+    await cache.set_member_key("company:1", "quiz_result:1", "quiz_result:2")
+
+    command = CompactQuizResultIndex(cache)
+
+    await command()
+
+    assert cache.member_keys["company:1"] == {"quiz_result:1"}
@@ -63,4 +63,9 @@ async def test_create_quiz(
     assert quiz_gateway.saved
     assert question_gateway.saved
     assert answer_gateway.saved
+    assert [answer.question_id for answer in answer_gateway.answers[-4:]] == [
+        question.question_id
+        for question in question_gateway.questions[-2:]
+        for _ in range(2)
+    ]
     assert commiter.commited
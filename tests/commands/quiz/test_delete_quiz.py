@@ -2,10 +2,15 @@ import pytest
 
 from app.core.commands.quiz.delete_quiz import DeleteQuiz, DeleteQuizInputData
 from app.core.commands.quiz.errors import QuizNotFoundError
+from app.core.commands.quiz.service import (
+    LeaderboardService,
+    QuizAnalyticsService,
+)
 from app.core.common.access_service import AccessService
+from tests.mocks.cache import FakeCache
 from tests.mocks.commiter import FakeCommiter
 from tests.mocks.company_gateways import FakeCompanyMapper
-from tests.mocks.quiz_gateways import FakeQuizMapper
+from tests.mocks.quiz_gateways import FakeQuizMapper, FakeScoreRollupMapper
 
 
 @pytest.mark.parametrize(
@@ -13,14 +18,31 @@ from tests.mocks.quiz_gateways import FakeQuizMapper
 )
 async def test_delete_quiz(
     quiz_gateway: FakeQuizMapper,
+    score_rollup_gateway: FakeScoreRollupMapper,
     company_gateway: FakeCompanyMapper,
     access_service: AccessService,
+    leaderboard_service: LeaderboardService,
+    analytics_service: QuizAnalyticsService,
+    cache: FakeCache,
     commiter: FakeCommiter,
     quiz_id: int,
     exc_class,
 ):
     command = DeleteQuiz(
-        quiz_gateway, company_gateway, access_service, commiter
+        quiz_gateway,
+        score_rollup_gateway,
+        company_gateway,
+        access_service,
+        leaderboard_service,
+        analytics_service,
+        cache,
+        commiter,
+    )
+    cache.scores["leaderboard:1"] = {"2": 3}
+    await cache.set_cache("quiz_result:1", {"correct_answers": 2}, 0)
+    await cache.set_cache("quiz_results_loaded:1", {"company_id": 1}, 0)
+    await cache.set_member_key(
+        "company:1", "quiz_result:1", "quiz_results_loaded:1"
     )
     input_data = DeleteQuizInputData(quiz_id=quiz_id)
 
@@ -32,8 +54,15 @@ async def test_delete_quiz(
 
         assert not commiter.commited
         assert not quiz_gateway.deleted
+        assert not score_rollup_gateway.removed
+        assert "leaderboard:1" in cache.scores
+        assert "quiz_results_loaded:1" in cache.member_keys["company:1"]
     else:
         await coro
 
         assert commiter.commited
         assert quiz_gateway.deleted
+        assert score_rollup_gateway.removed == [1]
+        assert "leaderboard:1" not in cache.scores
+        assert "company:1" not in cache.member_keys
+        assert "quiz_results_loaded:1" not in cache.cache
@@ -0,0 +1,79 @@
+from datetime import datetime
+
+from app.core.commands.quiz.service import (
+    LEADERBOARD_SENTINEL,
+    LeaderboardService,
+)
+from app.core.entities.company import CompanyId
+from app.core.entities.quiz import QuizId
+from app.core.entities.user import UserId
+from app.core.interfaces.quiz_gateways import LeaderboardEntry
+from tests.mocks.cache import FakeCache
+from tests.mocks.quiz_gateways import FakeUserQuizStatsMapper
+
+COMPLETED_AT = datetime(2024, 1, 1)  # noqa: DTZ001
+
+
+async def test_leaderboard_rebuilds_from_stats(
+    leaderboard_service: LeaderboardService,
+    user_quiz_stats_gateway: FakeUserQuizStatsMapper,
+    cache: FakeCache,
+) -> None:
+    await user_quiz_stats_gateway.add_result(
+        UserId(1), QuizId(1), COMPLETED_AT, 2
+    )
+    await user_quiz_stats_gateway.add_result(
+        UserId(2), QuizId(1), COMPLETED_AT, 5
+    )
+    await user_quiz_stats_gateway.add_participation(
+        UserId(3), QuizId(1), COMPLETED_AT
+    )
+
+    top = await leaderboard_service.top(CompanyId(1), 10)
+    rank = await leaderboard_service.rank(CompanyId(1), UserId(1))
+    missing = await leaderboard_service.rank(CompanyId(1), UserId(3))
+
+    assert top == [LeaderboardEntry(2, 1, 5), LeaderboardEntry(1, 2, 2)]
+    assert rank == LeaderboardEntry(1, 2, 2)
+    assert missing is None
+    assert cache.scores["leaderboard:1"] == {
+        LEADERBOARD_SENTINEL: float("-inf"),
+        "1": 2,
+        "2": 5,
+    }
+
+
+async def test_empty_leaderboard_is_built_once(
+    leaderboard_service: LeaderboardService,
+    user_quiz_stats_gateway: FakeUserQuizStatsMapper,
+) -> None:
+    assert await leaderboard_service.top(CompanyId(1), 10) == []
+
+    await user_quiz_stats_gateway.add_result(
+        UserId(1), QuizId(1), COMPLETED_AT, 2
+    )
+
+    assert await leaderboard_service.top(CompanyId(1), 10) == []
+
+    await leaderboard_service.add_points(CompanyId(1), UserId(1), 2)
+
+    assert await leaderboard_service.top(CompanyId(1), 10) == [
+        LeaderboardEntry(1, 1, 2)
+    ]
+
+
+async def test_leaderboard_adds_points_to_built_board(
+    leaderboard_service: LeaderboardService, cache: FakeCache
+) -> None:
+    await leaderboard_service.add_points(CompanyId(1), UserId(1), 3)
+
+    assert "leaderboard:1" not in cache.scores
+
+    cache.scores["leaderboard:1"] = {"2": 4}
+
+    await leaderboard_service.add_points(CompanyId(1), UserId(1), 3)
+    await leaderboard_service.add_points(CompanyId(1), UserId(1), 2)
+
+    top = await leaderboard_service.top(CompanyId(1), 1)
+
+    assert top == [LeaderboardEntry(1, 1, 5)]
@@ -5,6 +5,11 @@ from app.core.commands.quiz.save_quiz_result import (
     SaveQuizResult,
     SaveQuizResultInputData,
 )
+from app.core.commands.quiz.service import (
+    LeaderboardService,
+    QuizAnalyticsService,
+)
+from app.core.commands.user.errors import AccessDeniedError
 from tests.mocks.cache import FakeCache
 from tests.mocks.commiter import FakeCommiter
 from tests.mocks.company_gateways import FakeCompanyUserMapper
@@ -13,12 +18,18 @@ from tests.mocks.quiz_gateways import (
     FakeQuizMapper,
     FakeQuizParticipationMapper,
     FakeQuizResultMapper,
+    FakeScoreRollupMapper,
+    FakeUserQuizStatsMapper,
 )
 
 
 @pytest.mark.parametrize(
-    ["participation_id", "exc_class"],
-    [(1, None), (2, QuizParticipationNotFoundError)],
+    ["participation_id", "company_user_id", "exc_class"],
+    [
+        (1, 1, None),
+        (2, 1, QuizParticipationNotFoundError),
+        (1, 3, AccessDeniedError),
+    ],
 )
 async def test_save_quiz_result(
     id_provider: FakeIdProvider,
@@ -26,9 +37,14 @@ async def test_save_quiz_result(
     quiz_gateway: FakeQuizMapper,
     company_user_gateway: FakeCompanyUserMapper,
     quiz_result_gateway: FakeQuizResultMapper,
+    score_rollup_gateway: FakeScoreRollupMapper,
+    user_quiz_stats_gateway: FakeUserQuizStatsMapper,
+    leaderboard_service: LeaderboardService,
+    analytics_service: QuizAnalyticsService,
     commiter: FakeCommiter,
     cache: FakeCache,
     participation_id: int,
+    company_user_id: int,
     exc_class,
 ) -> None:
     command = SaveQuizResult(
@@ -37,10 +53,17 @@ async def test_save_quiz_result(
         quiz_gateway,
         company_user_gateway,
         quiz_result_gateway,
+        score_rollup_gateway,
+        user_quiz_stats_gateway,
+        leaderboard_service,
+        analytics_service,
         cache,
         commiter,
     )
     id_provider.user.user_id = 2
+    participation_gateway.quiz_participation.company_user_id = company_user_id
+    cache.scores["leaderboard:1"] = {"1": 5}
+    cache.member_keys["analytics:1"] = set()
 
     input_data = SaveQuizResultInputData(participation_id, 2)
 
@@ -51,11 +74,18 @@ async def test_save_quiz_result(
             await coro
 
         assert not quiz_result_gateway.saved
+        assert not score_rollup_gateway.scores
+        assert not user_quiz_stats_gateway.stats
         assert not commiter.commited
         assert not cache.cached
+        assert cache.scores["leaderboard:1"] == {"1": 5}
     else:
         await coro
 
         assert quiz_result_gateway.saved
+        assert [score[2] for score in score_rollup_gateway.scores] == [2]
+        assert user_quiz_stats_gateway.stats[2, 1][:2] == [2, 1]
         assert commiter.commited
         assert cache.cached
+        assert cache.scores["leaderboard:1"] == {"1": 5, "2": 2}
+        assert "analytics:1" not in cache.member_keys
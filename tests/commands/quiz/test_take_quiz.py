@@ -1,13 +1,18 @@
+from datetime import UTC, datetime
+
 import pytest
 
 from app.core.commands.quiz.errors import QuizNotFoundError
+from app.core.commands.quiz.service import QuizAnalyticsService
 from app.core.commands.quiz.take_quiz import TakeQuiz, TakeQuizInputData
+from tests.mocks.cache import FakeCache
 from tests.mocks.commiter import FakeCommiter
 from tests.mocks.company_gateways import FakeCompanyUserMapper
 from tests.mocks.id_provider import FakeIdProvider
 from tests.mocks.quiz_gateways import (
     FakeQuizMapper,
     FakeQuizParticipationMapper,
+    FakeUserQuizStatsMapper,
 )
 
 
@@ -19,6 +24,9 @@ async def test_take_quiz(
     company_user_gateway: FakeCompanyUserMapper,
     quiz_gateway: FakeQuizMapper,
     participation_gateway: FakeQuizParticipationMapper,
+    user_quiz_stats_gateway: FakeUserQuizStatsMapper,
+    analytics_service: QuizAnalyticsService,
+    cache: FakeCache,
     commiter: FakeCommiter,
     quiz_id: int,
     exc_class,
@@ -28,11 +36,18 @@ async def test_take_quiz(
         company_user_gateway,
         quiz_gateway,
         participation_gateway,
+        user_quiz_stats_gateway,
+        analytics_service,
         commiter,
     )
     id_provider.user.user_id = 2
+    cache.cache["analytics:1:company_users_last_attempt"] = {"result": []}
+    cache.member_keys["analytics:1"] = {
+        "analytics:1:company_users_last_attempt"
+    }
 
     input_data = TakeQuizInputData(quiz_id)
+    started_at = datetime.now(UTC)
 
     coro = command(input_data)
 
@@ -41,9 +56,15 @@ async def test_take_quiz(
             await coro
 
         assert not participation_gateway.saved
+        assert not user_quiz_stats_gateway.stats
         assert not commiter.commited
+        assert "analytics:1" in cache.member_keys
     else:
         await coro
 
         assert participation_gateway.saved
+        assert user_quiz_stats_gateway.stats[2, 1][:2] == [0, 0]
+        assert user_quiz_stats_gateway.stats[2, 1][2] >= started_at
         assert commiter.commited
+        assert not cache.member_keys
+        assert not cache.cache
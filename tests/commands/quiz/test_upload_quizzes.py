@@ -0,0 +1,139 @@
+import pytest
+
+from app.core.commands.quiz.errors import InvalidQuizFileError
+from app.core.commands.quiz.upload_quizzes import (
+    UploadQuizzes,
+    UploadQuizzesInputData,
+)
+from app.core.commands.user.errors import AccessDeniedError
+from app.core.common.access_service import AccessService
+from app.core.entities.company import CompanyId
+from tests.mocks.commiter import FakeCommiter
+from tests.mocks.company_gateways import FakeCompanyMapper
+from tests.mocks.quiz_gateways import (
+    FakeAnswerMapper,
+    FakeQuestionMapper,
+    FakeQuizMapper,
+)
+from tests.mocks.upload_file import FakeUploadFile
+
+
+def make_quiz_data(quiz_id: object, title: str) -> dict:
+    return {
+        "quiz_id": quiz_id,
+        "title": title,
+        "description": "Uploaded",
+        "questions": [
+            {
+                "title": "Who",
+                "answers": [
+                    {"text": "+", "is_correct": True},
+                    {"text": "-", "is_correct": False},
+                ],
+            }
+        ],
+    }
+
+
+async def test_upload_quizzes(
+    access_service: AccessService,
+    company_gateway: FakeCompanyMapper,
+    quiz_gateway: FakeQuizMapper,
+    question_gateway: FakeQuestionMapper,
+    answer_gateway: FakeAnswerMapper,
+    commiter: FakeCommiter,
+) -> None:
+    uploader = FakeUploadFile(
+        [make_quiz_data(1, "Updated quiz"), make_quiz_data(2, "New quiz")]
+    )
+    command = UploadQuizzes(
+        company_gateway,
+        access_service,
+        uploader,
+        quiz_gateway,
+        question_gateway,
+        answer_gateway,
+        commiter,
+    )
+
+    await command(UploadQuizzesInputData(company_id=1, quiz_data=b""))
+
+    assert quiz_gateway.saved
+    assert quiz_gateway.quiz.description == "Uploaded"
+    assert len(question_gateway.questions) == 4
+    assert commiter.commited
+
+
+async def test_upload_quizzes_foreign_quiz(
+    access_service: AccessService,
+    company_gateway: FakeCompanyMapper,
+    quiz_gateway: FakeQuizMapper,
+    question_gateway: FakeQuestionMapper,
+    answer_gateway: FakeAnswerMapper,
+    commiter: FakeCommiter,
+) -> None:
+    quiz_gateway.quiz.company_id = CompanyId(2)
+
+    uploader = FakeUploadFile([make_quiz_data(1, "Updated quiz")])
+    command = UploadQuizzes(
+        company_gateway,
+        access_service,
+        uploader,
+        quiz_gateway,
+        question_gateway,
+        answer_gateway,
+        commiter,
+    )
+
+    with pytest.raises(AccessDeniedError):
+        await command(UploadQuizzesInputData(company_id=1, quiz_data=b""))
+
+    assert not question_gateway.saved
+    assert not commiter.commited
+
+
+@pytest.mark.parametrize(
+    ["quiz_id", "exc_class"],
+    [
+        (None, None),
+        ("", None),
+        (" ", None),
+        (float("nan"), None),
+        ("not a number", InvalidQuizFileError),
+    ],
+)
+async def test_upload_quizzes_without_id(
+    access_service: AccessService,
+    company_gateway: FakeCompanyMapper,
+    quiz_gateway: FakeQuizMapper,
+    question_gateway: FakeQuestionMapper,
+    answer_gateway: FakeAnswerMapper,
+    commiter: FakeCommiter,
+    quiz_id: object,
+    exc_class,
+) -> None:
+    uploader = FakeUploadFile([make_quiz_data(quiz_id, "New quiz")])
+    command = UploadQuizzes(
+        company_gateway,
+        access_service,
+        uploader,
+        quiz_gateway,
+        question_gateway,
+        answer_gateway,
+        commiter,
+    )
+
+    coro = command(UploadQuizzesInputData(company_id=1, quiz_data=b""))
+
+    if exc_class:
+        with pytest.raises(exc_class):
+            await coro
+
+        assert not commiter.commited
+    else:
+        await coro
+
+        # The fake gateway leaves ids of added quizzes unset
+        assert quiz_gateway.saved
+        assert question_gateway.questions[-1].quiz_id is None
+        assert commiter.commited
@@ -0,0 +1,101 @@
+import pytest
+
+from app.core.commands.company.errors import CompanyUserNotFoundError
+from app.core.commands.user.errors import AccessDeniedError
+from app.core.common.access_service import AccessService
+from app.core.entities.company import CompanyRole
+from tests.mocks.company_gateways import (
+    FakeCompanyMapper,
+    FakeCompanyUserMapper,
+)
+from tests.mocks.id_provider import FakeIdProvider
+
+
+@pytest.mark.parametrize(
+    ["actor_id", "member_role", "role"],
+    [
+        (1, CompanyRole.MEMBER, CompanyRole.OWNER),
+        (2, CompanyRole.ADMIN, CompanyRole.ADMIN),
+        (2, CompanyRole.MEMBER, CompanyRole.MEMBER),
+        (2, CompanyRole.OWNER, CompanyRole.MEMBER),
+        (3, CompanyRole.ADMIN, None),
+    ],
+)
+async def test_resolve_role(
+    access_service: AccessService,
+    company_gateway: FakeCompanyMapper,
+    company_user_gateway: FakeCompanyUserMapper,
+    id_provider: FakeIdProvider,
+    actor_id: int,
+    member_role: CompanyRole,
+    role: CompanyRole | None,
+) -> None:
+    id_provider.user.user_id = actor_id
+    company_user_gateway.company_user.role = member_role
+
+    assert await access_service.resolve_role(company_gateway.company) == role
+
+
+async def test_resolve_role_is_memoized(
+    access_service: AccessService,
+    company_gateway: FakeCompanyMapper,
+    company_user_gateway: FakeCompanyUserMapper,
+    id_provider: FakeIdProvider,
+) -> None:
+    id_provider.user.user_id = 2
+    company_user_gateway.company_user.role = CompanyRole.ADMIN
+
+    await access_service.ensure_can_create_quiz(company_gateway.company)
+
+    company_user_gateway.company_user.role = CompanyRole.MEMBER
+    id_provider.requested = False
+
+    await access_service.ensure_can_delete_quiz(company_gateway.company)
+
+    assert not id_provider.requested
+
+
+@pytest.mark.parametrize(
+    ["actor_id", "exc_class"],
+    [(2, AccessDeniedError), (3, CompanyUserNotFoundError)],
+)
+async def test_ensure_can_create_quiz_denied(
+    access_service: AccessService,
+    company_gateway: FakeCompanyMapper,
+    company_user_gateway: FakeCompanyUserMapper,
+    id_provider: FakeIdProvider,
+    actor_id: int,
+    exc_class,
+) -> None:
+    id_provider.user.user_id = actor_id
+    company_user_gateway.company_user.role = CompanyRole.MEMBER
+
+    with pytest.raises(exc_class):
+        await access_service.ensure_can_create_quiz(company_gateway.company)
+
+
+@pytest.mark.parametrize(
+    ["actor_id", "exc_class"], [(1, None), (2, AccessDeniedError)]
+)
+async def test_owner_check_skips_membership_lookup(
+    access_service: AccessService,
+    company_gateway: FakeCompanyMapper,
+    company_user_gateway: FakeCompanyUserMapper,
+    id_provider: FakeIdProvider,
+    monkeypatch: pytest.MonkeyPatch,
+    actor_id: int,
+    exc_class,
+) -> None:
+    async def by_company(*args) -> None:
+        pytest.fail("Ownership must not load the membership")
+
+    monkeypatch.setattr(company_user_gateway, "by_company", by_company)
+    id_provider.user.user_id = actor_id
+
+    coro = access_service.ensure_can_edit_company(company_gateway.company)
+
+    if exc_class:
+        with pytest.raises(exc_class):
+            await coro
+    else:
+        await coro
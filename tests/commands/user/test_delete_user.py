@@ -1,9 +1,14 @@
 import pytest
 
+from app.core.commands.quiz.service import QuizAnalyticsService
 from app.core.commands.user.delete_user import DeleteUser, DeleteUserInputData
 from app.core.commands.user.errors import UserNotFoundError
 from app.core.common.access_service import AccessService
+from app.core.entities.user import UserId
+from tests.mocks.cache import FakeCache
 from tests.mocks.commiter import FakeCommiter
+from tests.mocks.company_gateways import FakeCompanyUserMapper
+from tests.mocks.quiz_gateways import FakeScoreRollupMapper
 from tests.mocks.user_gateways import FakeUserMapper
 
 
@@ -12,12 +17,30 @@ from tests.mocks.user_gateways import FakeUserMapper
 )
 async def test_delete_user(
     user_gateway: FakeUserMapper,
+    company_user_gateway: FakeCompanyUserMapper,
+    score_rollup_gateway: FakeScoreRollupMapper,
+    analytics_service: QuizAnalyticsService,
     commiter: FakeCommiter,
     access_service: AccessService,
+    cache: FakeCache,
     user_id: int,
     exc_class,
 ) -> None:
-    command = DeleteUser(user_gateway, commiter, access_service)
+    command = DeleteUser(
+        user_gateway,
+        company_user_gateway,
+        score_rollup_gateway,
+        analytics_service,
+        commiter,
+        access_service,
+        cache,
+    )
+    company_user_gateway.company_user.user_id = UserId(user_id)
+    await cache.set_cache("analytics:1:average", {"average": 2}, 0)
+    await cache.set_member_key("analytics:1", "analytics:1:average")
+    await cache.set_cache("analytics:total_average", {"average": 2}, 0)
+    await cache.set_cache("quiz_results_loaded:1", {"company_id": 1}, 0)
+    await cache.set_member_key("company:1", "quiz_results_loaded:1")
     input_data = DeleteUserInputData(user_id)
 
     coro = command(input_data)
@@ -28,8 +51,15 @@ async def test_delete_user(
 
         assert not commiter.commited
         assert not user_gateway.deleted
+        assert not score_rollup_gateway.removed
+        assert "analytics:total_average" in cache.cache
+        assert "company:1" in cache.member_keys
     else:
         await coro
 
         assert commiter.commited
         assert user_gateway.deleted
+        assert score_rollup_gateway.removed
+        assert "analytics:1:average" not in cache.cache
+        assert "analytics:total_average" not in cache.cache
+        assert "company:1" not in cache.member_keys
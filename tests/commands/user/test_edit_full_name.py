@@ -8,6 +8,8 @@ from app.core.commands.user.edit_full_name import (
 from app.core.commands.user.errors import UserNotFoundError
 from app.core.common.access_service import AccessService
 from app.core.entities.value_objects import FullName
+from app.utils.get_cache_key import get_user_identity_cache_key
+from tests.mocks.cache import FakeCache
 from tests.mocks.commiter import FakeCommiter
 from tests.mocks.user_gateways import FakeUserMapper
 
@@ -19,14 +21,18 @@ async def test_full_name(
     user_gateway: FakeUserMapper,
     access_service: AccessService,
     commiter: FakeCommiter,
+    cache: FakeCache,
     user_id: int,
     exc_class,
 ) -> None:
     full_name = FullName("NewTest", "NewTestovich")
 
-    command = EditFullName(user_gateway, access_service, commiter)
+    command = EditFullName(user_gateway, access_service, commiter, cache)
     input_data = EditFullNameInputData(user_id, "NewTest", "NewTestovich")
 
+    cache_key = get_user_identity_cache_key(user_gateway.user.email)
+    cache.cache[cache_key] = {"user_id": user_gateway.user.user_id}
+
     coro = command(input_data)
 
     if exc_class:
@@ -44,3 +50,4 @@ async def test_full_name(
 
         assert user_gateway.user.full_name == full_name
         assert user_gateway.user.user_id == output_data.user_id
+        assert cache_key not in cache.cache
@@ -11,6 +11,7 @@ from app.core.commands.user.errors import (
 from app.core.common.access_service import AccessService
 from app.core.entities.value_objects import UserRawPassword
 from app.core.interfaces.password_hasher import PasswordHasher
+from tests.mocks.cache import FakeCache
 from tests.mocks.commiter import FakeCommiter
 from tests.mocks.user_gateways import FakeUserMapper
 
@@ -28,13 +29,14 @@ async def test_edit_password(
     password_hasher: PasswordHasher,
     access_service: AccessService,
     commiter: FakeCommiter,
+    cache: FakeCache,
     user_pwd: UserRawPassword,
     user_id: int,
     pwd_startswith: str,
     exc_class,
 ):
     command = EditPassword(
-        user_gateway, password_hasher, access_service, commiter
+        user_gateway, password_hasher, access_service, commiter, cache
     )
     input_data = EditPasswordInputData(
         user_id=user_id,
@@ -1,4 +1,3 @@
-import argon2
 import pytest
 
 from app.core.entities.user import User, UserId
@@ -8,6 +7,7 @@ from app.core.entities.value_objects import (
     UserRawPassword,
 )
 from app.core.interfaces.password_hasher import PasswordHasher
+from app.infrastructure.auth.config import PasswordHasherConfig
 from app.infrastructure.auth.password_hasher import ArgonPasswordHasher
 from tests.mocks.id_provider import FakeIdProvider
 
@@ -34,18 +34,18 @@ def user_fake_id() -> UserId:
 
 @pytest.fixture
 def password_hasher() -> PasswordHasher:
-    return ArgonPasswordHasher(argon2.PasswordHasher())
+    return ArgonPasswordHasher(PasswordHasherConfig())
 
 
 @pytest.fixture
-def user(
+async def user(
     password_hasher: PasswordHasher,
     user_email: UserEmail,
     user_pwd: UserRawPassword,
     user_fake_id: UserId,
     user_full_name: FullName,
 ) -> User:
-    hashed_password = password_hasher.hash_password(user_pwd)
+    hashed_password = await password_hasher.hash_password(user_pwd)
 
     return User(user_fake_id, user_full_name, user_email, hashed_password)
 
@@ -0,0 +1,59 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.core.commands.user.errors import AccessTokenIsExpiredError
+from app.infrastructure.auth.access_token_processor import (
+    AccessTokenProcessor,
+)
+from app.infrastructure.cache.metrics import QueryCacheMetrics
+from app.infrastructure.jwt.exception import JWTExpiredError
+from app.infrastructure.jwt.jwt_processor import JWTPayload, JWTToken
+
+
+class FakeJWTProcessor:
+    def __init__(self, expires_in: datetime):
+        self.expires_in = expires_in
+        self.decoded = 0
+
+    def decode(self, token: JWTToken) -> JWTPayload:
+        self.decoded += 1
+
+        if self.expires_in <= datetime.now(UTC):
+            raise JWTExpiredError
+
+        return {
+            "sub": {"email": f"{token}@gmail.com"},
+            "exp": self.expires_in.timestamp(),
+        }
+
+
+def test_decode_is_cached() -> None:
+    jwt_processor = FakeJWTProcessor(datetime.now(UTC) + timedelta(hours=1))
+    processor = AccessTokenProcessor(jwt_processor)
+    processor.cache_size = 2
+
+    for token in ("first", "first", "second", "third", "first"):
+        processor.decode(token)
+
+    assert processor.stats.metrics() == [
+        QueryCacheMetrics(query="decode", hits=1, misses=4, hit_ratio=0.2)
+    ]
+    assert jwt_processor.decoded == 4
+    assert len(processor.cache) == 2
+
+
+def test_expired_token_is_not_served_from_cache() -> None:
+    jwt_processor = FakeJWTProcessor(datetime.now(UTC) + timedelta(hours=1))
+    processor = AccessTokenProcessor(jwt_processor)
+
+    token_data = processor.decode("first")
+    processor.cache[next(iter(processor.cache))] = type(token_data)(
+        email=token_data.email, expires_in=datetime.now(UTC)
+    )
+    jwt_processor.expires_in = datetime.now(UTC)
+
+    with pytest.raises(AccessTokenIsExpiredError):
+        processor.decode("first")
+
+    assert not processor.cache
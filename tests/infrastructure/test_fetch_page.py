@@ -0,0 +1,150 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.core.common.pagination import (
+    InvalidCursorError,
+    Pagination,
+    SortOrder,
+)
+from app.infrastructure.gateways.pagination import (
+    CURSOR_CREATED_AT_COLUMN,
+    CURSOR_ID_COLUMN,
+    TOTAL_COLUMN,
+    decode_cursor,
+    encode_cursor,
+    fetch_page,
+    paginate,
+)
+from app.infrastructure.persistence.models.user import users_table
+
+# Columns are naive timestamps, as stored by the database
+CREATED_AT = datetime(2026, 1, 1, 12)  # noqa: DTZ001
+
+
+class FakeResult:
+    def __init__(self, rows: list[dict]):
+        self.rows = rows
+
+    def mappings(self) -> "FakeResult":
+        return self
+
+    def all(self) -> list[dict]:
+        return self.rows
+
+
+class FakeSession:
+    def __init__(self, rows: list[dict], total: int = 0):
+        self.rows = rows
+        self.total = total
+        self.statements = []
+        self.scalars = 0
+
+    async def execute(self, query):
+        self.statements.append(
+            str(
+                query.compile(
+                    dialect=postgresql.dialect(),
+                    compile_kwargs={"literal_binds": True},
+                )
+            )
+        )
+        return FakeResult(self.rows)
+
+    async def scalar(self, query) -> int:
+        self.scalars += 1
+        return self.total
+
+
+def _queries(pagination: Pagination):
+    query = paginate(
+        select(users_table.c.user_id),
+        users_table.c.created_at,
+        users_table.c.user_id,
+        pagination,
+    )
+    count_query = select(users_table.c.user_id)
+
+    return query, count_query, pagination
+
+
+def _row(row_id: int, total: int) -> dict:
+    return {
+        "user_id": row_id,
+        CURSOR_CREATED_AT_COLUMN: CREATED_AT,
+        CURSOR_ID_COLUMN: row_id,
+        TOTAL_COLUMN: total,
+    }
+
+
+async def test_total_comes_from_window_column() -> None:
+    session = FakeSession([_row(1, 42)])
+
+    page = await fetch_page(
+        session, *_queries(Pagination(offset=20, limit=10))
+    )
+
+    assert page.total == 42
+    assert len(page.items) == 1
+    assert page.next_cursor is None
+    assert session.scalars == 0
+    assert "count(*) OVER ()" in session.statements[0]
+
+
+async def test_empty_first_page_skips_count() -> None:
+    session = FakeSession([])
+
+    page = await fetch_page(session, *_queries(Pagination(offset=0, limit=10)))
+
+    assert page.total == 0
+    assert session.scalars == 0
+
+
+async def test_page_past_the_end_falls_back_to_count() -> None:
+    session = FakeSession([], total=7)
+
+    page = await fetch_page(
+        session, *_queries(Pagination(offset=20, limit=10))
+    )
+
+    assert page.total == 7
+    assert not page.items
+    assert session.scalars == 1
+
+
+async def test_full_page_returns_cursor_of_last_row() -> None:
+    session = FakeSession([_row(row_id, 42) for row_id in range(1, 4)])
+
+    page = await fetch_page(session, *_queries(Pagination(limit=2)))
+
+    assert [row["user_id"] for row in page.items] == [1, 2]
+    assert decode_cursor(page.next_cursor) == (CREATED_AT, 2)
+    assert "LIMIT 3" in session.statements[0]
+
+
+async def test_cursor_seeks_instead_of_offset() -> None:
+    cursor = encode_cursor(CREATED_AT, 2)
+    session = FakeSession([_row(3, 42)])
+
+    page = await fetch_page(
+        session,
+        *_queries(Pagination(100, 2, SortOrder.DESC, cursor)),
+    )
+
+    statement = session.statements[0]
+    assert page.total == 42
+    assert "(users.created_at, users.user_id) <" in statement
+    assert "OFFSET" not in statement
+    assert "OVER ()" not in statement
+
+
+def test_invalid_cursor_is_rejected() -> None:
+    with pytest.raises(InvalidCursorError):
+        paginate(
+            select(users_table.c.user_id),
+            users_table.c.created_at,
+            users_table.c.user_id,
+            Pagination(cursor="not a cursor"),
+        )
@@ -0,0 +1,41 @@
+from datetime import UTC, datetime, timedelta
+
+from app.core.commands.user.sign_in import AccessTokenData
+from app.core.entities.user import User
+from app.core.entities.value_objects import UserEmail
+from app.infrastructure.auth.id_provider import TokenIdProvider
+from app.utils.get_cache_key import get_user_identity_cache_key
+from tests.mocks.cache import FakeCache
+from tests.mocks.user_gateways import FakeUserMapper
+
+
+async def test_get_user_is_cached(user: User) -> None:
+    cache = FakeCache()
+    token = AccessTokenData(
+        email=user.email.to_row(),
+        expires_in=datetime.now(UTC) + timedelta(minutes=5),
+    )
+
+    id_provider = TokenIdProvider(token, FakeUserMapper(user), cache)
+
+    actor = await id_provider.get_user()
+
+    assert actor is await id_provider.get_user()
+    assert (
+        "hashed_password"
+        not in cache.cache[get_user_identity_cache_key(user.email)]
+    )
+
+    other_user = User(
+        user.user_id,
+        user.full_name,
+        UserEmail("other@gmail.com"),
+        user.hashed_password,
+    )
+    id_provider = TokenIdProvider(token, FakeUserMapper(other_user), cache)
+
+    cached_actor = await id_provider.get_user()
+
+    assert cached_actor.user_id == actor.user_id
+    assert cached_actor.email == actor.email
+    assert cached_actor.full_name == actor.full_name
@@ -0,0 +1,81 @@
+import pytest
+from sqlalchemy import inspect
+
+from app.core.entities.company import CompanyRole, CompanyUser
+from app.infrastructure.gateways.company import CompanyUserMapper
+from app.infrastructure.persistence.metrics import (
+    QueryCounter,
+    count_query,
+    current_query_counter,
+)
+from app.infrastructure.persistence.models import map_tables
+
+
+class FakeResult:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar_one_or_none(self):
+        return self.value
+
+
+class FakeSession:
+    def __init__(self, loaded: list[object]):
+        self.identity_map = dict(enumerate(loaded))
+        self.executed = 0
+
+    async def execute(self, query):
+        self.executed += 1
+        return FakeResult(None)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _mapped_tables() -> None:
+    # Entities are mapped imperatively once per process, as on app startup
+    if inspect(CompanyUser, raiseerr=False) is None:
+        map_tables()
+
+
+def _member(company_id: int, user_id: int) -> CompanyUser:
+    return CompanyUser(
+        company_user_id=user_id,
+        company_id=company_id,
+        user_id=user_id,
+        role=CompanyRole.MEMBER,
+    )
+
+
+async def test_by_company_reuses_loaded_membership() -> None:
+    member = _member(company_id=1, user_id=2)
+    session = FakeSession([_member(company_id=2, user_id=2), member])
+
+    found = await CompanyUserMapper(session).by_company(1, 2)
+
+    assert found is member
+    assert session.executed == 0
+
+
+async def test_by_company_queries_when_not_loaded() -> None:
+    session = FakeSession([_member(company_id=1, user_id=3)])
+
+    found = await CompanyUserMapper(session).by_company(1, 2)
+
+    assert found is None
+    assert session.executed == 1
+
+
+def test_count_query_uses_context_counter() -> None:
+    counter = QueryCounter()
+
+    count_query(None, None, "SELECT 1", {}, None, executemany=False)
+
+    token = current_query_counter.set(counter)
+    try:
+        count_query(None, None, "SELECT 1", {}, None, executemany=False)
+        count_query(None, None, "SELECT 1", {}, None, executemany=False)
+    finally:
+        current_query_counter.reset(token)
+
+    count_query(None, None, "SELECT 1", {}, None, executemany=False)
+
+    assert counter.queries == 2
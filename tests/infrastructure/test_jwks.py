@@ -0,0 +1,155 @@
+import json
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+from jwt.exceptions import PyJWKClientConnectionError
+
+from app.infrastructure.jwt.config import Auth0Config, JWTConfig
+from app.infrastructure.jwt.exception import JWTDecodeError
+from app.infrastructure.jwt.jwks import (
+    FileJWKSource,
+    JWKSCache,
+    JWKSource,
+)
+from app.infrastructure.jwt.jwt_processor import PyJWTProcessor
+
+AUDIENCE = "quiz-app"
+
+
+class CountingJWKSource(FileJWKSource):
+    def __init__(self, path: str):
+        super().__init__(path)
+
+        self.fetched = 0
+
+    def fetch(self) -> dict:
+        self.fetched += 1
+
+        return super().fetch()
+
+
+class UnreachableJWKSource(JWKSource):
+    def fetch(self) -> dict:
+        raise PyJWKClientConnectionError("Connection refused")
+
+
+def write_jwks(path: Path, kid: str) -> rsa.RSAPrivateKey:
+    private_key = rsa.generate_private_key(
+        public_exponent=65537, key_size=2048
+    )
+
+    jwk = json.loads(RSAAlgorithm.to_jwk(private_key.public_key()))
+    jwk.update(kid=kid, use="sig", alg="RS256")
+    path.write_text(json.dumps({"keys": [jwk]}))
+
+    return private_key
+
+
+def remove_jwks(path: Path) -> None:
+    path.unlink()
+
+
+def make_token(private_key: rsa.RSAPrivateKey, kid: str) -> str:
+    payload = {
+        "email": "test@gmail.com",
+        "aud": AUDIENCE,
+        "exp": datetime.now(UTC) + timedelta(minutes=5),
+    }
+
+    return jwt.encode(
+        payload, private_key, algorithm="RS256", headers={"kid": kid}
+    )
+
+
+@pytest.fixture
+def jwks_path(tmp_path: Path) -> Path:
+    return tmp_path / "jwks.json"
+
+
+def make_processor(
+    jwks_path: Path,
+) -> tuple[PyJWTProcessor, CountingJWKSource]:
+    auth0_config = Auth0Config(
+        domain="example.com", audience=AUDIENCE, jwks_file=str(jwks_path)
+    )
+    source = CountingJWKSource(auth0_config.jwks_file)
+    processor = PyJWTProcessor(
+        JWTConfig(key="secret", algorithm="HS256"),
+        auth0_config,
+        JWKSCache(source, auth0_config),
+    )
+
+    return processor, source
+
+
+async def test_decode_oauth_caches_jwks(jwks_path: Path) -> None:
+    private_key = write_jwks(jwks_path, "first")
+    processor, source = make_processor(jwks_path)
+
+    for _ in range(3):
+        payload = await processor.decode_oauth(
+            make_token(private_key, "first")
+        )
+
+        assert payload["email"] == "test@gmail.com"
+
+    assert source.fetched == 1
+
+
+async def test_decode_oauth_unknown_kid(jwks_path: Path) -> None:
+    private_key = write_jwks(jwks_path, "first")
+    processor, source = make_processor(jwks_path)
+
+    with pytest.raises(JWTDecodeError):
+        await processor.decode_oauth(make_token(private_key, "second"))
+
+    # Unknown kid right after a fetch does not hit the source again
+    with pytest.raises(JWTDecodeError):
+        await processor.decode_oauth(make_token(private_key, "second"))
+
+    assert source.fetched == 1
+
+
+async def test_decode_oauth_refreshes_on_rotated_key(jwks_path: Path) -> None:
+    write_jwks(jwks_path, "first")
+    processor, source = make_processor(jwks_path)
+    await processor.jwks_cache.get_signing_key("first")
+
+    private_key = write_jwks(jwks_path, "second")
+    processor.jwks_cache.fetched_at -= 60
+    processor.jwks_cache.attempted_at -= 60
+
+    payload = await processor.decode_oauth(make_token(private_key, "second"))
+
+    assert payload["aud"] == AUDIENCE
+    assert source.fetched == 2
+
+
+async def test_refresh_failure_serves_cached_key(jwks_path: Path) -> None:
+    write_jwks(jwks_path, "first")
+    processor, source = make_processor(jwks_path)
+    key = await processor.jwks_cache.get_signing_key("first")
+
+    remove_jwks(jwks_path)
+    processor.jwks_cache.fetched_at -= 3600
+    processor.jwks_cache.attempted_at -= 3600
+
+    assert await processor.jwks_cache.get_signing_key("first") is key
+    # The failed refresh is not retried on every request
+    assert await processor.jwks_cache.get_signing_key("first") is key
+    assert source.fetched == 2
+
+    with pytest.raises(JWTDecodeError):
+        await processor.jwks_cache.get_signing_key("second")
+
+
+async def test_unreachable_source_raises_decode_error() -> None:
+    auth0_config = Auth0Config(domain="example.com", audience=AUDIENCE)
+    jwks_cache = JWKSCache(UnreachableJWKSource(), auth0_config)
+
+    with pytest.raises(JWTDecodeError):
+        await jwks_cache.get_signing_key("first")
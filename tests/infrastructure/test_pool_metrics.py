@@ -0,0 +1,57 @@
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.infrastructure.persistence.metrics import (
+    InstrumentedPool,
+    QueryMetrics,
+    QueryStats,
+    count_query,
+)
+from app.infrastructure.persistence.provider import get_async_session
+
+
+async def test_pool_metrics() -> None:
+    engine = create_async_engine(
+        "sqlite+aiosqlite://", poolclass=InstrumentedPool, pool_size=2
+    )
+
+    async with engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+
+        assert engine.pool.metrics().checked_out == 1
+
+    metrics = engine.pool.metrics()
+
+    assert metrics.size == 2
+    assert metrics.checkouts == 1
+    assert metrics.checked_out == 0
+    assert metrics.checkout_max_ms >= metrics.checkout_avg_ms > 0
+
+    await engine.dispose()
+
+
+async def test_session_query_metrics() -> None:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    event.listen(engine.sync_engine, "before_cursor_execute", count_query)
+    stats = QueryStats()
+
+    for queries in (2, 1):
+        sessions = get_async_session(async_sessionmaker(engine), stats)
+        session = await anext(sessions)
+
+        for _ in range(queries):
+            await session.execute(text("SELECT 1"))
+
+        await sessions.aclose()
+
+    async with engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+
+    assert stats.metrics() == QueryMetrics(
+        requests=2,
+        queries=3,
+        queries_per_request_avg=1.5,
+        queries_per_request_max=2,
+    )
+
+    await engine.dispose()
@@ -0,0 +1,122 @@
+from datetime import datetime
+
+from sqlalchemy.dialects import postgresql
+
+from app.core.common.pagination import Pagination
+from app.core.interfaces.quiz_gateways import QuizFilters
+from app.infrastructure.gateways.pagination import (
+    CURSOR_CREATED_AT_COLUMN,
+    CURSOR_ID_COLUMN,
+    TOTAL_COLUMN,
+)
+from app.infrastructure.gateways.quiz import SQLAlchemyQuizReader
+
+# Columns are naive timestamps, as stored by the database
+CREATED_AT = datetime(2026, 1, 1, 12)  # noqa: DTZ001
+
+
+class FakeResult:
+    def __init__(self, rows: list[dict]):
+        self.rows = rows
+
+    def mappings(self) -> "FakeResult":
+        return self
+
+    def all(self) -> list[dict]:
+        return self.rows
+
+
+class FakeSession:
+    def __init__(self, *results: list[dict]):
+        self.results = list(results)
+        self.statements = []
+
+    async def execute(self, query) -> FakeResult:
+        self.statements.append(
+            str(
+                query.compile(
+                    dialect=postgresql.dialect(),
+                    compile_kwargs={"literal_binds": True},
+                )
+            )
+        )
+        return FakeResult(self.results.pop(0))
+
+
+def test_load_models_groups_answers_by_question() -> None:
+    reader = SQLAlchemyQuizReader(session=None)
+
+    quiz_rows = [
+        {
+            "quiz_id": quiz_id,
+            "title": "Quiz",
+            "description": "Description",
+            "participation_count": 0,
+        }
+        for quiz_id in range(3)
+    ]
+    question_rows = [
+        {
+            "quiz_id": quiz_id,
+            "question_id": quiz_id * 50 + question,
+            "question_title": "Question",
+            "answer_id": (quiz_id * 50 + question) * 4 + answer,
+            "answer_text": "Answer",
+            "is_correct": answer == 0,
+        }
+        for quiz_id in range(3)
+        for question in range(50)
+        for answer in range(4)
+    ]
+
+    quizzes = reader._load_models(quiz_rows, question_rows)
+
+    assert [quiz.quiz_id for quiz in quizzes] == [0, 1, 2]
+    for quiz in quizzes:
+        assert len(quiz.questions) == 50
+        for question in quiz.questions:
+            assert len(question.answers) == 4
+            assert question.answers[0].is_correct
+
+
+async def test_page_limits_quizzes_before_loading_questions() -> None:
+    quiz_rows = [
+        {
+            "quiz_id": quiz_id,
+            "title": "Quiz",
+            "description": "Description",
+            "participation_count": 0,
+            CURSOR_CREATED_AT_COLUMN: CREATED_AT,
+            CURSOR_ID_COLUMN: quiz_id,
+            TOTAL_COLUMN: 5,
+        }
+        for quiz_id in range(3)
+    ]
+    question_rows = [
+        {
+            "quiz_id": quiz_id,
+            "question_id": quiz_id * 10 + question,
+            "question_title": "Question",
+            "answer_id": (quiz_id * 10 + question) * 2 + answer,
+            "answer_text": "Answer",
+            "is_correct": answer == 0,
+        }
+        for quiz_id in range(2)
+        for question in range(3)
+        for answer in range(2)
+    ]
+    session = FakeSession(quiz_rows, question_rows)
+
+    page = await SQLAlchemyQuizReader(session).page(
+        QuizFilters(company_id=1), Pagination(0, 2)
+    )
+
+    assert page.total == 5
+    assert [quiz.quiz_id for quiz in page.items] == [0, 1]
+    assert [len(quiz.questions) for quiz in page.items] == [3, 3]
+
+    quizzes_sql, questions_sql = session.statements
+    assert "questions" not in quizzes_sql
+    assert "LIMIT 3" in quizzes_sql
+    assert "quiz_id IN (0, 1)" in questions_sql
+    assert "LIMIT" not in questions_sql
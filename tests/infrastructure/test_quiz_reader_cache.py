@@ -0,0 +1,81 @@
+from datetime import datetime
+from decimal import Decimal
+
+from app.core.commands.quiz.service import QuizAnalyticsService
+from app.core.entities.company import CompanyId
+from app.core.interfaces.quiz_gateways import (
+    AverageScore,
+    TimeRange,
+    UserLastAttempt,
+)
+from app.infrastructure.cache.metrics import CacheStats, QueryCacheMetrics
+from app.infrastructure.gateways.quiz import SQLAlchemyQuizReader
+from app.infrastructure.gateways.quiz_cache import CachedQuizReader
+from tests.mocks.cache import FakeCache
+
+STARTED_AT = datetime(2024, 1, 1)  # noqa: DTZ001
+
+
+class CountingQuizReader(SQLAlchemyQuizReader):
+    def __init__(self):
+        super().__init__(session=None)
+
+        self.calls = 0
+
+    async def get_company_average_scores_over_time(
+        self, company_id: CompanyId, time_range: TimeRange
+    ) -> list[AverageScore]:
+        self.calls += 1
+
+        return [AverageScore(STARTED_AT, Decimal("1.5"))]
+
+    async def get_company_users_last_attempt(
+        self, company_id: CompanyId
+    ) -> list[UserLastAttempt]:
+        self.calls += 1
+
+        return [UserLastAttempt(1, STARTED_AT)]
+
+    async def total_average(self) -> float:
+        self.calls += 1
+
+        return 50.0
+
+
+async def test_cached_quiz_reader_reads_through_until_invalidated() -> None:
+    reader = CountingQuizReader()
+    cache = FakeCache()
+    stats = CacheStats()
+    cached_reader = CachedQuizReader(reader, cache, stats)
+
+    for _ in range(3):
+        scores = await cached_reader.get_company_average_scores_over_time(
+            CompanyId(1), TimeRange.MONTH
+        )
+        attempts = await cached_reader.get_company_users_last_attempt(
+            CompanyId(1)
+        )
+        average = await cached_reader.total_average()
+
+    assert scores == [AverageScore(STARTED_AT, Decimal("1.5"))]
+    assert attempts == [UserLastAttempt(1, STARTED_AT)]
+    assert average == 50.0
+    assert reader.calls == 3
+
+    await QuizAnalyticsService(cache).invalidate(CompanyId(2))
+    await cached_reader.get_company_users_last_attempt(CompanyId(1))
+
+    assert reader.calls == 3
+
+    await QuizAnalyticsService(cache).invalidate(CompanyId(1))
+    await cached_reader.get_company_average_scores_over_time(
+        CompanyId(1), TimeRange.MONTH
+    )
+    await cached_reader.total_average()
+
+    assert reader.calls == 5
+    assert stats.metrics() == [
+        QueryCacheMetrics("company_average_scores", 2, 2, 0.5),
+        QueryCacheMetrics("company_users_last_attempt", 3, 1, 0.75),
+        QueryCacheMetrics("total_average", 2, 2, 0.5),
+    ]
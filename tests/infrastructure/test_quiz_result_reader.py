@@ -0,0 +1,113 @@
+from app.core.commands.quiz.compact_quiz_result_index import (
+    CompactQuizResultIndex,
+)
+from app.infrastructure.gateways.quiz import SQLAlchemyQuizResultReader
+from tests.mocks.cache import FakeCache
+
+
+class FakeResult:
+    def __init__(self, rows: list[dict]):
+        self.rows = rows
+
+    def mappings(self) -> list[dict]:
+        return self.rows
+
+
+class FakeSession:
+    def __init__(self, rows: list[dict]):
+        self.rows = rows
+        self.executed = 0
+
+    async def execute(self, query) -> FakeResult:
+        self.executed += 1
+        return FakeResult(self.rows)
+
+
+def _row(participation_id: int, correct_answers: int = 1) -> dict:
+    return {
+        "quiz_result_id": participation_id,
+        "participation_id": participation_id,
+        "company_user_id": 1,
+        "company_id": 1,
+        "quiz_id": 1,
+        "correct_answers": correct_answers,
+    }
+
+
+def _participations(results) -> list[int]:
+    return sorted(result.participation_id for result in results)
+
+
+async def test_by_company_serves_loaded_results_from_cache() -> None:
+    session = FakeSession([_row(1), _row(2)])
+    reader = SQLAlchemyQuizResultReader(session, FakeCache())
+
+    first = await reader.by_company(1)
+    second = await reader.by_company(1)
+
+    assert _participations(first) == _participations(second) == [1, 2]
+    assert session.executed == 1
+
+
+async def test_by_company_caches_empty_company() -> None:
+    session = FakeSession([])
+    reader = SQLAlchemyQuizResultReader(session, FakeCache())
+
+    assert await reader.by_company(1) == []
+    assert await reader.by_company(1) == []
+    assert session.executed == 1
+
+
+async def test_by_company_reloads_partially_cached_results() -> None:
+    session = FakeSession([_row(1), _row(2)])
+    cache = FakeCache()
+    reader = SQLAlchemyQuizResultReader(session, cache)
+
+    # Single results cached by reads or saves do not make a full set
+    await cache.set_cache("quiz_result:1", _row(1), 0)
+    await cache.set_member_key("company:1", "quiz_result:1")
+
+    results = await reader.by_company(1)
+
+    assert _participations(results) == [1, 2]
+    assert session.executed == 1
+
+
+async def test_by_company_reloads_after_eviction() -> None:
+    session = FakeSession([_row(1), _row(2)])
+    cache = FakeCache()
+    reader = SQLAlchemyQuizResultReader(session, cache)
+
+    await reader.by_company(1)
+
+    session.rows = [_row(1), _row(2, correct_answers=3)]
+    del cache.cache["quiz_result:2"]
+
+    results = await reader.by_company(1)
+
+    assert [result.correct_answers for result in results] == [1, 3]
+    assert session.executed == 2
+
+    del cache.cache["quiz_results_loaded:1"]
+
+    await reader.by_company(1)
+
+    assert session.executed == 3
+
+
+async def test_by_company_reloads_after_compaction() -> None:
+    session = FakeSession([_row(1), _row(2)])
+    cache = FakeCache()
+    reader = SQLAlchemyQuizResultReader(session, cache)
+
+    await reader.by_company(1)
+
+    # Evicted keys pruned by compaction must not leave a smaller set that
+    # still looks fully loaded
+    del cache.cache["quiz_result:2"]
+    await CompactQuizResultIndex(cache)()
+
+    results = await reader.by_company(1)
+
+    assert _participations(results) == [1, 2]
+    assert session.executed == 2
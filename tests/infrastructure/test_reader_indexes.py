@@ -0,0 +1,482 @@
+from datetime import datetime
+
+import pytest
+from environs import Env
+from sqlalchemy import event, insert, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    create_async_engine,
+)
+
+from app.core.common.pagination import Pagination, SortOrder
+from app.core.entities.company import CompanyId, CompanyRole, CompanyUserId
+from app.core.entities.user import UserId
+from app.core.interfaces.company_gateways import (
+    CompanyFilters,
+    CompanyUserFilters,
+)
+from app.core.interfaces.invitation_gateways import (
+    InvitationFilters,
+    UserRequestFilters,
+)
+from app.core.interfaces.notification_gateways import NotificationFilters
+from app.core.interfaces.quiz_gateways import QuizFilters
+from app.core.interfaces.user_gateways import UserFilters
+from app.infrastructure.gateways.company import (
+    SQLAlchemyCompanyReader,
+    SQLAlchemyCompanyUserReader,
+)
+from app.infrastructure.gateways.invite import (
+    SQLAlchemyInvitationReader,
+    SQLAlchemyUserRequestReader,
+)
+from app.infrastructure.gateways.notification import (
+    SQLAlchemyNotificationReader,
+)
+from app.infrastructure.gateways.pagination import encode_cursor
+from app.infrastructure.gateways.quiz import (
+    SQLAlchemyQuizReader,
+    UserQuizStatsMapper,
+)
+from app.infrastructure.gateways.user import SQLAlchemyUserReader
+from app.infrastructure.persistence.config import DBConfig
+from app.infrastructure.persistence.models import mapper_registry
+from app.infrastructure.persistence.models.company import companies_table
+from app.infrastructure.persistence.models.company_user import (
+    company_users_table,
+)
+from app.infrastructure.persistence.models.invite import (
+    invitations_table,
+    user_requests_table,
+)
+from app.infrastructure.persistence.models.notification import (
+    notifications_table,
+)
+from app.infrastructure.persistence.models.quiz import (
+    answers_table,
+    questions_table,
+    quiz_participations_table,
+    quiz_results_table,
+    quizzes_table,
+    user_quiz_stats_table,
+)
+from app.infrastructure.persistence.models.user import users_table
+
+SEED_SIZE = 200
+
+CREATED_AT = datetime(2024, 1, 1)  # noqa: DTZ001
+
+CURSOR = encode_cursor(CREATED_AT, 100)
+
+
+def load_test_db_config() -> DBConfig | None:
+    env = Env()
+    env.read_env(".env")
+
+    try:
+        return DBConfig(
+            user=env.str("POSTGRES_USER"),
+            password=env.str("POSTGRES_PASSWORD"),
+            host=env.str("POSTGRES_HOST"),
+            port=env.int("POSTGRES_PORT"),
+            db_name=env.str("POSTGRES_DB"),
+        )
+    except Exception:
+        return None
+
+
+async def seed(session: AsyncSession) -> None:
+    ids = range(1, SEED_SIZE + 1)
+
+    await session.execute(
+        insert(users_table),
+        [
+            {
+                "user_id": i,
+                "user_email": f"user{i}@test.com",
+                "is_active": True,
+            }
+            for i in ids
+        ],
+    )
+    await session.execute(
+        insert(companies_table),
+        [
+            {"company_id": i, "owner_id": i, "company_name": f"c{i}"}
+            for i in ids
+        ],
+    )
+    await session.execute(
+        insert(company_users_table),
+        [
+            {
+                "company_user_id": i,
+                "company_id": i,
+                "user_id": i,
+                "role": CompanyRole.MEMBER,
+            }
+            for i in ids
+        ],
+    )
+    await session.execute(
+        insert(invitations_table),
+        [{"company_id": i, "user_id": i} for i in ids],
+    )
+    await session.execute(
+        insert(user_requests_table),
+        [{"company_id": i, "user_id": i} for i in ids],
+    )
+    await session.execute(
+        insert(notifications_table),
+        [{"send_to": i, "text": "text"} for i in ids],
+    )
+    await session.execute(
+        insert(quizzes_table),
+        [
+            {"quiz_id": i, "company_id": i, "title": "t", "description": "d"}
+            for i in ids
+        ],
+    )
+    await session.execute(
+        insert(questions_table),
+        [{"question_id": i, "quiz_id": i, "title": "t"} for i in ids],
+    )
+    await session.execute(
+        insert(answers_table),
+        [{"question_id": i, "text": "t", "is_correct": True} for i in ids],
+    )
+    await session.execute(
+        insert(quiz_participations_table),
+        [
+            {"quiz_participation_id": i, "quiz_id": i, "company_user_id": i}
+            for i in ids
+        ],
+    )
+    await session.execute(
+        insert(quiz_results_table),
+        [{"quiz_participation_id": i, "correct_answers": 1} for i in ids],
+    )
+    await session.execute(
+        insert(user_quiz_stats_table),
+        [
+            {
+                "user_id": i,
+                "quiz_id": i,
+                "score_sum": 1,
+                "result_count": 1,
+                "last_completed_at": CREATED_AT,
+            }
+            for i in ids
+        ],
+    )
+    await session.execute(text("ANALYZE"))
+
+
+@pytest.fixture
+async def engine() -> AsyncEngine:
+    config = load_test_db_config()
+    if not config:
+        pytest.skip("Database is not configured")
+
+    engine = create_async_engine(config.get_connection_url())
+
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(mapper_registry.metadata.drop_all)
+            await conn.run_sync(mapper_registry.metadata.create_all)
+    except (OSError, DBAPIError):
+        await engine.dispose()
+        pytest.skip("Database is not available")
+
+    yield engine
+
+    async with engine.begin() as conn:
+        await conn.run_sync(mapper_registry.metadata.drop_all)
+
+    await engine.dispose()
+
+
+@pytest.fixture
+async def session(engine: AsyncEngine) -> AsyncSession:
+    async with AsyncSession(engine) as session:
+        await seed(session)
+        await session.execute(text("SET enable_seqscan = off"))
+
+        yield session
+
+
+async def explain_reader_queries(session: AsyncSession, call) -> list[str]:
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    sync_engine = session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", capture)
+    try:
+        await call()
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", capture)
+
+    plans = []
+    for statement, parameters in statements:
+        connection = await session.connection()
+        rows = await connection.exec_driver_sql(
+            f"EXPLAIN {statement}", parameters
+        )
+        plans.append("\n".join(row[0] for row in rows))
+
+    return plans
+
+
+@pytest.mark.parametrize(
+    "make_call",
+    [
+        lambda s: SQLAlchemyUserReader(s).page(
+            UserFilters(), Pagination(0, 10)
+        ),
+        lambda s: SQLAlchemyCompanyReader(s).page(
+            CompanyFilters(), Pagination(0, 10)
+        ),
+        lambda s: SQLAlchemyCompanyUserReader(s).page(
+            CompanyUserFilters(company_id=1), Pagination(0, 10)
+        ),
+        lambda s: SQLAlchemyInvitationReader(s).page(
+            InvitationFilters(user_id=UserId(1)), Pagination(0, 10)
+        ),
+        lambda s: SQLAlchemyUserRequestReader(s).page(
+            UserRequestFilters(company_id=CompanyId(1)), Pagination(0, 10)
+        ),
+        lambda s: SQLAlchemyNotificationReader(s).page(
+            NotificationFilters(company_user_id=1), Pagination(0, 10)
+        ),
+        lambda s: SQLAlchemyQuizReader(s).page(
+            QuizFilters(company_id=1), Pagination(0, 10)
+        ),
+        lambda s: SQLAlchemyUserReader(s).page(
+            UserFilters(), Pagination(limit=10, cursor=CURSOR)
+        ),
+        lambda s: SQLAlchemyCompanyUserReader(s).page(
+            CompanyUserFilters(company_id=1),
+            Pagination(limit=10, order=SortOrder.DESC, cursor=CURSOR),
+        ),
+        lambda s: SQLAlchemyNotificationReader(s).page(
+            NotificationFilters(company_user_id=1),
+            Pagination(limit=10, cursor=CURSOR),
+        ),
+        lambda s: SQLAlchemyQuizReader(s).get_overall_rating(UserId(1)),
+        lambda s: SQLAlchemyQuizReader(s).total_average_user_score(
+            CompanyUserId(1), CompanyId(1)
+        ),
+        lambda s: SQLAlchemyQuizReader(s).total_average_users_scores(
+            CompanyId(1), [CompanyUserId(1)]
+        ),
+        lambda s: SQLAlchemyQuizReader(s).get_all_last_quiz_completion_times(
+            UserId(1)
+        ),
+        lambda s: SQLAlchemyQuizReader(s).get_company_users_last_attempt(
+            CompanyId(1)
+        ),
+        lambda s: SQLAlchemyQuizReader(s).get_company_average_scores_over_time(
+            CompanyId(1), "month"
+        ),
+        lambda s: SQLAlchemyQuizReader(s).get_company_user_quiz_average_scores(
+            CompanyUserId(1), CompanyId(1), "month"
+        ),
+        lambda s: UserQuizStatsMapper(s).company_points(CompanyId(1)),
+    ],
+)
+async def test_reader_queries_use_indexes(
+    session: AsyncSession, make_call
+) -> None:
+    plans = await explain_reader_queries(session, lambda: make_call(session))
+
+    assert plans
+    for plan in plans:
+        assert "Seq Scan" not in plan, plan
+
+
+async def test_total_average_user_score_measures_each_result(
+    session: AsyncSession,
+) -> None:
+    await session.execute(
+        insert(quiz_participations_table),
+        [
+            {
+                "quiz_participation_id": SEED_SIZE + 1,
+                "quiz_id": 1,
+                "company_user_id": 1,
+            }
+        ],
+    )
+    await session.execute(
+        insert(quiz_results_table),
+        [{"quiz_participation_id": SEED_SIZE + 1, "correct_answers": 0}],
+    )
+
+    reader = SQLAlchemyQuizReader(session)
+
+    accuracy = await reader.total_average_user_score(
+        CompanyUserId(1), CompanyId(1)
+    )
+    scores = await reader.total_average_users_scores(CompanyId(1))
+
+    assert accuracy == 50
+    assert [(score.user_id, score.accuracy) for score in scores] == [(1, 50)]
+
+
+async def test_company_points_sum_company_quizzes(
+    session: AsyncSession,
+) -> None:
+    await session.execute(
+        insert(user_quiz_stats_table),
+        [
+            {
+                "user_id": 2,
+                "quiz_id": 1,
+                "score_sum": 3,
+                "result_count": 2,
+                "last_completed_at": CREATED_AT,
+            },
+            {
+                "user_id": 3,
+                "quiz_id": 1,
+                "score_sum": 0,
+                "result_count": 0,
+                "last_completed_at": CREATED_AT,
+            },
+        ],
+    )
+
+    points = await UserQuizStatsMapper(session).company_points(CompanyId(1))
+
+    assert points == {1: 1, 2: 3}
+
+
+async def test_user_quiz_averages_read_stats(
+    session: AsyncSession,
+) -> None:
+    await session.execute(
+        insert(user_quiz_stats_table),
+        [
+            {
+                "user_id": 1,
+                "quiz_id": 2,
+                "score_sum": 3,
+                "result_count": 2,
+                "last_completed_at": datetime(2024, 2, 1),  # noqa: DTZ001
+            },
+            {
+                "user_id": 1,
+                "quiz_id": 3,
+                "score_sum": 0,
+                "result_count": 0,
+                "last_completed_at": CREATED_AT,
+            },
+        ],
+    )
+
+    reader = SQLAlchemyQuizReader(session)
+
+    january = await reader.get_user_quiz_averages(
+        1,
+        datetime(2023, 12, 31),  # noqa: DTZ001
+        datetime(2024, 1, 31),  # noqa: DTZ001
+    )
+    quarter = await reader.get_user_quiz_averages(
+        1,
+        datetime(2023, 12, 31),  # noqa: DTZ001
+        datetime(2024, 3, 31),  # noqa: DTZ001
+    )
+
+    assert [(avg.quiz_id, avg.average) for avg in january] == [(1, 1)]
+    assert sorted((avg.quiz_id, avg.average) for avg in quarter) == [
+        (1, 1),
+        (2, 1.5),
+    ]
+
+
+async def test_company_user_average_scores_filter_company(
+    session: AsyncSession,
+) -> None:
+    await session.execute(
+        insert(quiz_participations_table),
+        [
+            {
+                "quiz_participation_id": SEED_SIZE + 1,
+                "quiz_id": 1,
+                "company_user_id": 2,
+            }
+        ],
+    )
+    await session.execute(
+        insert(quiz_results_table),
+        [{"quiz_participation_id": SEED_SIZE + 1, "correct_answers": 3}],
+    )
+
+    reader = SQLAlchemyQuizReader(session)
+
+    own_scores = await reader.get_company_user_quiz_average_scores(
+        CompanyUserId(2), CompanyId(2), "month"
+    )
+    other_scores = await reader.get_company_user_quiz_average_scores(
+        CompanyUserId(2), CompanyId(1), "month"
+    )
+
+    assert [score.average for score in own_scores] == [1]
+    assert [score.average for score in other_scores] == [3]
+
+
+async def test_quiz_page_counts_quizzes_not_joined_rows(
+    session: AsyncSession,
+) -> None:
+    quiz_ids = [SEED_SIZE + i for i in range(1, 4)]
+    question_ids = [
+        quiz_id * 10 + question
+        for quiz_id in quiz_ids
+        for question in range(3)
+    ]
+
+    await session.execute(
+        insert(quizzes_table),
+        [
+            {"quiz_id": i, "company_id": 1, "title": "t", "description": "d"}
+            for i in quiz_ids
+        ],
+    )
+    await session.execute(
+        insert(questions_table),
+        [
+            {"question_id": i, "quiz_id": i // 10, "title": "t"}
+            for i in question_ids
+        ],
+    )
+    await session.execute(
+        insert(answers_table),
+        [
+            {"question_id": i, "text": "t", "is_correct": is_correct}
+            for i in question_ids
+            for is_correct in (True, False)
+        ],
+    )
+
+    reader = SQLAlchemyQuizReader(session)
+    filters = QuizFilters(company_id=1)
+
+    first = await reader.page(filters, Pagination(0, 2))
+    second = await reader.page(filters, Pagination(2, 2))
+
+    assert first.total == second.total == 4
+    assert len(first.items) == len(second.items) == 2
+    assert {quiz.quiz_id for quiz in first.items + second.items} == {
+        1,
+        *quiz_ids,
+    }
+    for quiz in first.items + second.items:
+        assert len(quiz.questions) == (1 if quiz.quiz_id == 1 else 3)
+        if quiz.quiz_id != 1:
+            assert all(
+                len(question.answers) == 2 for question in quiz.questions
+            )
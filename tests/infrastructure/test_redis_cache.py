@@ -0,0 +1,178 @@
+import fnmatch
+import json
+from typing import Self
+
+from app.infrastructure.cache.cache import RedisCache
+from app.infrastructure.cache.config import RedisConfig
+
+BATCH_SIZE = 2
+
+
+class FakePipeline:
+    def __init__(self, redis: "FakeRedis"):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        pass
+
+    def setex(self, key: str, ttl: int, value: str) -> None:
+        self.commands.append((key, value))
+
+    def exists(self, key: str) -> None:
+        self.commands.append((key, None))
+
+    async def execute(self) -> list[bool]:
+        self.redis.calls.append(("pipeline", len(self.commands)))
+
+        results = []
+        for key, value in self.commands:
+            if value is None:
+                results.append(key in self.redis.data)
+            else:
+                self.redis.data[key] = value
+
+        return results
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+        self.sets = {}
+        self.calls = []
+
+    def register_script(self, script: str):
+        return None
+
+    def pipeline(self, transaction: bool) -> FakePipeline:
+        return FakePipeline(self)
+
+    async def mget(self, keys: tuple[str, ...]) -> list[str | None]:
+        self.calls.append(("mget", len(keys)))
+        return [self.data.get(key) for key in keys]
+
+    async def sadd(self, key: str, *members: str) -> None:
+        self.calls.append(("sadd", len(members)))
+        self.sets.setdefault(key, set()).update(members)
+
+    async def srem(self, key: str, *members: str) -> int:
+        self.calls.append(("srem", len(members)))
+        cached_keys = self.sets.get(key, set())
+        removed = len(cached_keys & set(members))
+        cached_keys.difference_update(members)
+
+        return removed
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.data.pop(key, None)
+
+    async def scan_iter(self, match: str, count: int, _type: str):
+        for key in fnmatch.filter(list(self.sets), match):
+            yield key
+
+    async def sscan(
+        self, key: str, cursor: int, count: int
+    ) -> tuple[int, list[str]]:
+        members = sorted(self.sets.get(key, ()))
+        end = cursor + count
+
+        return (0 if end >= len(members) else end), members[cursor:end]
+
+    async def sscan_iter(self, key: str, match: str, count: int):
+        for member in fnmatch.filter(sorted(self.sets.get(key, ())), match):
+            yield member
+
+
+def make_cache() -> tuple[RedisCache, FakeRedis]:
+    redis = FakeRedis()
+    config = RedisConfig(
+        password="", host="localhost", port=6379, db=0, batch_size=BATCH_SIZE
+    )
+
+    return RedisCache(redis, config), redis
+
+
+async def test_set_many_chunks_by_batch_size() -> None:
+    cache, redis = make_cache()
+
+    await cache.set_many({f"key:{i}": {"value": i} for i in range(5)}, 60)
+
+    assert redis.calls == [("pipeline", 2), ("pipeline", 2), ("pipeline", 1)]
+    assert json.loads(redis.data["key:4"]) == {"value": 4}
+
+
+async def test_get_many_keeps_key_order_across_batches() -> None:
+    cache, redis = make_cache()
+    redis.data = {
+        "key:0": json.dumps({"value": 0}),
+        "key:3": json.dumps({"value": 3}),
+        "key:4": json.dumps({"value": 4}),
+    }
+
+    values = await cache.get_many([f"key:{i}" for i in range(5)])
+
+    assert values == [{"value": 0}, None, None, {"value": 3}, {"value": 4}]
+    assert redis.calls == [("mget", 2), ("mget", 2), ("mget", 1)]
+
+
+async def test_member_keys_chunk_by_batch_size() -> None:
+    cache, redis = make_cache()
+    keys = [f"key:{i}" for i in range(5)]
+
+    await cache.set_member_key("company:1", *keys)
+    await cache.remove_member_keys("company:1", keys[:3])
+
+    assert redis.sets["company:1"] == {"key:3", "key:4"}
+    assert redis.calls == [
+        ("sadd", 2),
+        ("sadd", 2),
+        ("sadd", 1),
+        ("srem", 2),
+        ("srem", 1),
+    ]
+
+
+async def test_batch_operations_skip_empty_input() -> None:
+    cache, redis = make_cache()
+
+    assert await cache.get_many([]) == []
+    await cache.set_many({}, 60)
+    await cache.set_member_key("company:1")
+    await cache.remove_member_keys("company:1", [])
+
+    assert redis.calls == []
+
+
+async def test_compaction_drops_marker_of_pruned_set() -> None:
+    cache, redis = make_cache()
+    redis.data = {
+        "quiz_result:1": "{}",
+        "quiz_results_loaded:1": "{}",
+        "quiz_result:3": "{}",
+        "quiz_results_loaded:2": "{}",
+    }
+    redis.sets = {
+        "company:1": {
+            "quiz_result:1",
+            "quiz_result:2",
+            "quiz_results_loaded:1",
+        },
+        "company:2": {"quiz_result:3", "quiz_results_loaded:2"},
+    }
+
+    removed = await cache.compact_member_keys(
+        "company:*", "quiz_results_loaded:*"
+    )
+
+    assert removed == 1
+    assert redis.sets["company:1"] == {"quiz_result:1"}
+    assert "quiz_results_loaded:1" not in redis.data
+    assert redis.sets["company:2"] == {
+        "quiz_result:3",
+        "quiz_results_loaded:2",
+    }
+    assert "quiz_results_loaded:2" in redis.data
@@ -0,0 +1,63 @@
+from app.infrastructure.tasks.lock import acquire_scheduler_lock
+
+
+class FakeConnection:
+    def __init__(self, engine: "FakeEngine"):
+        self.engine = engine
+        self.closed = False
+
+    async def scalar(self, query) -> bool:
+        assert "pg_try_advisory_lock" in str(query)
+
+        if self.engine.holder is None:
+            self.engine.holder = self
+
+        return self.engine.holder is self
+
+    async def execute(self, query) -> None:
+        assert "pg_advisory_unlock" in str(query)
+
+        if self.engine.holder is self:
+            self.engine.holder = None
+
+    async def commit(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        self.closed = True
+
+        # Postgres drops session-level locks with the connection
+        if self.engine.holder is self:
+            self.engine.holder = None
+
+
+class FakeEngine:
+    def __init__(self):
+        self.holder = None
+        self.connections = []
+
+    async def connect(self) -> FakeConnection:
+        connection = FakeConnection(self)
+        self.connections.append(connection)
+
+        return connection
+
+
+async def test_scheduler_lock_is_exclusive() -> None:
+    engine = FakeEngine()
+
+    lock = await acquire_scheduler_lock(engine)
+
+    assert lock
+    assert await acquire_scheduler_lock(engine) is None
+    assert engine.connections[1].closed
+
+    await lock.release()
+
+    assert lock.connection.closed
+
+    lock = await acquire_scheduler_lock(engine)
+
+    assert lock
+
+    await lock.release()
@@ -0,0 +1,116 @@
+from io import BytesIO
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+
+from app.core.commands.quiz.errors import InvalidQuizFileError
+from app.infrastructure.files.upload_file import (
+    FLAT_COLUMNS,
+    ExcelFileUpload,
+)
+
+
+def make_workbook() -> bytes:
+    workbook = Workbook()
+    quizzes = workbook.active
+    quizzes.title = "Quizzes"
+    quizzes.append(["quiz_id", "title", "description"])
+    quizzes.append([1, "Quiz", "Description"])
+
+    questions = workbook.create_sheet("Questions")
+    questions.append(["question_id", "quiz_id", "title"])
+    questions.append([1, 1, "Who"])
+    questions.append([2, 1, "Where"])
+
+    answers = workbook.create_sheet("Answers")
+    answers.append(["question_id", "text", "is_correct"])
+    answers.append([1, "+", True])
+    answers.append([1, "-", False])
+    answers.append([2, "+", True])
+
+    file = BytesIO()
+    workbook.save(file)
+
+    return file.getvalue()
+
+
+async def test_upload_excel() -> None:
+    quizzes = await ExcelFileUpload().upload_quiz(make_workbook())
+
+    assert len(quizzes) == 1
+    assert quizzes[0]["title"] == "Quiz"
+    assert [
+        len(question["answers"]) for question in quizzes[0]["questions"]
+    ] == [2, 1]
+
+
+async def test_upload_csv() -> None:
+    file = (
+        b"quiz_id,quiz_title,quiz_description,question_id,question_title,"
+        b"answer_text,is_correct\n"
+        b"1,Quiz,Description,1,Who,+,true\n"
+        b"1,Quiz,Description,1,Who,-,false\n"
+        b"1,Quiz,Description,2,Where,+,true\n"
+    )
+
+    quizzes = await ExcelFileUpload().upload_quiz(file)
+
+    assert quizzes[0]["quiz_id"] == 1
+    assert [
+        [answer["is_correct"] for answer in question["answers"]]
+        for question in quizzes[0]["questions"]
+    ] == [[True, False], [True]]
+
+
+async def test_upload_csv_without_quiz_id() -> None:
+    file = (
+        b"quiz_id,quiz_title,quiz_description,question_id,question_title,"
+        b"answer_text,is_correct\n"
+        b",First,Description,1,Who,+,true\n"
+        b",First,Description,1,Who,-,false\n"
+        b",Second,Description,1,Where,+,true\n"
+    )
+
+    quizzes = await ExcelFileUpload().upload_quiz(file)
+
+    assert [(quiz["quiz_id"], quiz["title"]) for quiz in quizzes] == [
+        (None, "First"),
+        (None, "Second"),
+    ]
+    assert [len(quiz["questions"][0]["answers"]) for quiz in quizzes] == [
+        2,
+        1,
+    ]
+
+
+async def test_upload_parquet() -> None:
+    frame = pd.DataFrame(
+        [
+            [1, "Quiz", "Description", 1, "Who", "+", True],
+            [1, "Quiz", "Description", 1, "Who", "-", False],
+            [1, "Quiz", "Description", 2, "Where", "+", True],
+        ],
+        columns=list(FLAT_COLUMNS),
+    )
+
+    quizzes = await ExcelFileUpload().upload_quiz(frame.to_parquet())
+
+    assert quizzes[0]["quiz_id"] == 1
+    assert [
+        len(question["answers"]) for question in quizzes[0]["questions"]
+    ] == [2, 1]
+
+
+@pytest.mark.parametrize(
+    "file",
+    [
+        b"\xff\xfe\x00binary",
+        b"PK\x03\x04broken",
+        b"PAR1broken",
+        b"quiz_id,title\n1,Quiz\n",
+    ],
+)
+async def test_upload_invalid_file(file: bytes) -> None:
+    with pytest.raises(InvalidQuizFileError):
+        await ExcelFileUpload().upload_quiz(file)
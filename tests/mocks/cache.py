@@ -1,3 +1,5 @@
+import fnmatch
+
 from app.core.interfaces.cache import CacheGateway
 
 
@@ -5,6 +7,7 @@ class FakeCache(CacheGateway):
     def __init__(self):
         self.cache = {}
         self.member_keys = {}
+        self.scores = {}
 
         self.cached = False
 
@@ -14,14 +17,90 @@ class FakeCache(CacheGateway):
         self.cached = True
 
     async def get_cache(self, key: str) -> dict | None:
-        return self.cache[key] if self.cache[key] else None
+        return self.cache.get(key) or None
+
+    async def delete_cache(self, key: str) -> None:
+        self.cache.pop(key, None)
+        self.scores.pop(key, None)
+
+    async def get_many(self, keys: list[str]) -> list[dict | None]:
+        return [self.cache.get(key) for key in keys]
+
+    async def set_many(self, values: dict[str, dict], ttl: int) -> None:
+        self.cache.update(values)
+
+        self.cached = True
+
+    async def set_member_key(self, member_key: str, *cached_keys: str) -> None:
+        self.member_keys.setdefault(member_key, set()).update(cached_keys)
 
-    async def set_member_key(self, member_key: str, cached_key: str) -> None:
-        self.member_keys[member_key] = cached_key
+    async def remove_member_keys(
+        self, member_key: str, cached_keys: list[str]
+    ) -> None:
+        self.member_keys.get(member_key, set()).difference_update(cached_keys)
 
     async def get_member_data(self, member_key: str) -> set | None:
-        return (
-            set(self.member_keys[member_key])
-            if self.member_keys[member_key]
-            else None
+        return set(self.member_keys.get(member_key, ())) or None
+
+    async def clear_member_keys(self, member_key: str) -> None:
+        for key in self.member_keys.pop(member_key, set()):
+            self.cache.pop(key, None)
+
+    async def compact_member_keys(
+        self, member_key_pattern: str, marker_key_pattern: str
+    ) -> int:
+        removed = 0
+        for cached_keys in self.member_keys.values():
+            expired_keys = {
+                key for key in cached_keys if key not in self.cache
+            }
+            cached_keys.difference_update(expired_keys)
+            removed += len(expired_keys)
+
+            if expired_keys:
+                for key in fnmatch.filter(cached_keys, marker_key_pattern):
+                    cached_keys.discard(key)
+                    self.cache.pop(key, None)
+
+        return removed
+
+    async def is_exist(self, key: str) -> bool:
+        return key in self.cache or key in self.scores
+
+    async def set_scores(
+        self, key: str, scores: dict[str, float], ttl: int
+    ) -> None:
+        self.scores.pop(key, None)
+        if scores:
+            self.scores[key] = dict(scores)
+
+    async def increment_score(
+        self, key: str, member: str, amount: float
+    ) -> None:
+        if key in self.scores:
+            self.scores[key][member] = self.scores[key].get(member, 0) + amount
+
+    async def remove_scores(self, key: str, *members: str) -> None:
+        for member in members:
+            self.scores.get(key, {}).pop(member, None)
+
+    def _ranked(self, key: str) -> list[tuple[str, float]]:
+        return sorted(
+            self.scores.get(key, {}).items(),
+            key=lambda item: (item[1], item[0]),
+            reverse=True,
         )
+
+    async def get_top_scores(
+        self, key: str, limit: int
+    ) -> list[tuple[str, float]]:
+        return self._ranked(key)[:limit]
+
+    async def get_score_rank(
+        self, key: str, member: str
+    ) -> tuple[int, float] | None:
+        for rank, (ranked_member, score) in enumerate(self._ranked(key)):
+            if ranked_member == member:
+                return rank, score
+
+        return None
@@ -84,6 +84,11 @@ class FakeCompanyUserMapper(CompanyUserGateway):
             return self.company_user
         return None
 
+    async def by_user(self, user_id: UserId) -> list[CompanyUser]:
+        if self.company_user.user_id == user_id:
+            return [self.company_user]
+        return []
+
     async def many(self, filters: CompanyUserFilters) -> list[CompanyUser]:
         if self.company_user.company_id == filters.company_id:
             return [self.company_user]
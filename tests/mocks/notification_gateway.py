@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from app.core.entities.company import CompanyUserId
 from app.core.entities.notification import (
     Notification,
@@ -30,3 +32,15 @@ class FakeNotificationMapper(NotificationGateway):
         if self.notification.notification_id == notification_id:
             return self.notification
         return None
+
+    async def add_quiz_reminders(
+        self,
+        created_before: datetime,
+        from_company_user_id: CompanyUserId,
+        to_company_user_id: CompanyUserId,
+    ) -> int:
+        send_to = self.notification.send_to
+        if from_company_user_id < send_to <= to_company_user_id:
+            self.saved = True
+            return 1
+        return 0
@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from app.core.entities.company import CompanyId, CompanyUserId
 from app.core.entities.quiz import (
     Answer,
@@ -11,12 +13,15 @@ from app.core.entities.quiz import (
     QuizResult,
     QuizResultId,
 )
+from app.core.entities.user import UserId
 from app.core.interfaces.quiz_gateways import (
     AnswerGateway,
     QuestionGateway,
     QuizGateway,
     QuizParticipationGateway,
     QuizResultGateway,
+    ScoreRollupGateway,
+    UserQuizStatsGateway,
 )
 
 
@@ -41,6 +46,17 @@ class FakeQuizMapper(QuizGateway):
     async def by_id(self, quiz_id: QuizId) -> Quiz | None:
         return self.quiz if self.quiz.quiz_id == quiz_id else None
 
+    async def by_ids(self, quiz_ids: list[QuizId]) -> list[Quiz]:
+        return [self.quiz] if self.quiz.quiz_id in quiz_ids else []
+
+    async def update_many(self, quizzes: list[Quiz]) -> None:
+        for quiz in quizzes:
+            if quiz.quiz_id == self.quiz.quiz_id:
+                self.quiz.title = quiz.title
+                self.quiz.description = quiz.description
+
+                self.saved = True
+
     async def delete(self, quiz_id: QuizId) -> None:
         if self.quiz.quiz_id == quiz_id:
             self.deleted = True
@@ -63,8 +79,10 @@ class FakeQuestionMapper(QuestionGateway):
 
         self.saved = False
 
-    async def add(self, question: Question) -> None:
-        self.questions.append(question)
+    async def add_many(self, questions: list[Question]) -> None:
+        for question in questions:
+            question.question_id = QuestionId(len(self.questions) + 1)
+            self.questions.append(question)
 
         self.saved = True
 
@@ -128,6 +146,9 @@ class FakeQuizParticipationMapper(QuizParticipationGateway):
             return self.quiz_participation
         return None
 
+    async def last_company_user_id(self) -> CompanyUserId | None:
+        return self.quiz_participation.company_user_id
+
 
 class FakeQuizResultMapper(QuizResultGateway):
     def __init__(self):
@@ -141,3 +162,75 @@ class FakeQuizResultMapper(QuizResultGateway):
 
     async def add(self, quiz_result: QuizResult) -> None:
         self.saved = True
+
+
+class FakeScoreRollupMapper(ScoreRollupGateway):
+    def __init__(self):
+        self.scores: list[tuple[CompanyId, datetime, int]] = []
+        self.removed: list[object] = []
+
+    async def add_score(
+        self,
+        company_id: CompanyId,
+        participated_at: datetime,
+        correct_answers: int,
+    ) -> None:
+        self.scores.append((company_id, participated_at, correct_answers))
+
+    async def remove_quiz(self, quiz_id: QuizId) -> None:
+        self.removed.append(quiz_id)
+
+    async def remove_company_user(
+        self, company_user_id: CompanyUserId
+    ) -> None:
+        self.removed.append(company_user_id)
+
+    async def remove_user(self, user_id: UserId) -> None:
+        self.removed.append(user_id)
+
+
+class FakeUserQuizStatsMapper(UserQuizStatsGateway):
+    def __init__(self):
+        self.stats: dict[tuple[UserId, QuizId], list] = {}
+        self.removed: list[CompanyUserId] = []
+        self.rebuilt: list[tuple[UserId, UserId]] = []
+        self.max_user_id: UserId | None = None
+
+    async def add_participation(
+        self, user_id: UserId, quiz_id: QuizId, participated_at: datetime
+    ) -> None:
+        await self.add_result(user_id, quiz_id, participated_at, 0)
+        self.stats[user_id, quiz_id][1] -= 1
+
+    async def add_result(
+        self,
+        user_id: UserId,
+        quiz_id: QuizId,
+        participated_at: datetime,
+        correct_answers: int,
+    ) -> None:
+        stats = self.stats.setdefault((user_id, quiz_id), [0, 0, None])
+        stats[0] += correct_answers
+        stats[1] += 1
+        stats[2] = participated_at
+
+    async def remove_company_user(
+        self, company_user_id: CompanyUserId
+    ) -> None:
+        self.removed.append(company_user_id)
+
+    async def last_user_id(self) -> UserId | None:
+        return self.max_user_id
+
+    async def rebuild(self, from_user_id: UserId, to_user_id: UserId) -> int:
+        self.rebuilt.append((from_user_id, to_user_id))
+
+        return 1
+
+    async def company_points(self, company_id: CompanyId) -> dict[UserId, int]:
+        points: dict[UserId, int] = {}
+        for (user_id, _), (score_sum, result_count, _) in self.stats.items():
+            if result_count:
+                points[user_id] = points.get(user_id, 0) + score_sum
+
+        return points
@@ -0,0 +1,9 @@
+from app.core.interfaces.upload_file import UploadFile
+
+
+class FakeUploadFile(UploadFile):
+    def __init__(self, quizzes: list[dict]):
+        self.quizzes = quizzes
+
+    async def upload_quiz(self, file: bytes) -> list[dict]:
+        return self.quizzes
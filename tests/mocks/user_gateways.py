@@ -1,4 +1,4 @@
-from app.core.common.pagination import Pagination
+from app.core.common.pagination import Page, Pagination
 from app.core.entities.user import User, UserId
 from app.core.entities.value_objects import UserEmail
 from app.core.interfaces.user_gateways import (
@@ -68,14 +68,9 @@ class FakeUserReader(UserReader):
                 return self._map_to_dto(user)
         return None
 
-    async def total(self, filters: UserFilters) -> int:
-        return len(
-            [user for user in self.users if self._filter_user(user, filters)]
-        )
-
-    async def get_users(
+    async def page(
         self, filters: UserFilters, pagination: Pagination
-    ) -> list[UserDetail]:
+    ) -> Page[UserDetail]:
         filtered_users = [
             user for user in self.users if self._filter_user(user, filters)
         ]
@@ -85,4 +80,7 @@ class FakeUserReader(UserReader):
 
         end = offset + limit
 
-        return [self._map_to_dto(user) for user in filtered_users[offset:end]]
+        return Page(
+            [self._map_to_dto(user) for user in filtered_users[offset:end]],
+            len(filtered_users),
+        )
@@ -0,0 +1,47 @@
+import pytest
+from dishka import Provider, Scope, make_async_container
+from dishka.integrations.fastapi import setup_dishka
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.commands.user.errors import UnauthorizedError
+from app.core.entities.user import User
+from app.core.interfaces.id_provider import IdProvider
+from app.core.interfaces.user_gateways import UserDetail
+from app.infrastructure.persistence.metrics import QueryStats
+from app.routers.exceptions import setup_exception_handlers
+from app.routers.metrics import metrics_router
+from tests.mocks.id_provider import FakeIdProvider
+
+
+class AnonymousIdProvider(IdProvider):
+    async def get_user(self) -> UserDetail:
+        raise UnauthorizedError
+
+
+def make_client(id_provider: IdProvider) -> TestClient:
+    provider = Provider()
+    provider.provide(
+        lambda: id_provider, scope=Scope.REQUEST, provides=IdProvider
+    )
+    provider.provide(QueryStats, scope=Scope.APP)
+
+    app = FastAPI()
+    app.include_router(metrics_router)
+    setup_exception_handlers(app)
+    setup_dishka(make_async_container(provider), app)
+
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    ["signed_in", "status_code"], [(True, 200), (False, 401)]
+)
+async def test_metrics_require_sign_in(
+    user: User, signed_in: bool, status_code: int
+) -> None:
+    id_provider = FakeIdProvider(user) if signed_in else AnonymousIdProvider()
+
+    response = make_client(id_provider).get("/metrics/db-queries")
+
+    assert response.status_code == status_code
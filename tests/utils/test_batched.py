@@ -0,0 +1,18 @@
+from app.utils.batched import batched
+
+
+def test_batched_splits_on_size_boundaries() -> None:
+    assert list(batched(range(5), 2)) == [(0, 1), (2, 3), (4,)]
+    assert list(batched(range(4), 2)) == [(0, 1), (2, 3)]
+
+
+def test_batched_empty_input() -> None:
+    assert list(batched([], 2)) == []
+
+
+def test_batched_consumes_iterators_lazily() -> None:
+    chunks = batched(iter(range(3)), 2)
+
+    assert next(chunks) == (0, 1)
+    assert next(chunks) == (2,)
+    assert next(chunks, None) is None